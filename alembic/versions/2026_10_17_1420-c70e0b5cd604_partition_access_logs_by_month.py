@@ -0,0 +1,88 @@
+"""Partition access_logs by month
+
+MySQL requires the partitioning column to be part of every unique key and
+does not support foreign keys on partitioned tables, so the primary key
+becomes (id, timestamp) and the user/room foreign keys are dropped. Further
+partitions are managed by `python -m src.services.access_log_partitions`.
+
+Revision ID: c70e0b5cd604
+Revises: ba93fc1312ad
+Create Date: 2026-10-17 14:20:31.556102
+
+"""
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c70e0b5cd604"
+down_revision: Union[str, Sequence[str], None] = "ba93fc1312ad"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREMAKE_MONTHS = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # MySQL does not support foreign keys on partitioned tables; user_id and
+    # room_id are validated by the access log CRUD functions instead.
+    op.drop_constraint(
+        op.f("fk_access_logs_room_id_rooms"), "access_logs", type_="foreignkey"
+    )
+    op.drop_constraint(
+        op.f("fk_access_logs_user_id_users"), "access_logs", type_="foreignkey"
+    )
+    op.execute(
+        "ALTER TABLE access_logs DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)"
+    )
+
+    oldest = op.get_bind().execute(
+        sa.text("SELECT MIN(timestamp) FROM access_logs")
+    ).scalar()
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    month = (oldest.date() if oldest else current).replace(day=1)
+    partitions = []
+    while month <= _add_months(current, PREMAKE_MONTHS):
+        upper = _add_months(month, 1)
+        partitions.append(
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{upper.isoformat()}')"
+        )
+        month = upper
+    partitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+
+    op.execute(
+        "ALTER TABLE access_logs PARTITION BY RANGE COLUMNS(timestamp) "
+        f"({', '.join(partitions)})"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE access_logs REMOVE PARTITIONING")
+    op.execute(
+        "ALTER TABLE access_logs DROP PRIMARY KEY, ADD PRIMARY KEY (id)"
+    )
+    op.create_foreign_key(
+        op.f("fk_access_logs_user_id_users"),
+        "access_logs",
+        "users",
+        ["user_id"],
+        ["id"],
+    )
+    op.create_foreign_key(
+        op.f("fk_access_logs_room_id_rooms"),
+        "access_logs",
+        "rooms",
+        ["room_id"],
+        ["id"],
+    )
@@ -0,0 +1,39 @@
+"""Add unique constraint for current_presence.user_id
+
+Revision ID: 3ecc7474620a
+Revises: c70e0b5cd604
+Create Date: 2026-10-17 16:10:05.731944
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3ecc7474620a"
+down_revision: Union[str, Sequence[str], None] = "c70e0b5cd604"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the latest presence record of every user.
+    op.execute(
+        "DELETE older FROM current_presence AS older "
+        "JOIN current_presence AS newer "
+        "ON newer.user_id = older.user_id AND newer.id > older.id"
+    )
+    op.create_unique_constraint(
+        op.f("uq_current_presence_user_id"), "current_presence", ["user_id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        op.f("uq_current_presence_user_id"), "current_presence", type_="unique"
+    )
@@ -9,6 +9,11 @@ from .current_presence import router as current_presence_router
 from .building import router as buildings_router
 from .access_rule import router as access_rule_router
 from .access_log import router as access_log_router
+from .access import router as access_router
+from .occupancy import router as occupancy_router
+from .events import router as events_router
+from .metrics import router as metrics_router
+from .fast_json import install_fast_json
 
 api_router = APIRouter(prefix=settings.api.prefix)
 
@@ -20,3 +25,10 @@ api_router.include_router(current_presence_router)
 api_router.include_router(buildings_router)
 api_router.include_router(access_rule_router)
 api_router.include_router(access_log_router)
+api_router.include_router(access_router)
+api_router.include_router(occupancy_router)
+api_router.include_router(events_router)
+api_router.include_router(metrics_router)
+
+if settings.api.fast_json:
+    install_fast_json(api_router)
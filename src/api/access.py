@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends
+
+from src.auth.service import get_current_active_user
+from src.services.access_decision import access_engine
+import src.schemas.access as schemas
+from .dependencies import DBSession, IDField
+
+router = APIRouter(prefix="/access", tags=["Access Control"], dependencies=[Depends(get_current_active_user)])
+
+@router.get("/check", response_model=schemas.AccessDecision)
+async def check_access(
+    session: DBSession,
+    user_id: IDField,
+    room_id: IDField,
+    timestamp: datetime | None = None,
+):
+    await access_engine.ensure_loaded(session)
+    timestamp = timestamp or datetime.now(timezone.utc)
+    return schemas.AccessDecision(
+        user_id=user_id,
+        room_id=room_id,
+        timestamp=timestamp,
+        access_allowed=access_engine.is_allowed(user_id, room_id, timestamp),
+    )
+
+@router.post("/check/batch", response_model=schemas.AccessDecisionBatch)
+async def check_access_batch(
+    session: DBSession,
+    batch: schemas.AccessCheckBatch,
+):
+    await access_engine.ensure_loaded(session)
+    return schemas.AccessDecisionBatch(decisions=access_engine.check_many(batch.checks))
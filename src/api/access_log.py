@@ -1,23 +1,93 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Sequence
 from annotated_types import Ge
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Row
 
 from src.auth.service import get_current_active_user
+from src.constants import ExportFormat
 from src.crud import access_log as crud
+from src.exceptions.exceptions import AppException, InvalidCursorException
 from src.models import AccessLog
+from src.services.access_log_buffer import access_log_buffer
+from src.services.access_log_export import MEDIA_TYPES, export_access_logs
+from src.services.access_log_import import import_access_logs
+from src.utils.cursor import decode_cursor, encode_cursor
 import src.schemas.access_log as schemas
-from .dependencies import DBSession, get_access_log_by_id
+from .dependencies import DBSession, FieldSet, PageSize, SessionFactory, SparseFields, get_access_log_by_id
+
+# Serializes plain rows of GET /access-log/ without validating them first.
+ACCESS_LOG_ROWS = TypeAdapter(list[schemas.AccessLogRow])
 
 router = APIRouter(prefix="/access-log", tags=["Access Logs"], dependencies=[Depends(get_current_active_user)])
 
-@router.post("/", response_model=schemas.AccessLogOut, status_code=status.HTTP_201_CREATED)
+
+def get_access_log_cursor(cursor: str | None = None) -> crud.AccessLogCursor | None:
+    if cursor is None:
+        return None
+    try:
+        timestamp, access_log_id = decode_cursor(cursor)
+        return datetime.fromisoformat(timestamp), int(access_log_id)
+    except (TypeError, ValueError):
+        raise InvalidCursorException
+
+def set_next_cursor(response: Response, access_logs: Sequence[AccessLog | Row], limit: int) -> None:
+    if len(access_logs) == limit:
+        last = access_logs[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.timestamp.isoformat(), last.id)
+
+def get_access_log_filter(filters: Annotated[schemas.AccessLogFilter, Query()]) -> schemas.AccessLogFilter:
+    return filters
+
+AccessLogAfter = Annotated[crud.AccessLogCursor | None, Depends(get_access_log_cursor)]
+AccessLogFilters = Annotated[schemas.AccessLogFilter, Depends(get_access_log_filter)]
+AccessLogFields = Annotated[FieldSet, Depends(SparseFields(schemas.AccessLogOut))]
+
+
+@router.post("/", response_model=schemas.AccessLogOut | schemas.AccessLogQueued, status_code=status.HTTP_201_CREATED)
 async def create_access_log(
     session: DBSession,
     access_log_in: schemas.AccessLogCreate,
+    response: Response,
 ): 
+    if access_log_buffer.running:
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await access_log_buffer.enqueue(access_log_in)
     return await crud.create_access_log(session, access_log_in)
 
+@router.post("/swipe", response_model=schemas.AccessLogOut, status_code=status.HTTP_201_CREATED)
+async def record_swipe(
+    session: DBSession,
+    access_log_in: schemas.AccessLogCreate,
+):
+    return await crud.record_swipe(session, access_log_in)
+
+@router.post(
+    "/bulk",
+    response_model=schemas.AccessLogImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": schemas.AccessLogImport.model_json_schema()}},
+        }
+    },
+)
+async def import_access_logs_ndjson(
+    session: DBSession,
+    request: Request,
+):
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type != "application/x-ndjson":
+        raise AppException(
+            detail="Expected application/x-ndjson body",
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            log_error=False,
+        )
+    return await import_access_logs(session, request.stream())
+
 @router.put("/{access_log_id}", response_model=schemas.AccessLogOut)
 async def update_access_log(
     session: DBSession,
@@ -53,28 +123,69 @@ async def delete_access_log(
 @router.get("/", response_model=list[schemas.AccessLogOut])
 async def get_access_logs(
     session: DBSession,
+    response: Response,
+    after: AccessLogAfter,
+    fields: AccessLogFields,
     offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100,
+    limit: PageSize = 100,
 ):
-    access_logs = await crud.get_access_logs(session, offset, limit)
-    return list(access_logs)
+    rows = await crud.get_access_log_rows(session, offset, limit, after, fields.names)
+    set_next_cursor(response, rows, limit)
+    if fields.names is not None:
+        return fields.render(response, rows)
+    return Response(
+        ACCESS_LOG_ROWS.dump_json([row._asdict() for row in rows]),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
+
+@router.get("/search", response_model=list[schemas.AccessLogOut])
+async def search_access_logs(
+    session: DBSession,
+    response: Response,
+    after: AccessLogAfter,
+    filters: AccessLogFilters,
+    fields: AccessLogFields,
+    limit: PageSize = 100,
+):
+    access_logs = await crud.search_access_logs(session, filters, limit, after, fields.names)
+    set_next_cursor(response, access_logs, limit)
+    return fields.render(response, list(access_logs))
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_access_logs_stream(
+    session_factory: SessionFactory,
+    filters: AccessLogFilters,
+    format: ExportFormat = ExportFormat.csv,
+):
+    return StreamingResponse(
+        export_access_logs(session_factory, filters, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="access_logs.{format}"'},
+    )
 
 @router.get("/with-user", response_model=list[schemas.AccessLogWithUser])
 async def get_access_logs_with_user(
     session: DBSession,
+    response: Response,
+    after: AccessLogAfter,
     offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100, 
+    limit: PageSize = 100,
 ):
-    access_logs = await crud.get_access_logs_with_user(session, offset, limit)
+    access_logs = await crud.get_access_logs_with_user(session, offset, limit, after)
+    set_next_cursor(response, access_logs, limit)
     return list(access_logs)
 
 @router.get("/with-room", response_model=list[schemas.AccessLogWithRoom])
 async def get_access_logs_with_room(
     session: DBSession,
+    response: Response,
+    after: AccessLogAfter,
     offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100, 
+    limit: PageSize = 100,
 ):
-    access_logs = await crud.get_access_logs_with_room(session, offset, limit)
+    access_logs = await crud.get_access_logs_with_room(session, offset, limit, after)
+    set_next_cursor(response, access_logs, limit)
     return list(access_logs)
 
 @router.get("{access_log_id}", response_model=schemas.AccessLogOut)
@@ -1,16 +1,19 @@
 from typing import Annotated
-from annotated_types import Ge
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Response, status
 
 from src.auth.service import get_current_active_admin_user
 from src.crud import access_rule as crud
 from src.models import AccessRule
 import src.schemas.access_rule as schemas
-from .dependencies import DBSession, get_access_rule_by_id
+from src.schemas.pagination import Page
+from .dependencies import DBSession, get_access_rule_by_id, FieldSet, KeysetPagination, PageParams, SparseFields
 
 router = APIRouter(prefix="/access_rule", tags=["Access Rules"], dependencies=[Depends(get_current_active_admin_user)])
 
+Pagination = Annotated[PageParams, Depends(KeysetPagination(*crud.SORT_KEY))]
+Fields = Annotated[FieldSet, Depends(SparseFields(schemas.AccessRuleOut))]
+
 @router.post("/", response_model=schemas.AccessRuleOut, status_code=status.HTTP_201_CREATED)
 async def create_access_rule(
     session: DBSession,
@@ -53,28 +56,42 @@ async def delete_access_rule(
 @router.get("/", response_model=list[schemas.AccessRuleOut])
 async def get_access_rules(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
-): 
-    access_rules = await crud.get_access_rules(session, offset, limit)
-    return list(access_rules)
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    access_rules = await crud.get_access_rules(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    pagination.set_next_cursor(response, access_rules)
+    return fields.render(response, list(access_rules))
+
+@router.get("/page", response_model=Page[schemas.AccessRuleOut])
+async def get_access_rules_page(
+    session: DBSession,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    access_rules = await crud.get_access_rules(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    return fields.render(response, pagination.page(access_rules))
 
 @router.get("/with-room", response_model=list[schemas.AccessRuleWithRoom])
 async def get_access_rules_with_room(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
-): 
-    access_rules = await crud.get_access_rules_with_room(session, offset, limit)
+    response: Response,
+    pagination: Pagination,
+):
+    access_rules = await crud.get_access_rules_with_room(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, access_rules)
     return list(access_rules)
 
 @router.get("/with-role", response_model=list[schemas.AccessRuleWithRole])
 async def get_access_rules_with_role(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
-): 
-    access_rules = await crud.get_access_rules_with_role(session, offset, limit)
+    response: Response,
+    pagination: Pagination,
+):
+    access_rules = await crud.get_access_rules_with_role(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, access_rules)
     return list(access_rules)
 
 @router.get("/{access_rule_id}", response_model=schemas.AccessRuleOut)
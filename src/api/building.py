@@ -1,16 +1,19 @@
 from typing import Annotated
-from annotated_types import Ge
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Response, status
 
 from src.auth.service import get_current_active_admin_user
 from src.crud import building as crud
 from src.models import Building
 import src.schemas.building as schemas  
-from .dependencies import DBSession, get_building_by_id
+from src.schemas.pagination import Page
+from .dependencies import DBSession, get_building_by_id, FieldSet, KeysetPagination, PageParams, SparseFields
 
 router = APIRouter(prefix="/buildings", tags=["Buildings"], dependencies=[Depends(get_current_active_admin_user)])
 
+Pagination = Annotated[PageParams, Depends(KeysetPagination(*crud.SORT_KEY))]
+Fields = Annotated[FieldSet, Depends(SparseFields(schemas.BuildingOut))]
+
 @router.post("/", response_model=schemas.BuildingOut)
 async def create_building(
     session: DBSession,
@@ -53,19 +56,32 @@ async def delete_building(
 @router.get("/", response_model=list[schemas.BuildingOut])
 async def get_buildings(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
 ):
-    buildings = await crud.get_buildings(session, offset, limit)
-    return list(buildings)
+    buildings = await crud.get_buildings(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    pagination.set_next_cursor(response, buildings)
+    return fields.render(response, list(buildings))
+
+@router.get("/page", response_model=Page[schemas.BuildingOut])
+async def get_buildings_page(
+    session: DBSession,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    buildings = await crud.get_buildings(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    return fields.render(response, pagination.page(buildings))
 
 @router.get("/with-floors", response_model=list[schemas.BuildingWithFloors])
 async def get_building_with_floors(
     sessison: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100,
+    response: Response,
+    pagination: Pagination,
 ):
-    buildings = await crud.get_buildings_with_floors(sessison, offset, limit)
+    buildings = await crud.get_buildings_with_floors(sessison, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, buildings)
     return list(buildings)
 
 @router.get("/{building_id}", response_model=schemas.BuildingOut)
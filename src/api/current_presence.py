@@ -1,16 +1,19 @@
 from typing import Annotated
-from annotated_types import Ge
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Response, status
 
 from src.auth.service import get_current_active_user
 from src.crud import current_presence as crud
 from src.models import CurrentPresence
 import src.schemas.current_presence as schemas  
-from .dependencies import DBSession, get_current_presence_by_id
+from src.schemas.pagination import Page
+from .dependencies import DBSession, get_current_presence_by_id, FieldSet, KeysetPagination, PageParams, SparseFields
 
 router = APIRouter(prefix="/current_presence", tags=["Current Presence"], dependencies=[Depends(get_current_active_user)])
 
+Pagination = Annotated[PageParams, Depends(KeysetPagination(*crud.SORT_KEY))]
+Fields = Annotated[FieldSet, Depends(SparseFields(schemas.CurrentPresenceOut))]
+
 router.post("/", response_model=schemas.CurrentPresenceOut, status_code=status.HTTP_201_CREATED)
 async def create_current_presence(
         session: DBSession,
@@ -53,28 +56,42 @@ async def delete_current_presence(
 @router.get("/", response_model=list[schemas.CurrentPresenceOut])
 async def get_current_presence_all(
     session: DBSession,
-    offset: Annotated[int, Ge(0)],
-    limit: Annotated[int, Ge(1)],
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
 ):
-    result = await crud.get_current_presences(session, offset, limit)
-    return list(result)
+    result = await crud.get_current_presences(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    pagination.set_next_cursor(response, result)
+    return fields.render(response, list(result))
+
+@router.get("/page", response_model=Page[schemas.CurrentPresenceOut])
+async def get_current_presence_all_page(
+    session: DBSession,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    result = await crud.get_current_presences(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    return fields.render(response, pagination.page(result))
 
 @router.get("/with-room", response_model=list[schemas.CurrentPresenceWithRoom])
 async def get_current_presence_all_with_room(
     session: DBSession,
-    offset: Annotated[int, Ge(0)],
-    limit: Annotated[int, Ge(1)],
+    response: Response,
+    pagination: Pagination,
 ):
-    result = await crud.get_current_presences_with_room(session, offset, limit)
+    result = await crud.get_current_presences_with_room(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, result)
     return list(result)
 
 @router.get("/with-user", response_model=list[schemas.CurrentPresenceWithUser])
 async def get_current_presence_all_with_user(
     session: DBSession,
-    offset: Annotated[int, Ge(0)],
-    limit: Annotated[int, Ge(1)],
+    response: Response,
+    pagination: Pagination,
 ):
-    result = await crud.get_current_presences_with_user(session, offset, limit)
+    result = await crud.get_current_presences_with_user(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, result)
     return list(result)
 
 @router.get("/{current_presence_id}", response_model=schemas.CurrentPresenceOut)
@@ -1,16 +1,146 @@
-from typing import Annotated
+from typing import Annotated, Any, Sequence
 
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Response
+from pydantic import AfterValidator, BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from annotated_types import Ge
 
-from src.database.core import get_db
+from src.core.config import settings
+from src.database.core import get_db, get_session_factory
 import src.crud as crud
+from src.crud.pagination import Cursor, next_cursor
 import src.models as models
-from src.exceptions.exceptions import NotFoundException
+from src.exceptions.exceptions import InvalidCursorException, InvalidFieldsException, NotFoundException
+from src.schemas.fields import adapter, narrow
+from src.schemas.pagination import Page
+from src.utils.cursor import decode_cursor, encode_cursor
+
+def _cap_page_size(limit: int) -> int:
+    return min(limit, settings.pagination.max_page_size)
 
 IDField = Annotated[int, Ge(1)]
+PageSize = Annotated[int, Ge(1), AfterValidator(_cap_page_size)]
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+SessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
+
+
+class PageParams:
+    """Pagination of one list request, see `KeysetPagination`."""
+
+    def __init__(self, keys: Sequence[ColumnElement[Any]], offset: int, limit: int, after: Cursor | None):
+        self.keys = keys
+        self.offset = offset
+        self.limit = limit
+        self.after = after
+
+    def next_cursor(self, items: Sequence[Any]) -> str | None:
+        cursor = next_cursor(items, self.keys, self.limit)
+        return encode_cursor(*cursor) if cursor is not None else None
+
+    def page(self, items: Sequence[Any]) -> Page[Any]:
+        return Page(items=list(items), next_cursor=self.next_cursor(items))
+
+    def set_next_cursor(self, response: Response, items: Sequence[Any]) -> None:
+        if cursor := self.next_cursor(items):
+            response.headers["X-Next-Cursor"] = cursor
+
+
+class KeysetPagination:
+    """
+    Dependency reading the `offset`, `limit` and `cursor` query parameters of
+    a list route whose rows are sorted by `keys`.
+
+    `cursor` is the opaque `next_cursor` of the previous page; when given the
+    query seeks past it and `offset` is ignored. `limit` is capped at the
+    configured max page size.
+    """
+
+    def __init__(self, *keys: ColumnElement[Any]):
+        self.keys = keys
+        self._cursor = TypeAdapter(tuple[tuple(key.type.python_type for key in keys)])  # type: ignore
+
+    def __call__(
+            self,
+            offset: Annotated[int, Ge(0)] = 0,
+            limit: PageSize = settings.pagination.default_page_size,
+            cursor: str | None = None,
+    ) -> PageParams:
+        after = None
+        if cursor is not None:
+            try:
+                after = self._cursor.validate_python(decode_cursor(cursor))
+            except (ValidationError, ValueError):
+                raise InvalidCursorException
+        return PageParams(self.keys, offset, limit, after)
+
+
+class CursorPagination(KeysetPagination):
+    """
+    `KeysetPagination` without `offset`, for routes whose queries only seek
+    past a cursor (e.g. the `access_logs_next` links of embedded collections).
+    """
+
+    def __call__(  # type: ignore[override]
+            self,
+            limit: PageSize = settings.pagination.default_page_size,
+            cursor: str | None = None,
+    ) -> PageParams:
+        return super().__call__(0, limit, cursor)
+
+
+AccessLogPagination = Annotated[PageParams, Depends(CursorPagination(*crud.access_log.SORT_KEY))]
+
+
+class FieldSet:
+    """Fields of a list response selected with `fields=`, see `SparseFields`."""
+
+    def __init__(self, model: type[BaseModel], names: frozenset[str] | None):
+        self.model = model
+        self.names = names
+
+    def render(self, response: Response, content: Sequence[Any] | Page[Any]) -> Any:
+        """
+        Serialize a list or page of rows with only the selected fields.
+
+        Without a selection the content is returned unchanged and goes through
+        the route's response model as usual. Otherwise it is validated into a
+        model narrowed to the selected fields and returned as a JSON response
+        carrying the headers already set on `response`.
+        """
+        if self.names is None:
+            return content
+        model = narrow(self.model, self.names)
+        if isinstance(content, Page):
+            type_adapter = adapter(Page[model])  # type: ignore[valid-type]
+            value: Any = {"items": content.items, "next_cursor": content.next_cursor}
+        else:
+            type_adapter = adapter(list[model])  # type: ignore[valid-type]
+            value = list(content)
+        body = type_adapter.dump_json(type_adapter.validate_python(value, from_attributes=True))
+        return Response(body, media_type="application/json", headers=dict(response.headers))
+
+
+class SparseFields:
+    """
+    Dependency reading the `fields` query parameter of a list route returning `model`.
+
+    `fields` is a comma separated list of field names of `model`; the CRUD
+    layer loads only those columns and the response only contains them.
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+
+    def __call__(self, fields: str | None = None) -> FieldSet:
+        if fields is None:
+            return FieldSet(self.model, None)
+        names = frozenset(name.strip() for name in fields.split(",") if name.strip())
+        unknown = names - self.model.model_fields.keys()
+        if unknown or not names:
+            raise InvalidFieldsException(sorted(unknown))
+        return FieldSet(self.model, names)
+
 
 async def get_user_by_id(
         sesison: DBSession,
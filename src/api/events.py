@@ -0,0 +1,88 @@
+import asyncio
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, WebSocketException, status
+from fastapi.responses import StreamingResponse
+
+from src.auth.exceptions import AuthError
+from src.auth.service import get_active_user_by_token, get_current_active_user
+from src.core.config import settings
+from src.services.events import Subscription, event_hub
+from src.services.occupancy import occupancy
+import src.schemas.events as schemas
+from .dependencies import DBSession, SessionFactory
+
+# Authentication is declared per route: the bearer scheme used by the other
+# routers cannot read a WebSocket handshake, which sends the token as a query parameter.
+router = APIRouter(prefix="/events", tags=["Events"])
+
+
+def get_event_filter(filters: Annotated[schemas.EventFilter, Query()]) -> schemas.EventFilter:
+    return filters
+
+EventFilters = Annotated[schemas.EventFilter, Depends(get_event_filter)]
+
+
+async def sse_events(filters: schemas.EventFilter, heartbeat: float) -> AsyncIterator[str]:
+    with event_hub.subscribe(filters) as subscription:
+        while True:
+            try:
+                event = await subscription.get(timeout=heartbeat)
+            except TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                return
+            yield f"event: {event.type}\ndata: {event.model_dump_json()}\n\n"
+
+async def send_events(websocket: WebSocket, subscription: Subscription) -> None:
+    async for event in subscription:
+        await websocket.send_text(event.model_dump_json())
+
+async def wait_for_disconnect(websocket: WebSocket) -> None:
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+@router.get(
+    "/stream",
+    dependencies=[Depends(get_current_active_user)],
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}},
+)
+async def stream_events(session: DBSession, filters: EventFilters):
+    await occupancy.ensure_loaded(session)
+    return StreamingResponse(
+        sse_events(filters, settings.events.heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.websocket("/ws")
+async def events_websocket(
+    websocket: WebSocket,
+    session_factory: SessionFactory,
+    filters: EventFilters,
+    token: Annotated[str, Query()],
+):
+    async with session_factory() as session:
+        try:
+            await get_active_user_by_token(session, token)
+        except AuthError:
+            raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+        await occupancy.ensure_loaded(session)
+
+    await websocket.accept()
+    with event_hub.subscribe(filters) as subscription:
+        sender = asyncio.create_task(send_events(websocket, subscription))
+        receiver = asyncio.create_task(wait_for_disconnect(websocket))
+        done, pending = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    if sender in done and sender.exception() is None:
+        # The hub closed the subscription: the client fell behind or the server is shutting down.
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
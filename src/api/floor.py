@@ -1,16 +1,19 @@
 from typing import Annotated
-from annotated_types import Ge
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Response, status
 
 from src.auth.service import get_current_active_admin_user
 from src.crud import floor as crud
 from src.models import Floor
 import src.schemas.floor as schemas 
-from .dependencies import DBSession, get_floor_by_id
+from src.schemas.pagination import Page
+from .dependencies import DBSession, get_floor_by_id, FieldSet, KeysetPagination, PageParams, SparseFields
 
 router = APIRouter(prefix="/floors", tags=["Floors"], dependencies=[Depends(get_current_active_admin_user)])
 
+Pagination = Annotated[PageParams, Depends(KeysetPagination(*crud.SORT_KEY))]
+Fields = Annotated[FieldSet, Depends(SparseFields(schemas.FloorOut))]
+
 @router.post("/", response_model=schemas.FloorOut, status_code=status.HTTP_201_CREATED)
 async def create_floor(
     session: DBSession,
@@ -44,28 +47,42 @@ async def delete_floor(
 @router.get("/", response_model=list[schemas.FloorOut])
 async def get_floors(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
 ):
-    floors = await crud.get_floors(session, offset, limit)
-    return list(floors)
+    floors = await crud.get_floors(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    pagination.set_next_cursor(response, floors)
+    return fields.render(response, list(floors))
+
+@router.get("/page", response_model=Page[schemas.FloorOut])
+async def get_floors_page(
+    session: DBSession,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    floors = await crud.get_floors(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    return fields.render(response, pagination.page(floors))
 
 @router.get("/with-building", response_model=list[schemas.FloorWithBuilding])
 async def get_floors_with_buildings(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100,
+    response: Response,
+    pagination: Pagination,
 ):
-    floors = await crud.get_floors_with_building(session, offset, limit)
+    floors = await crud.get_floors_with_building(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, floors)
     return list(floors)
 
 @router.get("/with-rooms", response_model=list[schemas.FloorWithRooms])
 async def get_floors_with_rooms(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100,
+    response: Response,
+    pagination: Pagination,
 ):
-    floors = await crud.get_floors_with_rooms(session, offset, limit)
+    floors = await crud.get_floors_with_rooms(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, floors)
     return list(floors)
 
 @router.get("/{floor_id}", response_model=schemas.FloorOut)
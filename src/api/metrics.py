@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+
+from src.auth.hasher import password_hasher
+from src.auth.principals import principals
+from src.auth.rate_limit import login_rate_limiter
+from src.auth.service import get_current_active_admin_user
+from src.auth.utils import verified_passwords, verified_tokens
+from src.services.access_log_buffer import access_log_buffer
+from src.services.events import event_hub
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"], dependencies=[Depends(get_current_active_admin_user)])
+
+@router.get("/", response_model=dict[str, dict[str, int]])
+async def get_metrics():
+    return {
+        "verified_tokens": verified_tokens.stats(),
+        "principals": principals.stats(),
+        "verified_passwords": verified_passwords.stats(),
+        "password_hasher": password_hasher.stats(),
+        "login_rate_limiter": login_rate_limiter.stats(),
+        "access_log_buffer": {"pending": access_log_buffer.pending},
+        "event_hub": {"subscribers": event_hub.subscribers, "dropped": event_hub.dropped},
+    }
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+
+from src.auth.service import get_current_active_user
+from src.services.occupancy import occupancy
+import src.schemas.occupancy as schemas
+from .dependencies import DBSession, IDField
+
+router = APIRouter(prefix="/occupancy", tags=["Occupancy"], dependencies=[Depends(get_current_active_user)])
+
+@router.get("/", response_model=schemas.OccupancyOut)
+async def get_occupancy(session: DBSession):
+    await occupancy.ensure_loaded(session)
+    return occupancy.snapshot()
+
+@router.get("/room/{room_id}", response_model=schemas.OccupancyCount)
+async def get_room_occupancy(session: DBSession, room_id: IDField):
+    await occupancy.ensure_loaded(session)
+    return schemas.OccupancyCount(id=room_id, count=occupancy.room(room_id))
+
+@router.get("/floor/{floor_id}", response_model=schemas.OccupancyCount)
+async def get_floor_occupancy(session: DBSession, floor_id: IDField):
+    await occupancy.ensure_loaded(session)
+    return schemas.OccupancyCount(id=floor_id, count=occupancy.floor(floor_id))
+
+@router.get("/building/{building_id}", response_model=schemas.OccupancyCount)
+async def get_building_occupancy(session: DBSession, building_id: IDField):
+    await occupancy.ensure_loaded(session)
+    return schemas.OccupancyCount(id=building_id, count=occupancy.building(building_id))
@@ -1,16 +1,19 @@
 from typing import Annotated
-from annotated_types import Ge
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Response, status
 
 from src.auth.service import get_current_active_admin_user
 from src.crud import role as role_crud
 from src.models import Role
 import src.schemas.role as schemas
-from .dependencies import DBSession, get_role_by_id
+from src.schemas.pagination import Page
+from .dependencies import DBSession, get_role_by_id, FieldSet, KeysetPagination, PageParams, SparseFields
 
 router = APIRouter(prefix="/roles", tags=["Roles"], dependencies=[Depends(get_current_active_admin_user)])
 
+Pagination = Annotated[PageParams, Depends(KeysetPagination(*role_crud.SORT_KEY))]
+Fields = Annotated[FieldSet, Depends(SparseFields(schemas.RoleOut))]
+
 @router.post("/", response_model=schemas.RoleOut, status_code=status.HTTP_201_CREATED)
 async def create_role(
     session: DBSession,
@@ -44,31 +47,42 @@ async def delete_role(
 @router.get("/", response_model=list[schemas.RoleOut])
 async def get_roles(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    roles = await role_crud.get_roles(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    pagination.set_next_cursor(response, roles)
+    return fields.render(response, list(roles))
 
+@router.get("/page", response_model=Page[schemas.RoleOut])
+async def get_roles_page(
+    session: DBSession,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
 ):
-    roles = await role_crud.get_roles(session, offset, limit)
-    return list(roles)
+    roles = await role_crud.get_roles(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    return fields.render(response, pagination.page(roles))
 
 @router.get("/with-access-rules", response_model=list[schemas.RoleWithAccessRules])
 async def get_roles_with_access_rules(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
-
+    response: Response,
+    pagination: Pagination,
 ):
-    roles = await role_crud.get_roles_with_access_rules(session, offset, limit)
+    roles = await role_crud.get_roles_with_access_rules(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, roles)
     return list(roles)
 
 @router.get("/with-users", response_model=list[schemas.RoleWithUsers])
 async def get_roles_with_users(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
-
+    response: Response,
+    pagination: Pagination,
 ):
-    roles = await role_crud.get_roles_with_users(session, offset, limit)
+    roles = await role_crud.get_roles_with_users(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, roles)
     return list(roles)
 
 
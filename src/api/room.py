@@ -1,16 +1,21 @@
 from typing import Annotated
-from annotated_types import Ge
 
-from fastapi import Depends, APIRouter, status
+from fastapi import Depends, APIRouter, Response, status
 
 from src.auth.service import get_current_active_admin_user
-from src.crud import room as room_crud
+from src.core.config import settings
+from src.crud import access_log as access_log_crud, room as room_crud
 from src.models import Room
 import src.schemas.room as schemas
-from .dependencies import DBSession, IDField, get_room_by_id
+from src.schemas.access_log import AccessLogFilter, AccessLogOut
+from src.schemas.pagination import Page
+from .dependencies import AccessLogPagination, DBSession, IDField, get_room_by_id, FieldSet, KeysetPagination, PageParams, SparseFields
 
 router = APIRouter(prefix="/rooms", tags=["Rooms"], dependencies=[Depends(get_current_active_admin_user)])
 
+Pagination = Annotated[PageParams, Depends(KeysetPagination(*room_crud.SORT_KEY))]
+Fields = Annotated[FieldSet, Depends(SparseFields(schemas.RoomOut))]
+
 @router.post("/", response_model=schemas.RoomOut, status_code=status.HTTP_201_CREATED)
 async def create_room_(
     session: DBSession, 
@@ -44,47 +49,78 @@ async def delete_room(
 @router.get("/with-floor", response_model=list[schemas.RoomWithFloor])
 async def get_rooms_with_floors(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
 ):
-    rooms = await room_crud.get_rooms_with_floor(session, offset, limit)
+    rooms = await room_crud.get_rooms_with_floor(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, rooms)
     return list(rooms)
 
 @router.get("/with-access-rules", response_model=list[schemas.RoomWithAccessRules])
 async def get_rooms_with_access_rules(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
 ):
-    rooms = await room_crud.get_rooms_with_access_rules(session, offset, limit)
+    rooms = await room_crud.get_rooms_with_access_rules(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, rooms)
     return list(rooms)
 
 @router.get("/with-access-logs", response_model=list[schemas.RoomWithAccessLogs])
 async def get_rooms_with_access_logs(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
 ):
-    rooms = await room_crud.get_rooms_with_access_logs(session, offset, limit)
-    return list(rooms)
+    access_logs_limit = settings.pagination.nested_page_size
+    rooms = await room_crud.get_rooms_with_access_logs(
+        session, pagination.offset, pagination.limit, pagination.after, access_logs_limit,
+    )
+    pagination.set_next_cursor(response, rooms)
+    context = {"access_logs_limit": access_logs_limit}
+    return [schemas.RoomWithAccessLogs.model_validate(room, from_attributes=True, context=context) for room in rooms]
 
 @router.get("/with-current-presence", response_model=list[schemas.RoomWithCurrentPresence])
 async def get_rooms_with_current_presence(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
 ):
-    rooms = await room_crud.get_rooms_with_current_presence(session, offset, limit)
+    rooms = await room_crud.get_rooms_with_current_presence(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, rooms)
     return list(rooms)
 
 @router.get("/", response_model=list[schemas.RoomOut])
 async def get_rooms(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
 ): 
-    rooms = await room_crud.get_rooms(session, offset, limit)
-    return list(rooms)
+    rooms = await room_crud.get_rooms(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    pagination.set_next_cursor(response, rooms)
+    return fields.render(response, list(rooms))
+
+@router.get("/page", response_model=Page[schemas.RoomOut])
+async def get_rooms_page(
+    session: DBSession,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    rooms = await room_crud.get_rooms(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    return fields.render(response, pagination.page(rooms))
+
+@router.get("/{room_id}/access-logs", response_model=Page[AccessLogOut])
+async def get_room_access_logs(
+    session: DBSession,
+    pagination: AccessLogPagination,
+    room: Room = Depends(get_room_by_id),
+):
+    access_logs = await access_log_crud.search_access_logs(
+        session, AccessLogFilter(room_id=room.id), pagination.limit, pagination.after,
+    )
+    return pagination.page(access_logs)
 
 @router.get("/{room_id}", response_model=schemas.RoomOut)
 async def get_room(
@@ -1,16 +1,21 @@
 from typing import Annotated
-from annotated_types import Ge
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
-from src.crud import user as user_crud
+from src.core.config import settings
+from src.crud import access_log as access_log_crud, user as user_crud
 from src.exceptions.exceptions import NotFoundException
 from src.models import User
 import src.schemas.user as schemas
-from .dependencies import DBSession, get_user_by_id, IDField
+from src.schemas.access_log import AccessLogFilter, AccessLogOut
+from src.schemas.pagination import Page
+from .dependencies import AccessLogPagination, DBSession, get_user_by_id, IDField, FieldSet, KeysetPagination, PageParams, SparseFields
 
 router = APIRouter(prefix="/user", tags=["Users"])
 
+Pagination = Annotated[PageParams, Depends(KeysetPagination(*user_crud.SORT_KEY))]
+Fields = Annotated[FieldSet, Depends(SparseFields(schemas.UserOut))]
+
 @router.post("/", response_model=schemas.UserOut, status_code=status.HTTP_201_CREATED)
 async def create_user(    
     user_in: schemas.UserCreate,
@@ -44,11 +49,23 @@ async def delete_user(
 @router.get("/", response_model=list[schemas.UserOut])
 async def get_users(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
 ):
-    users = await user_crud.get_users(session, offset, limit)
-    return list(users)
+    users = await user_crud.get_users(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    pagination.set_next_cursor(response, users)
+    return fields.render(response, list(users))
+
+@router.get("/page", response_model=Page[schemas.UserOut])
+async def get_users_page(
+    session: DBSession,
+    response: Response,
+    pagination: Pagination,
+    fields: Fields,
+):
+    users = await user_crud.get_users(session, pagination.offset, pagination.limit, pagination.after, fields.names)
+    return fields.render(response, pagination.page(users))
 
 @router.get("/user-with-roles/{user_id}", response_model=schemas.UserWithRoles)
 async def get_user_with_roles(
@@ -75,37 +92,58 @@ async def get_user_with_access_logs(
     session: DBSession,
     user_id: IDField
 ):
-    user = await user_crud.get_user_with_accesslogs(session, user_id)
+    access_logs_limit = settings.pagination.nested_page_size
+    user = await user_crud.get_user_with_accesslogs(session, user_id, access_logs_limit)
     if not user:
         raise NotFoundException("User", user_id)
-    return user
+    return schemas.UserWithAccessLogs.model_validate(
+        user, from_attributes=True, context={"access_logs_limit": access_logs_limit},
+    )
 
 @router.get("/users-with-roles", response_model=list[schemas.UserWithRoles])
 async def get_users_with_roles(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
 ):
-    users = await user_crud.get_users_with_roles(session, offset, limit)
+    users = await user_crud.get_users_with_roles(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, users)
     return users
 
 @router.get("/users-with-current-presence", response_model=list[schemas.UserWithCurrentPresence])
 async def get_users_with_current_presence(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
 ):
-    users = await user_crud.get_users_with_current_presence(session, offset, limit)
+    users = await user_crud.get_users_with_current_presence(session, pagination.offset, pagination.limit, pagination.after)
+    pagination.set_next_cursor(response, users)
     return users
 
 @router.get("/users-with-access_logs", response_model=list[schemas.UserWithAccessLogs])
 async def get_users_with_access_logs(
     session: DBSession,
-    offset: Annotated[int, Ge(0)] = 0,
-    limit: Annotated[int, Ge(1)] = 100
+    response: Response,
+    pagination: Pagination,
 ):
-    users = await user_crud.get_users_with_access_logs(session, offset, limit)
-    return users
+    access_logs_limit = settings.pagination.nested_page_size
+    users = await user_crud.get_users_with_access_logs(
+        session, pagination.offset, pagination.limit, pagination.after, access_logs_limit,
+    )
+    pagination.set_next_cursor(response, users)
+    context = {"access_logs_limit": access_logs_limit}
+    return [schemas.UserWithAccessLogs.model_validate(user, from_attributes=True, context=context) for user in users]
+
+@router.get("/{user_id}/access-logs", response_model=Page[AccessLogOut])
+async def get_user_access_logs(
+    session: DBSession,
+    pagination: AccessLogPagination,
+    user: User = Depends(get_user_by_id),
+):
+    access_logs = await access_log_crud.search_access_logs(
+        session, AccessLogFilter(user_id=user.id), pagination.limit, pagination.after,
+    )
+    return pagination.page(access_logs)
 
 @router.get("/{user_id}", response_model=schemas.UserOut)
 async def get_user_using_id(
@@ -7,4 +7,15 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     email: EmailStr
-    type: str
\ No newline at end of file
+    type: str
+    jti: str|None = None
+    exp: int|None = None
+
+class Principal(BaseModel):
+    id: int
+    email: EmailStr
+    is_active: bool
+    is_admin: bool
+
+class Logout(BaseModel):
+    refresh_token: str|None = None
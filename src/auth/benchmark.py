@@ -0,0 +1,68 @@
+"""
+Compare JWT sign/verify throughput of the supported algorithms.
+
+    python -m src.auth.benchmark --iterations 2000
+
+Keys are generated in a temporary directory and tokens go through
+KeyManager, i.e. the same path /auth/token and authenticated requests use.
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from .keygen import ALGORITHMS, generate_private_key, write_key_pair
+from .keys import KeyManager
+
+
+def ops_per_second(func: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - start)
+
+
+def benchmark(algorithms: list[str], iterations: int) -> list[tuple[str, float, float]]:
+    """
+    Measure signing and verification throughput.
+
+    Args:
+        algorithms: JWS algorithms to compare
+        iterations: Number of tokens signed and verified per algorithm
+
+    Returns:
+        list[tuple[str, float, float]]: Algorithm, signs per second and verifications per second
+    """
+    now = datetime.now(timezone.utc)
+    payload = {"sub": "benchmark@example.com", "type": "access", "iat": now, "exp": now + timedelta(hours=1)}
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for algorithm in algorithms:
+            private_path, public_path = Path(directory) / f"{algorithm}.pem", Path(directory) / f"{algorithm}.pub.pem"
+            write_key_pair(generate_private_key(algorithm), private_path, public_path)
+            manager = KeyManager(private_path, public_path, [], algorithm, reload_interval=float("inf"))
+            token = manager.sign(payload)
+            results.append((
+                algorithm,
+                ops_per_second(lambda: manager.sign(payload), iterations),
+                ops_per_second(lambda: manager.verify(token), iterations),
+            ))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JWT sign/verify throughput")
+    parser.add_argument("--algorithm", dest="algorithms", action="append", choices=ALGORITHMS)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'algorithm':<10}{'sign/s':>12}{'verify/s':>12}")
+    for algorithm, signs, verifications in benchmark(args.algorithms or list(ALGORITHMS), args.iterations):
+        print(f"{algorithm:<10}{signs:>12.0f}{verifications:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,30 @@
+from datetime import timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials
 
-from .auth_schemas import Token
-from src.models import User
+from src.core.config import settings
+from .auth_schemas import Logout, Principal, Token
 from src.schemas.user import UserOut
-from src.crud.user import get_user_by_email
+from src.crud.revoked_token import delete_expired_revoked_tokens
+from src.crud.user import get_user, get_user_by_email
 from .utils import (
+    oauth2_scheme,
     refresh_token_scheme,
     check_token_with_type,
     create_token,
     TokenType,
 )
 from .dependencies import DBSession
-from .service import get_current_active_user, authenticate_user
+from .keys import key_manager
+from .rate_limit import client_ip, login_rate_limiter
+from .service import (
+    authenticate_user,
+    check_not_revoked,
+    get_current_active_user,
+    revoke,
+)
 from .exceptions import IncorectLoginData, InvalidCredentialsError
 
 router = APIRouter(prefix="/auth", tags=["Login"])
@@ -29,21 +39,41 @@ router = APIRouter(prefix="/auth", tags=["Login"])
                     "example": {"detail": "Incorrect login data"}
                 }
             }
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {
+            "description": "Too many login attempts for the username or client IP",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Too many login attempts, retry later"}
+                }
+            }
         }
     }
 )
-async def login(form_data: Annotated[OAuth2PasswordRequestForm, Depends()], session: DBSession) -> Token:
+async def login(
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    session: DBSession,
+    request: Request,
+) -> Token:
+    if settings.login_rate_limit.enabled:
+        await login_rate_limiter.check(form_data.username, client_ip(
+            request.client.host if request.client else None,
+            request.headers.get("x-forwarded-for"),
+        ))
     user = await authenticate_user(session=session, email=form_data.username, password=form_data.password)
 
     if not user:
         raise IncorectLoginData
     
-    payload: dict ={
-            "sub": user.email,
-        }
-    
-    access_token = create_token(payload=payload, token_type=TokenType.ACCESS,)
-    refresh_token = create_token( payload=payload, token_type=TokenType.REFRESH,)
+    access_token = create_token(
+        payload={"sub": user.email},
+        token_type=TokenType.ACCESS,
+    )
+    refresh_token = create_token(
+        payload={"sub": user.email},
+        token_type=TokenType.REFRESH,
+        expire_timedelta=timedelta(days=settings.auth.resfresh_token_expire_days),
+    )
 
     return Token( 
         access_token=access_token, 
@@ -77,22 +107,47 @@ async def refresh_token(
     credentials: HTTPAuthorizationCredentials = Depends(refresh_token_scheme),
 ) -> Token:
     if not credentials:
-        raise exceptions.InvalidCredentialsError
+        raise InvalidCredentialsError
     
     token_data = check_token_with_type(token=credentials.credentials, token_type=TokenType.REFRESH)
+    await check_not_revoked(session, token_data)
     user = await get_user_by_email(session, email=token_data.email)
     if not user:
         raise InvalidCredentialsError
     
     access_token = create_token(
-        payload={
-            "sub": user.email,
-        },
+        payload={"sub": user.email},
         token_type=TokenType.ACCESS,
     )
 
     return Token(access_token=access_token)
 
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Invalid or missing token",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid credentials"}
+                }
+            }
+        }
+    }
+)
+async def logout(
+    session: DBSession,
+    token: Annotated[str, Depends(oauth2_scheme)],
+    logout_in: Logout | None = None,
+) -> None:
+    tokens = [check_token_with_type(token=token, token_type=TokenType.ACCESS)]
+    if logout_in and logout_in.refresh_token:
+        tokens.append(check_token_with_type(token=logout_in.refresh_token, token_type=TokenType.REFRESH))
+    for token_data in tokens:
+        await revoke(session, token_data)
+    await delete_expired_revoked_tokens(session)
+
 @router.get(
     "/me", 
     response_model=UserOut,   
@@ -115,5 +170,13 @@ async def refresh_token(
         }
     }
 )
-async def users_me(user: User = Depends(get_current_active_user)):
-    return user
\ No newline at end of file
+async def users_me(session: DBSession, principal: Principal = Depends(get_current_active_user)):
+    user = await get_user(session, principal.id)
+    if not user:
+        raise InvalidCredentialsError
+    return user
+
+@router.get("/jwks", summary="Public keys for verifying issued tokens (JSON Web Key Set)")
+async def jwks(response: Response) -> dict[str, list[dict]]:
+    response.headers["Cache-Control"] = f"public, max-age={settings.auth.key_reload_interval_seconds}"
+    return key_manager.jwks()
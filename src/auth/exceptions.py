@@ -1,3 +1,5 @@
+import math
+
 from fastapi import HTTPException, status
 
 class AuthError(HTTPException):
@@ -31,4 +33,12 @@ class AccessDeniedError(AuthError):
         super().__init__(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied" if user_id is None else f"Access denied for user with id={user_id}"
-        )
\ No newline at end of file
+        )
+
+class TooManyLoginAttemptsError(AuthError):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, retry later",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
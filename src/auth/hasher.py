@@ -0,0 +1,88 @@
+"""
+Bounded thread pool for bcrypt, which would otherwise block the event loop
+for the whole duration of every hash and check.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from src.core.config import settings
+from src.exceptions.exceptions import ServiceUnavailableException
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    Runs password hashing functions on at most `max_workers` threads.
+
+    bcrypt releases the GIL while hashing, so threads run in parallel. Up to
+    `max_queue` calls may wait for a free thread; further calls are rejected
+    with 503 right away instead of piling up behind a login storm.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = settings.password.hash_workers,
+            max_queue: int = settings.password.hash_queue_size,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def queued(self) -> int:
+        return max(0, self.in_flight - self.max_workers)
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """
+        Run a blocking hashing function in the pool.
+
+        Args:
+            func: Function to run, e.g. hash_password or verify_password
+            args: Positional arguments for func
+
+        Returns:
+            T: Result of func
+
+        Raises:
+            ServiceUnavailableException: If max_queue calls are already waiting
+        """
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise ServiceUnavailableException("Too many password checks in progress, retry later")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+
+        future = asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        self.in_flight += 1
+        future.add_done_callback(self._done)
+        # A cancelled request must not hide the call from in_flight while its thread still runs.
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    async def shutdown(self) -> None:
+        """Wait for the running hashes off the event loop, then release the threads."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, True)
+
+    def _done(self, _: asyncio.Future) -> None:
+        self.in_flight -= 1
+        self.completed += 1
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,74 @@
+"""
+Generate a JWT signing key pair.
+
+    python -m src.auth.keygen --algorithm EdDSA
+
+writes `private.pem` and `public.pem` for APP_CONFIG__AUTH__PRIVATE_PATH and
+APP_CONFIG__AUTH__PUBLIC_PATH; set APP_CONFIG__AUTH__ALGORITHM to the same algorithm.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from src.core.config import BASE_DIR
+
+ALGORITHMS = ("RS256", "ES256", "ES384", "ES512", "EdDSA")
+
+
+def generate_private_key(algorithm: str, rsa_key_size: int = 2048) -> Any:
+    """
+    Generate a private key for a JWS algorithm.
+
+    Raises:
+        ValueError: If the algorithm is not supported
+    """
+    match algorithm:
+        case "RS256":
+            return rsa.generate_private_key(public_exponent=65537, key_size=rsa_key_size)
+        case "ES256":
+            return ec.generate_private_key(ec.SECP256R1())
+        case "ES384":
+            return ec.generate_private_key(ec.SECP384R1())
+        case "ES512":
+            return ec.generate_private_key(ec.SECP521R1())
+        case "EdDSA":
+            return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Unsupported algorithm {algorithm}")
+
+
+def write_key_pair(private_key: Any, private_path: Path, public_path: Path) -> None:
+    private_path.parent.mkdir(parents=True, exist_ok=True)
+    public_path.parent.mkdir(parents=True, exist_ok=True)
+    private_path.write_bytes(private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ))
+    private_path.chmod(0o600)
+    public_path.write_bytes(private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a JWT signing key pair")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="EdDSA")
+    parser.add_argument("--out", type=Path, default=BASE_DIR / "certs", help="Directory for the key files")
+    parser.add_argument("--rsa-key-size", type=int, default=2048)
+    parser.add_argument("--force", action="store_true", help="Overwrite existing key files")
+    args = parser.parse_args()
+
+    private_path, public_path = args.out / "private.pem", args.out / "public.pem"
+    if not args.force and (private_path.exists() or public_path.exists()):
+        parser.error(f"Key files already exist in {args.out}, use --force to overwrite them")
+    write_key_pair(generate_private_key(args.algorithm, args.rsa_key_size), private_path, public_path)
+    print(f"Wrote {args.algorithm} key pair to {private_path} and {public_path}")
+
+
+if __name__ == "__main__":
+    main()
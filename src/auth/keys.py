@@ -0,0 +1,193 @@
+"""
+Parsed JWT signing and verification keys with rotation support.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed448, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+from jwt.algorithms import get_default_algorithms
+
+from src.core.config import settings
+
+logger = logging.getLogger("MainApp")
+
+# Members that identify a key in a JWK thumbprint (RFC 7638), per key type.
+THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+# JWS algorithm implied by the curve of an EC key.
+EC_CURVE_ALGORITHMS = {
+    "secp256r1": "ES256",
+    "secp384r1": "ES384",
+    "secp521r1": "ES512",
+}
+
+
+def key_algorithm(key: Any, preferred: str) -> str:
+    """
+    Get the JWS algorithm for a parsed key.
+
+    RSA keys use `preferred` if it is an RSA algorithm and RS256 otherwise;
+    EC and EdDSA keys have exactly one matching algorithm.
+
+    Raises:
+        ValueError: If the key type cannot sign JWTs
+    """
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return preferred if preferred.startswith(("RS", "PS")) else "RS256"
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)):
+        if key.curve.name not in EC_CURVE_ALGORITHMS:
+            raise ValueError(f"Unsupported EC curve {key.curve.name}")
+        return EC_CURVE_ALGORITHMS[key.curve.name]
+    if isinstance(key, (
+        ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey, ed448.Ed448PrivateKey, ed448.Ed448PublicKey
+    )):
+        return "EdDSA"
+    raise ValueError(f"Unsupported key type {type(key).__name__}")
+
+
+def jwk_thumbprint(jwk: dict[str, Any]) -> str:
+    members = {name: jwk[name] for name in THUMBPRINT_MEMBERS[jwk["kty"]]}
+    digest = hashlib.sha256(json.dumps(members, separators=(",", ":"), sort_keys=True).encode()).digest()
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+class KeyManager:
+    """
+    Holds the parsed private key used for signing and every public key accepted for verification.
+
+    Keys are parsed once instead of on every sign/verify. Tokens are signed
+    with a `kid` header, the JWK thumbprint of the signing key, and verified
+    with the public key of that `kid`; tokens without `kid` are checked
+    against the current key. Public keys listed in `extra_public_paths` stay
+    valid for verification, so tokens signed with a retired key keep working
+    until they expire. Each key is verified with the algorithm of its own key
+    type, which also allows switching e.g. from RS256 to EdDSA this way.
+
+    Key files are re-read when their modification time changes (checked at
+    most every `reload_interval` seconds) or when `reload` is called, e.g.
+    from a SIGHUP handler. A failed reload keeps the previous keys.
+    """
+
+    def __init__(
+            self,
+            private_path: Path = settings.auth.private_path,
+            public_path: Path = settings.auth.public_path,
+            extra_public_paths: list[Path] = settings.auth.extra_public_paths,
+            algorithm: str = settings.auth.algorithm,
+            reload_interval: float = settings.auth.key_reload_interval_seconds,
+    ):
+        self.private_path = private_path
+        self.public_path = public_path
+        self.extra_public_paths = extra_public_paths
+        self.algorithm = algorithm
+        self.reload_interval = reload_interval
+        self._kid: str | None = None
+        self._private_key: Any = None
+        self._public_keys: dict[str, tuple[Any, str]] = {}
+        self._jwks: dict[str, list[dict[str, Any]]] = {"keys": []}
+        self._mtimes: dict[Path, float] = {}
+        self._checked_at = 0.0
+
+    @property
+    def kid(self) -> str:
+        self._ensure_fresh()
+        assert self._kid is not None
+        return self._kid
+
+    def load(self) -> None:
+        """
+        Read and parse all key files.
+
+        Raises:
+            OSError: If a key file cannot be read
+            ValueError: If a key file does not hold a valid PEM key
+        """
+        paths = [self.private_path, self.public_path, *self.extra_public_paths]
+        mtimes = {path: path.stat().st_mtime for path in paths}
+        private_key = load_pem_private_key(self.private_path.read_bytes(), password=None)
+        if key_algorithm(private_key, self.algorithm) != self.algorithm:
+            raise ValueError(f"{self.private_path} is not a {self.algorithm} key")
+
+        algorithms = get_default_algorithms()
+        public_keys: dict[str, tuple[Any, str]] = {}
+        jwks = []
+        for path in [self.public_path, *self.extra_public_paths]:
+            public_key = load_pem_public_key(path.read_bytes())
+            algorithm = key_algorithm(public_key, self.algorithm)
+            jwk = algorithms[algorithm].to_jwk(public_key, as_dict=True)
+            kid = jwk_thumbprint(jwk)
+            public_keys[kid] = public_key, algorithm
+            jwks.append({**jwk, "kid": kid, "use": "sig", "alg": algorithm})
+
+        kid = jwk_thumbprint(algorithms[self.algorithm].to_jwk(private_key.public_key(), as_dict=True))
+        if kid not in public_keys:
+            raise ValueError(f"{self.public_path} does not match the private key {self.private_path}")
+        self._kid = kid
+        self._private_key = private_key
+        self._public_keys = public_keys
+        self._jwks = {"keys": jwks}
+        self._mtimes = mtimes
+        self._checked_at = time.monotonic()
+
+    def reload(self) -> bool:
+        """Reload the keys, keeping the current ones if the files are invalid."""
+        try:
+            self.load()
+        except (OSError, ValueError) as e:
+            logger.error("Failed to reload JWT keys, keeping the current ones", exc_info=e)
+            return False
+        logger.info("Loaded JWT keys, signing with kid=%s", self._kid)
+        return True
+
+    def sign(self, payload: dict[str, Any]) -> str:
+        self._ensure_fresh()
+        return jwt.encode(payload, self._private_key, algorithm=self.algorithm, headers={"kid": self._kid})
+
+    def verify(self, token: str | bytes) -> dict[str, Any]:
+        """
+        Verify a token's signature and claims.
+
+        Raises:
+            jwt.InvalidTokenError: If the token is invalid, expired or signed with an unknown key
+        """
+        self._ensure_fresh()
+        kid = jwt.get_unverified_header(token).get("kid", self._kid)
+        entry = self._public_keys.get(kid) if isinstance(kid, str) else None
+        if entry is None:
+            raise jwt.InvalidTokenError(f"Unknown key id {kid!r}")
+        public_key, algorithm = entry
+        return jwt.decode(token, public_key, algorithms=[algorithm])
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Public verification keys as a JSON Web Key Set."""
+        self._ensure_fresh()
+        return self._jwks
+
+    def _ensure_fresh(self) -> None:
+        if self._private_key is None:
+            self.load()
+            return
+        if time.monotonic() - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = time.monotonic()
+        try:
+            changed = any(path.stat().st_mtime != mtime for path, mtime in self._mtimes.items())
+        except OSError:
+            changed = True
+        if changed:
+            self.reload()
+
+
+key_manager = KeyManager()
@@ -0,0 +1,31 @@
+"""
+Short-lived cache of authenticated users, so that a request with a known
+token does not need to load its user from the database.
+"""
+
+import time
+
+from src.core.config import settings
+from src.models import User
+from src.utils.cache import TTLCache
+from .auth_schemas import Principal
+
+# Keyed by email, the subject of the access token. Entries are dropped by the
+# user CRUD functions on every change; the TTL bounds how long a change made
+# through another worker process can go unnoticed.
+principals: TTLCache[str, Principal] = TTLCache(maxsize=settings.auth.principal_cache_size)
+
+
+def get_principal(email: str) -> Principal | None:
+    return principals.get(email)
+
+
+def cache_principal(user: User) -> Principal:
+    principal = Principal.model_validate(user, from_attributes=True)
+    principals.set(principal.email, principal, expires_at=time.time() + settings.auth.principal_cache_ttl_seconds)
+    return principal
+
+
+def invalidate_principal(*emails: str) -> None:
+    for email in emails:
+        principals.pop(email)
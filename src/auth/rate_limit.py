@@ -0,0 +1,174 @@
+"""
+Token-bucket rate limiting of login attempts.
+"""
+
+import heapq
+import ipaddress
+import time
+from typing import Iterable, Protocol
+
+from pydantic import IPvAnyNetwork
+
+from src.core.config import settings
+from .exceptions import TooManyLoginAttemptsError
+
+
+class BucketStore(Protocol):
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        """
+        Take one token from the bucket of `key`.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available
+        """
+        ...
+
+
+class MemoryBucketStore:
+    """
+    Per-process bucket store.
+
+    At most `max_keys` buckets are kept, so an attacker cycling through random
+    usernames cannot exhaust memory. When the store is full the bucket that
+    refills first is dropped: a full bucket is the same as no bucket, and a
+    bucket drained by many attempts outlives the buckets of keys that were
+    tried only once, so cycling junk keys does not reset it.
+    """
+
+    def __init__(self, max_keys: int = settings.login_rate_limit.max_tracked_keys):
+        self.max_keys = max_keys
+        # key -> (tokens, updated_at, full_at)
+        self._buckets: dict[str, tuple[float, float, float]] = {}
+        # (full_at, key) of every bucket update, including outdated ones
+        self._full_at: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def take(self, key: str, capacity: float, refill_per_second: float) -> float:
+        now = time.monotonic()
+        tokens, updated_at, _ = self._buckets.get(key, (capacity, now, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / refill_per_second
+        full_at = now + (capacity - tokens) / refill_per_second
+        self._buckets[key] = (tokens, now, full_at)
+        heapq.heappush(self._full_at, (full_at, key))
+        self._evict()
+        return wait
+
+    def _evict(self) -> None:
+        while len(self._buckets) > self.max_keys:
+            full_at, key = heapq.heappop(self._full_at)
+            bucket = self._buckets.get(key)
+            if bucket is not None and bucket[2] == full_at:
+                del self._buckets[key]
+        if len(self._full_at) > 2 * len(self._buckets):
+            self._full_at = [(full_at, key) for key, (_, _, full_at) in self._buckets.items()]
+            heapq.heapify(self._full_at)
+
+
+def client_ip(
+        peer: str | None,
+        forwarded_for: str | None,
+        trusted_proxies: Iterable[IPvAnyNetwork] = settings.login_rate_limit.trusted_proxies,
+) -> str | None:
+    """
+    Get the address of the client behind any trusted reverse proxies.
+
+    X-Forwarded-For is read from the right, starting at the peer, and the
+    first address that is not a trusted proxy is the client. Addresses left
+    of it may be forged by the client and are ignored.
+
+    Args:
+        peer: Address of the direct peer of the connection
+        forwarded_for: Value of the X-Forwarded-For header
+        trusted_proxies: Networks of the reverse proxies in front of the app
+
+    Returns:
+        str | None: Client IP address, None if unknown
+    """
+    trusted_proxies = list(trusted_proxies)
+
+    def is_trusted(address: str) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in trusted_proxies)
+
+    if peer is None or not forwarded_for or not is_trusted(peer):
+        return peer
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not is_trusted(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+class LoginRateLimiter:
+    """
+    Limits login attempts per username and per client IP.
+
+    Runs before the user lookup and the password check, so rejected attempts
+    cost neither a query nor a bcrypt round. The store can be replaced with
+    a shared one (e.g. Redis) implementing BucketStore to limit across
+    worker processes.
+    """
+
+    def __init__(
+            self,
+            store: BucketStore | None = None,
+            username_burst: int = settings.login_rate_limit.username_burst,
+            username_per_minute: float = settings.login_rate_limit.username_per_minute,
+            ip_burst: int = settings.login_rate_limit.ip_burst,
+            ip_per_minute: float = settings.login_rate_limit.ip_per_minute,
+    ):
+        self.store = store if store is not None else MemoryBucketStore()
+        self.username_burst = username_burst
+        self.username_per_minute = username_per_minute
+        self.ip_burst = ip_burst
+        self.ip_per_minute = ip_per_minute
+        self.allowed = 0
+        self.rejected_by_ip = 0
+        self.rejected_by_username = 0
+
+    async def check(self, username: str, ip: str | None) -> None:
+        """
+        Count a login attempt.
+
+        Args:
+            username: Username of the attempt
+            ip: Client IP address, None if unknown
+
+        Raises:
+            TooManyLoginAttemptsError: If either bucket is empty
+        """
+        if ip is not None:
+            wait = await self.store.take(f"ip:{ip}", self.ip_burst, self.ip_per_minute / 60)
+            if wait:
+                self.rejected_by_ip += 1
+                raise TooManyLoginAttemptsError(retry_after=wait)
+        wait = await self.store.take(
+            f"user:{username.strip().lower()}", self.username_burst, self.username_per_minute / 60
+        )
+        if wait:
+            self.rejected_by_username += 1
+            raise TooManyLoginAttemptsError(retry_after=wait)
+        self.allowed += 1
+
+    def stats(self) -> dict[str, int]:
+        stats = {
+            "allowed": self.allowed,
+            "rejected_by_ip": self.rejected_by_ip,
+            "rejected_by_username": self.rejected_by_username,
+        }
+        if isinstance(self.store, MemoryBucketStore):
+            stats["tracked_keys"] = len(self.store)
+        return stats
+
+
+login_rate_limiter = LoginRateLimiter()
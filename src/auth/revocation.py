@@ -0,0 +1,96 @@
+"""
+In-memory view of the revoked tokens table.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Sequence
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models import RevokedToken
+from src.services.reloadable import ReloadableIndex, patch
+
+# Re-read revocations this far behind the newest one seen, so that rows whose
+# transaction committed after a later one are not missed.
+REFRESH_OVERLAP = timedelta(seconds=10)
+
+
+def _unexpired() -> Select[tuple[str, datetime]]:
+    return (
+        select(RevokedToken.jti, RevokedToken.timestamp)
+        .where(RevokedToken.expires_at > datetime.now(timezone.utc))
+    )
+
+
+class RevocationList(ReloadableIndex):
+    """
+    Revoked token IDs of all unexpired revoked tokens.
+
+    Held in a set, so a check is a single hash lookup. New revocations are
+    read incrementally every `refresh_interval` seconds, and the whole list
+    is rebuilt every `reload_interval` seconds to drop entries that expired
+    since.
+    """
+
+    def __init__(
+            self,
+            reload_interval: float = settings.auth.revocation_reload_seconds,
+            refresh_interval: float = settings.auth.revocation_refresh_seconds,
+    ):
+        super().__init__(reload_interval)
+        self.refresh_interval = refresh_interval
+        self._revoked: set[str] = set()
+        self._watermark: datetime | None = None
+        self._refreshed_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    async def _read(self, session: AsyncSession) -> Sequence[Row]:
+        return (await session.execute(_unexpired())).all()
+
+    def _apply(self, snapshot: Sequence[Row]) -> None:
+        self._revoked = set()
+        self._watermark = None
+        self._add_rows(snapshot)
+        self._refreshed_at = time.monotonic()
+
+    async def refresh(self, session: AsyncSession) -> None:
+        """Read revocations recorded since the last read, including those of other workers."""
+        self._refreshed_at = time.monotonic()
+        stmt = _unexpired()
+        if self._watermark is not None:
+            stmt = stmt.where(RevokedToken.timestamp >= self._watermark - REFRESH_OVERLAP)
+        self._add_rows((await session.execute(stmt)).all())
+
+    async def ensure_fresh(self, session: AsyncSession) -> None:
+        """
+        Load the list if needed and pick up new revocations at most every refresh interval.
+
+        Args:
+            session: Async database session used only when a read is due
+        """
+        if self._is_stale():
+            await self.ensure_loaded(session)
+        elif time.monotonic() - self._refreshed_at >= self.refresh_interval:
+            await self.refresh(session)
+
+    @patch
+    def add(self, jti: str) -> None:
+        """Register a revocation made by this process without waiting for the next refresh."""
+        self._revoked.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def _add_rows(self, rows: Sequence[Row]) -> None:
+        for jti, revoked_at in rows:
+            self._revoked.add(jti)
+            if self._watermark is None or revoked_at > self._watermark:
+                self._watermark = revoked_at
+
+
+revocation_list = RevocationList()
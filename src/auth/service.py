@@ -1,37 +1,103 @@
+import logging
+from datetime import datetime, timezone
 from typing import Annotated
 
 from fastapi import Depends
 
-from .utils import verify_password, check_token_with_type, TokenType, oauth2_scheme
-from src.schemas.user import UserOut
-from src.crud.user import get_user_by_email
+from .utils import (
+    check_token_with_type,
+    hash_password,
+    needs_rehash,
+    oauth2_scheme,
+    password_cache_key,
+    remember_verified_password,
+    TokenType,
+    verified_passwords,
+    verify_password,
+)
+from src.crud.revoked_token import revoke_token
+from src.crud.exceptions import CrudException
+from src.crud.user import get_user_by_email, update_password_hash
+from src.exceptions.exceptions import ServiceUnavailableException
+from src.models import User
+from .auth_schemas import Principal, TokenData
 from .exceptions import InvalidCredentialsError, InactiveUserError, AccessDeniedError
 from .dependencies import DBSession
+from .hasher import password_hasher
+from .principals import cache_principal, get_principal
+from .revocation import revocation_list
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)], session: DBSession):
+logger = logging.getLogger("MainApp")
+
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)], session: DBSession) -> Principal:
     token_data = check_token_with_type(token=token, token_type=TokenType.ACCESS)
-    
+    await check_not_revoked(session, token_data)
+
+    if principal := get_principal(token_data.email):
+        return principal
     user = await get_user_by_email(session=session, email=token_data.email) # type: ignore
     if user is None:
         raise InvalidCredentialsError
+    return cache_principal(user)
+
+async def check_not_revoked(session: AsyncSession, token_data: TokenData) -> None:
+    if token_data.jti is None:
+        return
+    await revocation_list.ensure_fresh(session)
+    if revocation_list.is_revoked(token_data.jti):
+        raise InvalidCredentialsError
+
+async def revoke(session: AsyncSession, token_data: TokenData) -> None:
+    if token_data.jti is None or token_data.exp is None:
+        return
+    await revoke_token(session, token_data.jti, datetime.fromtimestamp(token_data.exp, timezone.utc))
+    revocation_list.add(token_data.jti)
+
+async def get_active_user_by_token(session: AsyncSession, token: str):
+    user = await get_current_user(token=token, session=session)
+    if not user.is_active:
+        raise InactiveUserError(user_id=user.id)
     return user
 
+async def check_password(user: User, password: str) -> bool:
+    cache_key = password_cache_key(user.email, password, user.password_hash)
+    if verified_passwords.get(cache_key):
+        return True
+    if not await password_hasher.run(verify_password, password, user.password_hash):
+        return False
+    remember_verified_password(cache_key)
+    return True
+
 async def authenticate_user(session: AsyncSession, email: str, password: str):
     user = await get_user_by_email(session=session, email=email)
     if not user:
         return False
-    if not verify_password(password, user.password_hash):
+    if not await check_password(user, password):
         return False
+    # The upgrade costs one more hash, so it is left for a quieter login while checks queue up.
+    if needs_rehash(user.password_hash) and not password_hasher.queued:
+        user_id = user.id
+        try:
+            await update_password_hash(session, user, await password_hasher.run(hash_password, password))
+            remember_verified_password(password_cache_key(user.email, password, user.password_hash))
+        except ServiceUnavailableException:
+            logger.info("Postponed password hash upgrade of user %s, hasher is saturated", user_id)
+        except CrudException as e:
+            # The old hash still verifies, so the login goes on with the state
+            # the failed commit expired reloaded; the upgrade is retried next time.
+            logger.warning("Failed to upgrade password hash of user %s", user_id, exc_info=e)
+            await session.rollback()
+            await session.refresh(user)
     return user
 
-async def get_current_active_user(current_user: Annotated[UserOut, Depends(get_current_user)]):
+async def get_current_active_user(current_user: Annotated[Principal, Depends(get_current_user)]):
     if not current_user.is_active:
         raise InactiveUserError(user_id=current_user.id)
     return current_user
 
-async def get_current_active_admin_user(current_active_user: Annotated[UserOut, Depends(get_current_active_user)]):
+async def get_current_active_admin_user(current_active_user: Annotated[Principal, Depends(get_current_active_user)]):
     if not current_active_user.is_admin:
         raise AccessDeniedError(user_id=current_active_user.id)
     return current_active_user
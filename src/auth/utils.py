@@ -1,5 +1,9 @@
 from datetime import datetime, timedelta, timezone
 import enum
+import hashlib
+import hmac
+import secrets
+import time
 
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer
@@ -9,7 +13,9 @@ import bcrypt
 
 from .auth_schemas import TokenData
 from .exceptions import InvalidCredentialsError
+from .keys import key_manager
 from src.core.config import settings
+from src.utils.cache import TTLCache
 
 
 class TokenType(enum.StrEnum):
@@ -21,10 +27,21 @@ class TokenType(enum.StrEnum):
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 refresh_token_scheme = HTTPBearer(auto_error=False)
 
+# Verified tokens keyed by their SHA-256 digest, kept until the token's `exp`,
+# so a token reused across requests is only checked against its signature once.
+verified_tokens: TTLCache[bytes, TokenData] = TTLCache(maxsize=settings.auth.verified_token_cache_size)
+
+# Recent successful password checks, so that clients logging in again and
+# again (e.g. kiosks) skip bcrypt. Disabled unless verify_cache_ttl_seconds is set.
+verified_passwords: TTLCache[bytes, bool] = TTLCache(
+    maxsize=settings.password.verify_cache_size if settings.password.verify_cache_ttl_seconds > 0 else 0
+)
+_password_cache_secret = secrets.token_bytes(32)
+
 
 def encode_jwt(
         payload: dict,
-        private_key: str = settings.auth.private_path.read_text(),
+        private_key: str | None = None,
         algorithm: str = settings.auth.algorithm,
         expire_timedelta: timedelta| None = None,
         expire_minutes: int = settings.auth.token_expire_minutes,
@@ -39,35 +56,55 @@ def encode_jwt(
         exp=expire,
         iat=now
     )
-    encoded = jwt.encode(payload=payload, key=private_key, algorithm=algorithm)
+    if private_key is None:
+        return key_manager.sign(to_endode)
+    encoded = jwt.encode(payload=to_endode, key=private_key, algorithm=algorithm)
     return encoded
 
 def decode_jwt(
         token: str|bytes,
-        public_key: str = settings.auth.public_path.read_text(),
+        public_key: str | None = None,
         algorithm: str = settings.auth.algorithm
 ):
+    if public_key is None:
+        return key_manager.verify(token)
     decoded = jwt.decode(jwt=token, key=public_key, algorithms=algorithm)
 
     return decoded
 
 def hash_password(password: str) -> str:
-    hashed_password: bytes = bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+    hashed_password: bytes = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.password.bcrypt_rounds))
     return hashed_password.decode()
 
 def verify_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password=password.encode(), hashed_password=hashed_password.encode())
 
+def needs_rehash(hashed_password: str) -> bool:
+    """Whether a bcrypt hash ($2b$<rounds>$...) uses a different cost than configured."""
+    try:
+        return int(hashed_password.split("$")[2]) != settings.password.bcrypt_rounds
+    except (IndexError, ValueError):
+        return True
+
+def password_cache_key(email: str, password: str, hashed_password: str) -> bytes:
+    # Keyed with a per-process secret so the cached digests are useless outside this process;
+    # the stored hash is part of the key, so a password change never hits an old entry.
+    message = "\0".join((email, password, hashed_password)).encode()
+    return hmac.new(_password_cache_secret, message, hashlib.sha256).digest()
+
+def remember_verified_password(key: bytes) -> None:
+    verified_passwords.set(key, True, expires_at=time.time() + settings.password.verify_cache_ttl_seconds)
+
 def create_token(
     token_type: str,
     payload: dict,
-    private_key: str = settings.auth.private_path.read_text(),
+    private_key: str | None = None,
     algorithm: str = settings.auth.algorithm,
     expire_timedelta: timedelta | None = None,
     expire_minutes: int = settings.auth.token_expire_minutes
 )-> str:
     to_encode = payload.copy()
-    to_encode.update({TokenType.STR : token_type})
+    to_encode.update({TokenType.STR : token_type, "jti": secrets.token_urlsafe(16)})
     token = encode_jwt(
         payload=to_encode,
         private_key=private_key,
@@ -79,11 +116,22 @@ def create_token(
     return token
 
 
+def verify_token(token: str) -> TokenData:
+    digest = hashlib.sha256(token.encode()).digest()
+    token_data = verified_tokens.get(digest)
+    if token_data is not None:
+        return token_data
+
+    payload = decode_jwt(token)
+    token_data = TokenData.model_validate({**payload, "email": payload.get("sub")})
+    if "exp" in payload:
+        verified_tokens.set(digest, token_data, expires_at=payload["exp"])
+    return token_data
+
+
 def check_token_with_type(token: str, token_type: str):
     try:
-        payload = decode_jwt(token)
-
-        token_data = TokenData(email=payload.get("sub"), type=payload.get("type"))
+        token_data = verify_token(token)
 
         if token_data.type != token_type:
             raise HTTPException(
@@ -2,4 +2,12 @@ import enum
 
 class Action(enum.StrEnum):
     enter = "Enter"
-    exit = "Exit"
\ No newline at end of file
+    exit = "Exit"
+
+class ExportFormat(enum.StrEnum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+class EventType(enum.StrEnum):
+    access_log = "access_log"
+    presence = "presence"
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from pydantic import BaseModel, MySQLDsn
+from pydantic import BaseModel, IPvAnyNetwork, MySQLDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +13,7 @@ class RunConfig(BaseModel):
 
 class ApiPrefix(BaseModel):
     prefix: str = "/api"
+    fast_json: bool = False
 
 
 class DatabaseConfig(BaseModel):
@@ -34,9 +35,71 @@ class DatabaseConfig(BaseModel):
 class AuthJWT(BaseModel):
     public_path: Path = BASE_DIR / "certs" / "public.pem"
     private_path: Path = BASE_DIR / "certs" / "private.pem"
+    extra_public_paths: list[Path] = []
+    key_reload_interval_seconds: int = 60
     algorithm: str = "RS256"
     token_expire_minutes: int = 30
     resfresh_token_expire_days: int = 1
+    verified_token_cache_size: int = 10_000
+    principal_cache_size: int = 10_000
+    principal_cache_ttl_seconds: int = 30
+    revocation_refresh_seconds: int = 5
+    revocation_reload_seconds: int = 3600
+
+
+class LoginRateLimitConfig(BaseModel):
+    enabled: bool = True
+    username_burst: int = 5
+    username_per_minute: float = 5
+    ip_burst: int = 20
+    ip_per_minute: float = 60
+    max_tracked_keys: int = 100_000
+    trusted_proxies: list[IPvAnyNetwork] = []
+
+
+class PasswordConfig(BaseModel):
+    hash_workers: int = 4
+    hash_queue_size: int = 64
+    bcrypt_rounds: int = 12
+    verify_cache_ttl_seconds: int = 0
+    verify_cache_size: int = 10_000
+
+
+class AccessEngineConfig(BaseModel):
+    reload_interval_seconds: int = 300
+    max_batch_size: int = 1000
+    # IANA name of the time zone the access rule windows are written in.
+    timezone: str = "UTC"
+
+
+class AccessLogConfig(BaseModel):
+    write_behind: bool = False
+    batch_size: int = 500
+    flush_interval_ms: int = 200
+    max_pending: int = 10_000
+    enqueue_timeout_ms: int = 100
+    flush_retry_initial_ms: int = 100
+    flush_retry_max_ms: int = 10_000
+    bulk_chunk_size: int = 1000
+    import_max_line_bytes: int = 64 * 1024
+    retention_months: int = 12
+    partition_premake_months: int = 3
+    archive_expired_partitions: bool = False
+
+
+class PaginationConfig(BaseModel):
+    default_page_size: int = 100
+    max_page_size: int = 1000
+    nested_page_size: int = 10
+
+
+class OccupancyConfig(BaseModel):
+    reload_interval_seconds: int = 60
+
+
+class EventsConfig(BaseModel):
+    queue_size: int = 100
+    heartbeat_seconds: int = 15
 
 
 class Settings(BaseSettings):
@@ -50,6 +113,13 @@ class Settings(BaseSettings):
     api: ApiPrefix = ApiPrefix()
     db: DatabaseConfig
     auth: AuthJWT = AuthJWT()
+    password: PasswordConfig = PasswordConfig()
+    login_rate_limit: LoginRateLimitConfig = LoginRateLimitConfig()
+    pagination: PaginationConfig = PaginationConfig()
+    access_engine: AccessEngineConfig = AccessEngineConfig()
+    access_log: AccessLogConfig = AccessLogConfig()
+    occupancy: OccupancyConfig = OccupancyConfig()
+    events: EventsConfig = EventsConfig()
 
     
 settings = Settings()  # type: ignore
\ No newline at end of file
@@ -1,17 +1,117 @@
-from typing import Sequence
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection, Mapping, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
-from sqlalchemy import select
+from sqlalchemy import Insert, Row, Select, delete, insert, select
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.crud.exceptions as exceptions
-from src.models import AccessLog
+from src.constants import Action
+from src.models import AccessLog, CurrentPresence, Room, User
+from src.services.events import event_hub
+from src.services.occupancy import occupancy
 from src.schemas.access_log import (
     AccessLogCreate,
+    AccessLogFilter,
+    AccessLogOut,
     AccessLogUpdate,
     AccessLogUpdatePartical,
 )
+from .pagination import paginate
+from .projection import load_fields
+
+AccessLogCursor = tuple[datetime, int]
+
+SORT_KEY = (AccessLog.timestamp, AccessLog.id)
+
+# Columns of AccessLogOut, read by get_access_log_rows.
+ROW_COLUMNS = tuple(getattr(AccessLog, name) for name in AccessLogOut.model_fields)
+
+
+def _paginate(
+        stmt: Select[tuple[AccessLog]],
+        offset: int,
+        limit: int,
+        after: AccessLogCursor | None,
+) -> Select[tuple[AccessLog]]:
+    """
+    Order logs newest first and apply either keyset or offset pagination.
+
+    With `after` set, the query seeks straight past the (timestamp, id) of the
+    last row of the previous page using the ix_access_logs_timestamp_id index
+    and `offset` is ignored.
+    """
+    return paginate(stmt, SORT_KEY, offset, limit, after, descending=True)
+
+def _filter(
+        stmt: Select[tuple[AccessLog]],
+        filters: AccessLogFilter,
+) -> Select[tuple[AccessLog]]:
+    """
+    Restrict a query to logs matching every filter that is set.
+
+    `since` is inclusive and `until` is exclusive.
+    """
+    if filters.user_id is not None:
+        stmt = stmt.where(AccessLog.user_id == filters.user_id)
+    if filters.room_id is not None:
+        stmt = stmt.where(AccessLog.room_id == filters.room_id)
+    if filters.action is not None:
+        stmt = stmt.where(AccessLog.action == filters.action)
+    if filters.access_allowed is not None:
+        stmt = stmt.where(AccessLog.access_allowed == filters.access_allowed)
+    if filters.since is not None:
+        stmt = stmt.where(AccessLog.timestamp >= filters.since)
+    if filters.until is not None:
+        stmt = stmt.where(AccessLog.timestamp < filters.until)
+    return stmt
+
+def _publish(access_log: AccessLog) -> None:
+    event_hub.publish_access_log(
+        user_id=access_log.user_id,
+        room_id=access_log.room_id,
+        action=access_log.action,
+        access_allowed=access_log.access_allowed,
+        timestamp=access_log.timestamp,
+        access_log_id=access_log.id,
+    )
+
+async def _invalid_references(
+        session: AsyncSession,
+        access_logs_in: Sequence[Mapping[str, Any]],
+) -> list[int]:
+    """
+    Find entries that reference a missing user or room.
+
+    access_logs is partitioned and has no foreign keys, so the references of
+    a whole batch are checked here with one query per referenced table.
+
+    Returns:
+        list[int]: Positions of the entries with an invalid reference
+
+    Raises:
+        CreateException: If the lookup fails
+    """
+    user_ids = {access_log_in["user_id"] for access_log_in in access_logs_in}
+    room_ids = {access_log_in["room_id"] for access_log_in in access_logs_in}
+    try:
+        users = set(await session.scalars(select(User.id).where(User.id.in_(user_ids))))
+        rooms = set(await session.scalars(select(Room.id).where(Room.id.in_(room_ids))))
+    except OperationalError as e:
+        raise exceptions.OperationalException(model_name="AccessLog", original_exc=e)
+    except DatabaseError as e:
+        await session.rollback()
+        raise exceptions.CreateException(
+            model_name="AccessLog",
+            original_exc=e
+        ) from e
+    return [
+        position
+        for position, access_log_in in enumerate(access_logs_in)
+        if access_log_in["user_id"] not in users or access_log_in["room_id"] not in rooms
+    ]
 
 async def create_access_log(
         session: AsyncSession,
@@ -28,13 +128,190 @@ async def create_access_log(
         AccessLog: Newly created AccessLog object
         
     Raises:
+        AccessLogInvalidReferancesException: If the user or room does not exist
         CreateException: If creation error occurs
     """
+    values = access_log_in.model_dump()
+    if await _invalid_references(session, [values]):
+        raise exceptions.AccessLogInvalidReferancesException()
     try:
-        access_log = AccessLog(**access_log_in.model_dump())
+        await event_hub.locate(session, [access_log_in.room_id])
+        access_log = AccessLog(**values)
         session.add(access_log)
         await session.commit()
         await session.refresh(access_log)
+        _publish(access_log)
+        return access_log
+    except IntegrityError as e:
+        await session.rollback()
+        raise exceptions.AccessLogInvalidReferancesException(e) from e
+    except OperationalError as e:
+        raise exceptions.OperationalException(model_name="AccessLog", original_exc=e)
+    except DatabaseError as e:
+        await session.rollback()
+        raise exceptions.CreateException(
+            model_name="AccessLog",
+            original_exc=e
+        ) from e
+
+async def create_access_logs(
+        session: AsyncSession,
+        access_logs_in: Sequence[dict[str, Any]],
+) -> None:
+    """
+    Insert many access log entries with a single multi-row INSERT.
+
+    Args:
+        session: Async database session
+        access_logs_in: Column values of the entries to insert
+
+    Raises:
+        AccessLogInvalidReferancesException: If any entry references a missing user or room
+        CreateException: If creation error occurs
+    """
+    if await _invalid_references(session, access_logs_in):
+        raise exceptions.AccessLogInvalidReferancesException()
+    await _insert_access_logs(session, access_logs_in)
+
+async def _insert_access_logs(
+        session: AsyncSession,
+        access_logs_in: Sequence[dict[str, Any]],
+) -> None:
+    try:
+        await session.execute(insert(AccessLog), access_logs_in)
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        raise exceptions.AccessLogInvalidReferancesException(e) from e
+    except OperationalError as e:
+        raise exceptions.OperationalException(model_name="AccessLog", original_exc=e)
+    except DatabaseError as e:
+        await session.rollback()
+        raise exceptions.CreateException(
+            model_name="AccessLog",
+            original_exc=e
+        ) from e
+
+async def create_access_logs_skip_invalid(
+        session: AsyncSession,
+        access_logs_in: Sequence[dict[str, Any]],
+) -> list[int]:
+    """
+    Insert many access log entries, isolating entries with invalid references.
+
+    Entries referencing a missing user or room are found with one lookup for
+    the whole batch and the rest is inserted at once. Only if that insert
+    still fails on an integrity error (e.g. a user deleted meanwhile) the
+    entries are retried one by one so that valid ones are still stored.
+
+    Args:
+        session: Async database session
+        access_logs_in: Column values of the entries to insert
+
+    Returns:
+        list[int]: Positions of the entries that were rejected
+
+    Raises:
+        CreateException: If creation error occurs
+    """
+    rejected = await _invalid_references(session, access_logs_in)
+    rejected_positions = set(rejected)
+    valid = [
+        (position, access_log_in)
+        for position, access_log_in in enumerate(access_logs_in)
+        if position not in rejected_positions
+    ]
+    if not valid:
+        return rejected
+    try:
+        await _insert_access_logs(session, [access_log_in for _, access_log_in in valid])
+        return rejected
+    except exceptions.AccessLogInvalidReferancesException:
+        pass
+
+    for position, access_log_in in valid:
+        try:
+            await _insert_access_logs(session, [access_log_in])
+        except exceptions.AccessLogInvalidReferancesException:
+            rejected.append(position)
+    return sorted(rejected)
+
+def _upsert_current_presence(
+        dialect_name: str,
+        user_id: int,
+        room_id: int,
+        timestamp: datetime,
+) -> Insert:
+    """
+    Build an INSERT that moves the user into the room, whether or not they
+    already have a presence record.
+    """
+    values = {"user_id": user_id, "room_id": room_id, "timestamp": timestamp}
+    if dialect_name == "mysql":
+        mysql_stmt = mysql.insert(CurrentPresence).values(values)
+        return mysql_stmt.on_duplicate_key_update(
+            room_id=mysql_stmt.inserted.room_id,
+            timestamp=mysql_stmt.inserted.timestamp,
+        )
+    sqlite_stmt = sqlite.insert(CurrentPresence).values(values)
+    return sqlite_stmt.on_conflict_do_update(
+        index_elements=[CurrentPresence.user_id],
+        set_={"room_id": sqlite_stmt.excluded.room_id, "timestamp": sqlite_stmt.excluded.timestamp},
+    )
+
+async def record_swipe(
+        session: AsyncSession,
+        access_log_in: AccessLogCreate,
+) -> AccessLog:
+    """
+    Record a badge swipe and update the user's current presence in one transaction.
+
+    An allowed `enter` moves the user's presence record into the room
+    (INSERT ... ON DUPLICATE KEY UPDATE), an allowed `exit` removes the record
+    if the user is present in that room. Denied swipes are only logged.
+    
+    Args:
+        session: Async database session
+        access_log_in: AccessLogCreate schema with swipe data
+        
+    Returns:
+        AccessLog: Newly created AccessLog object
+        
+    Raises:
+        AccessLogInvalidReferancesException: If user or room does not exist
+        CreateException: If creation error occurs
+    """
+    values = access_log_in.model_dump()
+    if await _invalid_references(session, [values]):
+        raise exceptions.AccessLogInvalidReferancesException()
+    try:
+        await event_hub.locate(session, [access_log_in.room_id])
+        access_log = AccessLog(**values)
+        session.add(access_log)
+        await session.flush()
+        if access_log.access_allowed and access_log.action == Action.enter:
+            await session.execute(_upsert_current_presence(
+                session.get_bind().dialect.name,
+                user_id=access_log.user_id,
+                room_id=access_log.room_id,
+                timestamp=access_log.timestamp,
+            ))
+        left = False
+        if access_log.access_allowed and access_log.action == Action.exit:
+            result = await session.execute(
+                delete(CurrentPresence)
+                .where(CurrentPresence.user_id == access_log.user_id)
+                .where(CurrentPresence.room_id == access_log.room_id)
+            )
+            left = result.rowcount > 0
+        await session.commit()
+        _publish(access_log)
+        if access_log.access_allowed and access_log.action == Action.enter:
+            occupancy.move(access_log.user_id, access_log.room_id)
+            event_hub.publish_presence(access_log.user_id, access_log.room_id, True, access_log.timestamp)
+        elif left:
+            occupancy.leave(access_log.user_id, access_log.room_id)
+            event_hub.publish_presence(access_log.user_id, access_log.room_id, False, access_log.timestamp)
         return access_log
     except IntegrityError as e:
         await session.rollback()
@@ -67,10 +344,16 @@ async def update_access_log(
         AccessLog: Updated AccessLog object
         
     Raises:
+        AccessLogInvalidReferancesException: If the user or room does not exist
         UpdateException: If update operation fails
     """
+    access_log_id = access_log.id
+    values = access_log_in.model_dump(exclude_none=partial)
+    merged = {"user_id": access_log.user_id, "room_id": access_log.room_id, **values}
+    if await _invalid_references(session, [merged]):
+        raise exceptions.AccessLogInvalidReferancesException()
     try:
-        for name, value in access_log_in.model_dump(exclude_none=partial).items():
+        for name, value in values.items():
             setattr(access_log, name, value)
         await session.commit()
         await session.refresh(access_log)
@@ -81,7 +364,7 @@ async def update_access_log(
         await session.rollback()
         raise exceptions.UpdateException(
             model_name="AccessLog",
-            entity_id=access_log.id,
+            entity_id=access_log_id,
             original_exc=e
         ) from e
 
@@ -132,27 +415,121 @@ async def get_access_logs(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: AccessLogCursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[AccessLog]:
     """
     Get paginated list of access logs ordered by timestamp (newest first).
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of logs to return
+        after: (timestamp, id) of the last log of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[AccessLog]: List of AccessLog objects
     """
-    stmt = (
-        select(AccessLog)
-        .offset(offset)
-        .limit(limit)
-        .order_by(AccessLog.timestamp.desc())
+    stmt = _paginate(load_fields(select(AccessLog), AccessLog, fields, SORT_KEY), offset, limit, after)
+    access_logs = await session.scalars(stmt)
+    return access_logs.all()
+
+async def get_access_log_rows(
+        session: AsyncSession,
+        offset: int = 0,
+        limit: int = 100,
+        after: AccessLogCursor | None = None,
+        fields: Collection[str] | None = None,
+) -> Sequence[Row]:
+    """
+    Get the same page as `get_access_logs` as plain rows.
+
+    Only the columns are selected, so no AccessLog instances are built or
+    added to the session's identity map. Meant for read-only listing where
+    rows go straight to the serializer.
+    
+    Args:
+        session: Async database session
+        offset: Pagination offset, ignored when `after` is given
+        limit: Maximum number of logs to return
+        after: (timestamp, id) of the last log of the previous page
+        fields: Columns to select besides timestamp and id, all when None
+        
+    Returns:
+        Sequence[Row]: Rows of the ROW_COLUMNS, or of the selected fields
+    """
+    columns = [
+        column for column in ROW_COLUMNS
+        if fields is None or column.key in fields or column.key in ("timestamp", "id")
+    ]
+    stmt = paginate(select(*columns), SORT_KEY, offset, limit, after, descending=True)
+    rows = await session.execute(stmt)
+    return rows.all()
+
+async def search_access_logs(
+        session: AsyncSession,
+        filters: AccessLogFilter,
+        limit: int = 100,
+        after: AccessLogCursor | None = None,
+        fields: Collection[str] | None = None,
+) -> Sequence[AccessLog]:
+    """
+    Get access logs matching the filters, newest first.
+
+    Filtering by user or room is served by the (user_id, timestamp) and
+    (room_id, timestamp) indexes.
+    
+    Args:
+        session: Async database session
+        filters: Conditions the logs must match
+        limit: Maximum number of logs to return
+        after: (timestamp, id) of the last log of the previous page
+        fields: Attributes to load, all when None
+        
+    Returns:
+        Sequence[AccessLog]: List of matching AccessLog objects
+    """
+    stmt = _paginate(
+        _filter(load_fields(select(AccessLog), AccessLog, fields, SORT_KEY), filters), 0, limit, after,
     )
     access_logs = await session.scalars(stmt)
     return access_logs.all()
 
+async def stream_access_logs(
+        session: AsyncSession,
+        filters: AccessLogFilter,
+        batch_size: int = 1000,
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Stream access logs matching the filters in batches, oldest first.
+
+    Rows are read through a server-side cursor as plain column tuples, so
+    memory use does not depend on how many logs match.
+    
+    Args:
+        session: Async database session
+        filters: Conditions the logs must match
+        batch_size: Number of rows fetched from the cursor at a time
+        
+    Yields:
+        Sequence[Row]: Rows of (id, user_id, room_id, action, access_allowed, timestamp)
+    """
+    stmt = _filter(
+        select(
+            AccessLog.id,
+            AccessLog.user_id,
+            AccessLog.room_id,
+            AccessLog.action,
+            AccessLog.access_allowed,
+            AccessLog.timestamp,
+        ),
+        filters,
+    ).order_by(AccessLog.timestamp, AccessLog.id).execution_options(yield_per=batch_size)
+    result = await session.stream(stmt)
+    async for rows in result.partitions():
+        yield rows
+
 async def get_access_log_with_room(
         session: AsyncSession,
         access_log_id: int
@@ -199,24 +576,25 @@ async def get_access_logs_with_user(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: AccessLogCursor | None = None,
 ) -> Sequence[AccessLog]:
     """
     Get paginated list of access logs with user information loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of logs to return
+        after: (timestamp, id) of the last log of the previous page
         
     Returns:
         Sequence[AccessLog]: List of AccessLog objects with users
     """
-    stmt = (
-        select(AccessLog)
-        .options(joinedload(AccessLog.user))
-        .offset(offset)
-        .limit(limit)
-        .order_by(AccessLog.timestamp.desc())
+    stmt = _paginate(
+        select(AccessLog).options(joinedload(AccessLog.user)),
+        offset,
+        limit,
+        after,
     )
     access_logs = await session.scalars(stmt)
     return access_logs.all()
@@ -225,24 +603,25 @@ async def get_access_logs_with_room(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: AccessLogCursor | None = None,
 ) -> Sequence[AccessLog]:
     """
     Get paginated list of access logs with room information loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of logs to return
+        after: (timestamp, id) of the last log of the previous page
         
     Returns:
         Sequence[AccessLog]: List of AccessLog objects with rooms
     """
-    stmt = (
-        select(AccessLog)
-        .options(joinedload(AccessLog.room))
-        .offset(offset)
-        .limit(limit)
-        .order_by(AccessLog.timestamp.desc())
+    stmt = _paginate(
+        select(AccessLog).options(joinedload(AccessLog.room)),
+        offset,
+        limit,
+        after,
     )
     access_logs = await session.scalars(stmt)
     return access_logs.all()
\ No newline at end of file
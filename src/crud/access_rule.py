@@ -2,7 +2,7 @@
 CRUD operations for AccessRule model with comprehensive error handling.
 """
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
 from sqlalchemy import select
@@ -11,11 +11,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.crud.exceptions as exceptions
 from src.models import AccessRule
+from src.services.access_decision import access_engine
 from src.schemas.access_rule import (
     AccessRuleCreate,
     AccessRuleUpdate,
     AccessRuleUpdatePartical,
 )
+from .pagination import Cursor, paginate
+from .projection import load_fields
+
+SORT_KEY = (AccessRule.id,)
 
 
 async def create_access_rule(
@@ -42,6 +47,7 @@ async def create_access_rule(
         session.add(access_rule)
         await session.commit()
         await session.refresh(access_rule)
+        access_engine.add_rule(access_rule)
         return access_rule
     except IntegrityError as e:
         await session.rollback()
@@ -88,6 +94,7 @@ async def update_access_rule(
             setattr(access_rule, name, value)
         await session.commit()
         await session.refresh(access_rule)
+        access_engine.add_rule(access_rule)
         return access_rule
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="AccessRule", original_exc=e)
@@ -116,6 +123,7 @@ async def delete_access_rule(
     try:
         await session.delete(access_rule)
         await session.commit()
+        access_engine.remove_rule(access_rule.id)
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="AccessRule", original_exc=e)
     except DatabaseError as e:
@@ -146,23 +154,25 @@ async def get_access_rules(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[AccessRule]:
     """
     Get paginated list of access rules.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rules to return
+        after: Sort key of the last row of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[AccessRule]: List of AccessRule objects
     """
-    stmt = (
-        select(AccessRule)
-        .offset(offset)
-        .limit(limit)
-        .order_by(AccessRule.id)
+    stmt = paginate(
+        load_fields(select(AccessRule), AccessRule, fields, SORT_KEY),
+        SORT_KEY, offset, limit, after,
     )
     access_rules = await session.scalars(stmt)
     return access_rules.all()
@@ -171,24 +181,24 @@ async def get_access_rules_with_room(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[AccessRule]:
     """
     Get paginated list of access rules with room loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rules to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[AccessRule]: List of AccessRule objects with room
     """
-    stmt = (
+    stmt = paginate(
         select(AccessRule)
-        .options(joinedload(AccessRule.room))
-        .offset(offset)
-        .limit(limit)
-        .order_by(AccessRule.id)
+        .options(joinedload(AccessRule.room)),
+        SORT_KEY, offset, limit, after,
     )
     access_rules = await session.scalars(stmt)
     return access_rules.all()
@@ -197,24 +207,24 @@ async def get_access_rules_with_role(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[AccessRule]:
     """
     Get paginated list of access rules with role loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rules to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[AccessRule]: List of AccessRule objects with role
     """
-    stmt = (
+    stmt = paginate(
         select(AccessRule)
-        .options(joinedload(AccessRule.role))
-        .offset(offset)
-        .limit(limit)
-        .order_by(AccessRule.id)
+        .options(joinedload(AccessRule.role)),
+        SORT_KEY, offset, limit, after,
     )
     access_rules = await session.scalars(stmt)
     return access_rules.all()
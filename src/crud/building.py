@@ -2,7 +2,7 @@
 CRUD operations for Building model with comprehensive error handling.
 """
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +16,10 @@ from src.schemas.building import (
     BuildingUpdate,
     BuildingUpdatePartical,
 )
+from .pagination import Cursor, paginate
+from .projection import load_fields
+
+SORT_KEY = (Building.id,)
 
 async def create_building(
         session: AsyncSession,
@@ -138,23 +142,25 @@ async def get_buildings(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[Building]:
     """
     Get paginated list of buildings.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of buildings to return
+        after: Sort key of the last row of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[Building]: List of Building objects
     """
-    stmt = (
-        select(Building)
-        .offset(offset)
-        .limit(limit)
-        .order_by(Building.id)
+    stmt = paginate(
+        load_fields(select(Building), Building, fields, SORT_KEY),
+        SORT_KEY, offset, limit, after,
     )
     buildings = await session.scalars(stmt)
     return buildings.all()
@@ -163,24 +169,24 @@ async def get_buildings_with_floors(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Building]:
     """
     Get paginated list of buildings with floors loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of buildings to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Building]: List of Building objects with floors
     """
-    stmt = (
+    stmt = paginate(
         select(Building)
-        .options(selectinload(Building.floors))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Building.id)
+        .options(selectinload(Building.floors)),
+        SORT_KEY, offset, limit, after,
     )
     buildings = await session.scalars(stmt)
     return buildings.all()
@@ -2,7 +2,8 @@
 CRUD operations for CurrentPresence model with comprehensive error handling.
 """
 
-from typing import Sequence
+from datetime import datetime, timezone
+from typing import Collection, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,12 +11,18 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy import select
 
 from src.models import CurrentPresence
+from src.services.events import event_hub
+from src.services.occupancy import occupancy
 from src.schemas.current_presence import (
     CurrentPresenceCreate,
     CurrentPresenceUpdate,
     CurrentPresenceUpdatePartical,
 )
 import src.crud.exceptions as exceptions
+from .pagination import Cursor, paginate
+from .projection import load_fields
+
+SORT_KEY = (CurrentPresence.timestamp, CurrentPresence.id)
 
 async def create_current_presence(
         session: AsyncSession,
@@ -37,10 +44,15 @@ async def create_current_presence(
         CreateException: If general creation error occurs
     """
     try:
+        await event_hub.locate(session, [current_presence_in.room_id])
         current_presence = CurrentPresence(**current_presence_in.model_dump())
         session.add(current_presence)
         await session.commit()
         await session.refresh(current_presence)
+        occupancy.move(current_presence.user_id, current_presence.room_id)
+        event_hub.publish_presence(
+            current_presence.user_id, current_presence.room_id, True, current_presence.timestamp
+        )
         return current_presence
     except IntegrityError as e:
         await session.rollback()
@@ -82,10 +94,20 @@ async def update_current_presence(
         UpdateException: If update operation fails
     """
     try:
+        await event_hub.locate(session, {current_presence.room_id, current_presence_in.room_id} - {None})
+        previous_user_id, previous_room_id = current_presence.user_id, current_presence.room_id
         for name, value in current_presence_in.model_dump(exclude_none=partial).items():
             setattr(current_presence, name, value)
         await session.commit()
         await session.refresh(current_presence)
+        if previous_user_id != current_presence.user_id:
+            occupancy.move(previous_user_id, None)
+        occupancy.move(current_presence.user_id, current_presence.room_id)
+        if (previous_user_id, previous_room_id) != (current_presence.user_id, current_presence.room_id):
+            event_hub.publish_presence(previous_user_id, previous_room_id, False, current_presence.timestamp)
+            event_hub.publish_presence(
+                current_presence.user_id, current_presence.room_id, True, current_presence.timestamp
+            )
         return current_presence
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="CurrentPresence", original_exc=e)
@@ -112,8 +134,13 @@ async def delete_current_presence(
         DeleteException: If deletion fails
     """
     try:
+        await event_hub.locate(session, [current_presence.room_id])
         await session.delete(current_presence)
         await session.commit()
+        occupancy.move(current_presence.user_id, None)
+        event_hub.publish_presence(
+            current_presence.user_id, current_presence.room_id, False, datetime.now(timezone.utc)
+        )
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="CurrentPresence", original_exc=e)
     except DatabaseError as e:
@@ -144,23 +171,25 @@ async def get_current_presences(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[CurrentPresence]:
     """
     Get paginated list of current presence records.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of records to return
+        after: Sort key of the last row of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[CurrentPresence]: List of CurrentPresence objects
     """
-    stmt = (
-        select(CurrentPresence)
-        .offset(offset)
-        .limit(limit)
-        .order_by(CurrentPresence.timestamp.desc())
+    stmt = paginate(
+        load_fields(select(CurrentPresence), CurrentPresence, fields, SORT_KEY),
+        SORT_KEY, offset, limit, after, descending=True,
     )
     current_presences = await session.scalars(stmt)
     return current_presences.all()
@@ -211,24 +240,24 @@ async def get_current_presences_with_room(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[CurrentPresence]:
     """
     Get paginated list of current presence records with rooms loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of records to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[CurrentPresence]: List of CurrentPresence objects with rooms
     """
-    stmt = (
+    stmt = paginate(
         select(CurrentPresence)
-        .options(joinedload(CurrentPresence.room))
-        .offset(offset)
-        .limit(limit)
-        .order_by(CurrentPresence.timestamp.desc())
+        .options(joinedload(CurrentPresence.room)),
+        SORT_KEY, offset, limit, after, descending=True,
     )
     current_presences = await session.scalars(stmt)
     return current_presences.all()
@@ -237,24 +266,24 @@ async def get_current_presences_with_user(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[CurrentPresence]:
     """
     Get paginated list of current presence records with users loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of records to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[CurrentPresence]: List of CurrentPresence objects with users
     """
-    stmt = (
+    stmt = paginate(
         select(CurrentPresence)
-        .options(joinedload(CurrentPresence.user))
-        .offset(offset)
-        .limit(limit)
-        .order_by(CurrentPresence.timestamp.desc())
+        .options(joinedload(CurrentPresence.user)),
+        SORT_KEY, offset, limit, after, descending=True,
     )
     current_presences = await session.scalars(stmt)
     return current_presences.all()
\ No newline at end of file
@@ -194,7 +194,7 @@ class AccessRuleTimeConflictException(AlreadyExistsException):
         )
 
 class AccessLogInvalidReferancesException(CreateException):
-    def __init__(self, original_exc):
+    def __init__(self, original_exc: Exception | None = None):
         super().__init__(
             model_name="AccessLog",
             detail="Failed to create access log - invalid references",
@@ -2,7 +2,7 @@
 CRUD operations for Floor model with comprehensive error handling.
 """
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,12 +10,17 @@ from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy import select
 
 from src.models import Floor
+from src.services.occupancy import occupancy
 from src.schemas.floor import (
     FloorCreate,
     FloorUpdate,
     FloorUpdatePartical,
 )
 import src.crud.exceptions as exceptions
+from .pagination import Cursor, paginate
+from .projection import load_fields
+
+SORT_KEY = (Floor.id,)
 
 
 async def create_floor(
@@ -82,6 +87,7 @@ async def update_floor(
             setattr(floor, name, value)
         await session.commit()
         await session.refresh(floor)
+        occupancy.invalidate()
         return floor
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="Floor", original_exc=e)
@@ -140,23 +146,25 @@ async def get_floors(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[Floor]:
     """
     Get paginated list of floors.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of floors to return
+        after: Sort key of the last row of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[Floor]: List of Floor objects
     """
-    stmt = (
-        select(Floor)
-        .offset(offset)
-        .limit(limit)
-        .order_by(Floor.id)
+    stmt = paginate(
+        load_fields(select(Floor), Floor, fields, SORT_KEY),
+        SORT_KEY, offset, limit, after,
     )
     floors = await session.scalars(stmt)
     return floors.all()
@@ -207,24 +215,24 @@ async def get_floors_with_rooms(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Floor]:
     """
     Get paginated list of floors with rooms loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of floors to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Floor]: List of Floor objects with rooms
     """
-    stmt = (
+    stmt = paginate(
         select(Floor)
-        .options(selectinload(Floor.rooms))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Floor.id)
+        .options(selectinload(Floor.rooms)),
+        SORT_KEY, offset, limit, after,
     )
     floors = await session.scalars(stmt)
     return floors.all()
@@ -233,24 +241,24 @@ async def get_floors_with_building(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Floor]:
     """
     Get paginated list of floors with building loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of floors to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Floor]: List of Floor objects with building
     """
-    stmt = (
+    stmt = paginate(
         select(Floor)
-        .options(joinedload(Floor.building))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Floor.id)
+        .options(joinedload(Floor.building)),
+        SORT_KEY, offset, limit, after,
     )
     floors = await session.scalars(stmt)
     return floors.all()
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Offset, keyset and per-parent pagination shared by the list queries.
+"""
+
+from collections import defaultdict
+from typing import Any, Collection, Sequence, TypeVar
+
+from sqlalchemy import ColumnElement, Select, func, select, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+from sqlalchemy.orm.attributes import set_committed_value
+
+T = TypeVar("T", bound=tuple[Any, ...])
+
+Cursor = tuple[Any, ...]
+
+
+def paginate(
+        stmt: Select[T],
+        keys: Sequence[ColumnElement[Any]],
+        offset: int,
+        limit: int,
+        after: Cursor | None = None,
+        descending: bool = False,
+) -> Select[T]:
+    """
+    Order a query by its sort key and apply either keyset or offset pagination.
+
+    With `after` set, the query seeks straight past the sort key of the last
+    row of the previous page and `offset` is ignored, so every page costs the
+    same index range scan instead of reading and discarding `offset` rows. The
+    sort key must be unique (end it with the primary key) and should be
+    covered by an index in the same order.
+
+    Args:
+        stmt: Select to paginate, without ORDER BY, LIMIT or OFFSET
+        keys: Columns of the sort key
+        offset: Number of rows to skip, ignored when `after` is given
+        limit: Maximum number of rows to return
+        after: Sort key of the last row of the previous page
+        descending: Order by the sort key from highest to lowest
+
+    Returns:
+        Select: Paginated select
+
+    Raises:
+        ValueError: If `after` does not have one value per sort key column
+    """
+    stmt = stmt.order_by(*(key.desc() if descending else key for key in keys)).limit(limit)
+    if after is None:
+        return stmt.offset(offset)
+    if len(after) != len(keys):
+        raise ValueError(f"Cursor has {len(after)} values, expected {len(keys)}")
+    if len(keys) == 1:
+        column, value = keys[0], after[0]
+    else:
+        column, value = tuple_(*keys), tuple_(*after)
+    return stmt.where(column < value if descending else column > value)
+
+
+def next_cursor(rows: Sequence[Any], keys: Sequence[ColumnElement[Any]], limit: int) -> Cursor | None:
+    """
+    Get the cursor of the page after `rows`.
+
+    Returns:
+        Cursor | None: Sort key of the last row, None if this was the last page
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return tuple(getattr(last, key.key) for key in keys)
+
+
+def _top_n(
+        dialect_name: str,
+        relationship: InstrumentedAttribute[Any],
+        keys: Sequence[ColumnElement[Any]],
+        limit: int,
+        descending: bool,
+        parent_ids: Collection[Any],
+) -> Select[Any]:
+    """
+    Build a select of the first `limit` children of every parent in
+    `parent_ids`, grouped by parent and in sort key order.
+
+    MySQL joins every parent to a LATERAL subquery with its own ORDER BY and
+    LIMIT, which stops reading each parent's children at `limit` index
+    entries. Elsewhere (SQLite in tests) the children are ranked per parent
+    with ROW_NUMBER(), which reads all of them.
+    """
+    prop = relationship.property
+    child = prop.mapper.class_
+    [(local, remote)] = prop.local_remote_pairs
+    order_by = [key.desc() if descending else key for key in keys]
+
+    if dialect_name == "mysql":
+        parent = select(local).where(local.in_(parent_ids)).subquery()
+        top = select(child).where(remote == parent.c[local.key]).order_by(*order_by).limit(limit).lateral()
+        entity = aliased(child, top)
+        entity_keys = [getattr(entity, key.key) for key in keys]
+        return (
+            select(entity)
+            .select_from(parent)
+            .join(top, true())
+            .order_by(*(key.desc() if descending else key for key in entity_keys))
+        )
+
+    rank = func.row_number().over(partition_by=remote, order_by=order_by).label("rank")
+    ranked = select(child, rank).where(remote.in_(parent_ids)).subquery()
+    return select(aliased(child, ranked)).where(ranked.c.rank <= limit).order_by(ranked.c.rank)
+
+
+async def load_top_n(
+        session: AsyncSession,
+        parents: Sequence[Any],
+        relationship: InstrumentedAttribute[Any],
+        keys: Sequence[ColumnElement[Any]],
+        limit: int,
+        descending: bool = True,
+) -> None:
+    """
+    Load at most `limit` rows of a one-to-many collection for every parent.
+
+    Unlike `selectinload`, which reads every child of every parent, a single
+    query returns only the first `limit` children of each parent. The loaded
+    lists are set as the committed value of the collection, so they are
+    neither lazy-loaded again nor flushed as a change. The rest of the
+    collection is meant to be read from a paginated sub-resource.
+
+    Args:
+        session: Async database session
+        parents: Loaded parent objects
+        relationship: Collection to load, e.g. `User.access_logs`
+        keys: Columns of the children's sort key
+        limit: Maximum number of children per parent
+        descending: Keep the children with the highest sort key, e.g. the latest
+    """
+    if not parents:
+        return
+    prop = relationship.property
+    [(local, remote)] = prop.local_remote_pairs
+    parent_key = prop.parent.get_property_by_column(local).key
+    child_key = prop.mapper.get_property_by_column(remote).key
+
+    children = await session.scalars(_top_n(
+        session.get_bind().dialect.name,
+        relationship,
+        keys,
+        limit,
+        descending,
+        {getattr(parent, parent_key) for parent in parents},
+    ))
+
+    by_parent: defaultdict[Any, list[Any]] = defaultdict(list)
+    for item in children:
+        by_parent[getattr(item, child_key)].append(item)
+    for parent in parents:
+        set_committed_value(parent, prop.key, by_parent[getattr(parent, parent_key)])
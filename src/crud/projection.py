@@ -0,0 +1,38 @@
+"""
+Column projection for list queries.
+"""
+
+from typing import Any, Collection, Sequence, TypeVar
+
+from sqlalchemy import ColumnElement, Select
+from sqlalchemy.orm import load_only
+
+T = TypeVar("T", bound=tuple[Any, ...])
+
+
+def load_fields(
+        stmt: Select[T],
+        entity: type[Any],
+        fields: Collection[str] | None,
+        keys: Sequence[ColumnElement[Any]] = (),
+) -> Select[T]:
+    """
+    Load only some column attributes of the selected entity.
+
+    The primary key and the sort key columns in `keys` are always loaded, so
+    rows stay identifiable and pageable. Accessing any other attribute raises
+    instead of emitting a lazy load per row.
+
+    Args:
+        stmt: Select of `entity`
+        entity: Mapped class whose columns are loaded
+        fields: Names of the attributes to load, None to load all
+        keys: Columns that are loaded in any case
+
+    Returns:
+        Select: Select with the projection applied
+    """
+    if fields is None:
+        return stmt
+    columns = [getattr(entity, name) for name in fields]
+    return stmt.options(load_only(*columns, *keys, raiseload=True))
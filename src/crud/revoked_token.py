@@ -0,0 +1,66 @@
+"""
+CRUD operations for RevokedToken model with comprehensive error handling.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import delete
+from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import RevokedToken
+import src.crud.exceptions as exceptions
+
+async def revoke_token(
+        session: AsyncSession,
+        jti: str,
+        expires_at: datetime,
+) -> None:
+    """
+    Record a token as revoked. Revoking an already revoked token does nothing.
+    
+    Args:
+        session: Async database session
+        jti: Token ID (`jti` claim)
+        expires_at: Expiry of the token, after which the record can be removed
+        
+    Raises:
+        CreateException: If creation error occurs
+    """
+    try:
+        session.add(RevokedToken(jti=jti, expires_at=expires_at))
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+    except OperationalError as e:
+        raise exceptions.OperationalException(model_name="RevokedToken", original_exc=e)
+    except DatabaseError as e:
+        await session.rollback()
+        raise exceptions.CreateException(model_name="RevokedToken", original_exc=e) from e
+
+async def delete_expired_revoked_tokens(
+        session: AsyncSession,
+) -> int:
+    """
+    Delete revocation records of tokens that expired anyway.
+    
+    Args:
+        session: Async database session
+        
+    Returns:
+        int: Number of deleted records
+        
+    Raises:
+        DeleteException: If deletion fails
+    """
+    try:
+        result = await session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+        )
+        await session.commit()
+        return result.rowcount
+    except OperationalError as e:
+        raise exceptions.OperationalException(model_name="RevokedToken", original_exc=e)
+    except DatabaseError as e:
+        await session.rollback()
+        raise exceptions.DeleteException(model_name="RevokedToken", entity_id="expired", original_exc=e) from e
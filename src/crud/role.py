@@ -2,7 +2,7 @@
 CRUD operations for Role model with comprehensive error handling.
 """
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,12 +10,17 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 
 from src.models import Role
+from src.services.access_decision import access_engine
 from src.schemas.role import (
     RoleCreate,
     RoleUpdate,
     RoleUpdatePartical,
 )
 import src.crud.exceptions as exceptions
+from .pagination import Cursor, paginate
+from .projection import load_fields
+
+SORT_KEY = (Role.id,)
 
 
 async def create_role(
@@ -108,6 +113,7 @@ async def delete_role(
     try:
         await session.delete(role)
         await session.commit()
+        access_engine.remove_role(role.id)
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="Role", original_exc=e)
     except DatabaseError as e:
@@ -138,23 +144,25 @@ async def get_roles(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[Role]:
     """
     Get paginated list of roles.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of roles to return
+        after: Sort key of the last row of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[Role]: List of Role objects
     """
-    stmt = (
-        select(Role)
-        .offset(offset)
-        .limit(limit)
-        .order_by(Role.id)
+    stmt = paginate(
+        load_fields(select(Role), Role, fields, SORT_KEY),
+        SORT_KEY, offset, limit, after,
     )
     roles = await session.scalars(stmt)
     return roles.all()
@@ -205,24 +213,24 @@ async def get_roles_with_access_rules(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Role]:
     """
     Get paginated list of roles with access rules loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of roles to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Role]: List of Role objects with access rules
     """
-    stmt = (
+    stmt = paginate(
         select(Role)
-        .options(selectinload(Role.access_rules))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Role.id)
+        .options(selectinload(Role.access_rules)),
+        SORT_KEY, offset, limit, after,
     )
     roles = await session.scalars(stmt)
     return roles.all()
@@ -231,24 +239,24 @@ async def get_roles_with_users(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Role]:
     """
     Get paginated list of roles with users loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of roles to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Role]: List of Role objects with users
     """
-    stmt = (
+    stmt = paginate(
         select(Role)
-        .options(selectinload(Role.users))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Role.id)
+        .options(selectinload(Role.users)),
+        SORT_KEY, offset, limit, after,
     )
     roles = await session.scalars(stmt)
     return roles.all()
\ No newline at end of file
@@ -2,20 +2,27 @@
 CRUD operations for Room model with comprehensive error handling.
 """
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy import select
 
-from src.models import Room
+from src.core.config import settings
+from src.models import Floor, Room
+from src.services.occupancy import occupancy
 from src.schemas.room import (
     RoomCreate,
     RoomUpdate,
     RoomUpdatePartical
 )
 import src.crud.exceptions as exceptions
+from .access_log import SORT_KEY as ACCESS_LOG_SORT_KEY
+from .pagination import Cursor, load_top_n, paginate
+from .projection import load_fields
+
+SORT_KEY = (Room.id,)
 
 async def create_room(
         session: AsyncSession, 
@@ -40,6 +47,8 @@ async def create_room(
         session.add(room)
         await session.commit()
         await session.refresh(room)
+        building_id = await session.scalar(select(Floor.building_id).where(Floor.id == room.floor_id))
+        occupancy.add_room(room.id, room.floor_id, building_id)
         return room
     except IntegrityError as e:
         await session.rollback()
@@ -79,6 +88,7 @@ async def update_room(
             setattr(room, name, value)
         await session.commit()
         await session.refresh(room)
+        occupancy.invalidate()
         return room
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="Room", original_exc=e)
@@ -138,24 +148,26 @@ async def get_room(
 async def get_rooms(
         session: AsyncSession, 
         offset: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        after: Cursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[Room]:
     """
     Get paginated list of rooms.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rooms to return
+        after: Sort key of the last row of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[Room]: List of Room objects
     """
-    stmt = (
-        select(Room)
-        .offset(offset)
-        .limit(limit)
-        .order_by(Room.id)
+    stmt = paginate(
+        load_fields(select(Room), Room, fields, SORT_KEY),
+        SORT_KEY, offset, limit, after,
     )
     rooms = await session.scalars(stmt)
     return rooms.all()
@@ -184,24 +196,24 @@ async def get_room_with_floor(
 
 async def get_room_with_access_logs(
         session: AsyncSession,
-        room_id: int
+        room_id: int,
+        access_logs_limit: int = settings.pagination.nested_page_size,
 ) -> Room | None:
     """
-    Get room with access logs loaded.
+    Get room with its latest access logs loaded.
     
     Args:
         session: Async database session
         room_id: ID of room to retrieve
+        access_logs_limit: Maximum number of access logs to load
         
     Returns:
         Room | None: Room object with access logs if found, None otherwise
     """
-    stmt = (
-        select(Room)
-        .where(Room.id == room_id)
-        .options(selectinload(Room.access_logs))
-    )
-    return await session.scalar(stmt)
+    room = await session.get(Room, room_id)
+    if room is not None:
+        await load_top_n(session, [room], Room.access_logs, ACCESS_LOG_SORT_KEY, access_logs_limit)
+    return room
 
 
 async def get_room_with_access_rules(
@@ -252,24 +264,24 @@ async def get_rooms_with_access_rules(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Room]:
     """
     Get paginated list of rooms with access rules loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rooms to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Room]: List of Room objects with access rules
     """
-    stmt = (
+    stmt = paginate(
         select(Room)
-        .options(selectinload(Room.access_rules))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Room.id)
+        .options(selectinload(Room.access_rules)),
+        SORT_KEY, offset, limit, after,
     )
     rooms = await session.scalars(stmt)
     return rooms.all()
@@ -279,51 +291,53 @@ async def get_rooms_with_access_logs(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        access_logs_limit: int = settings.pagination.nested_page_size,
 ) -> Sequence[Room]:
     """
-    Get paginated list of rooms with access logs loaded.
+    Get paginated list of rooms with their latest access logs loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rooms to return
+        after: Sort key of the last row of the previous page
+        access_logs_limit: Maximum number of access logs to load per room
         
     Returns:
         Sequence[Room]: List of Room objects with access logs
     """
-    stmt = (
-        select(Room)
-        .options(selectinload(Room.access_logs))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Room.id)
+    stmt = paginate(
+        select(Room),
+        SORT_KEY, offset, limit, after,
     )
-    rooms = await session.scalars(stmt)
-    return rooms.all()
+    rooms = (await session.scalars(stmt)).all()
+    await load_top_n(session, rooms, Room.access_logs, ACCESS_LOG_SORT_KEY, access_logs_limit)
+    return rooms
 
 
 async def get_rooms_with_current_presence(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Room]:
     """
     Get paginated list of rooms with current presence loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rooms to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Room]: List of Room objects with current presence
     """
-    stmt = (
+    stmt = paginate(
         select(Room)
-        .options(selectinload(Room.current_presence))
-        .offset(offset)
-        .limit(limit)
-        .order_by(Room.id)
+        .options(selectinload(Room.current_presence)),
+        SORT_KEY, offset, limit, after,
     )
     rooms = await session.scalars(stmt)
     return rooms.all()
@@ -333,23 +347,24 @@ async def get_rooms_with_floor(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[Room]:
     """
     Get paginated list of rooms with floor information loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of rooms to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[Room]: List of Room objects with floor information
     """
-    stmt = (
+    stmt = paginate(
         select(Room)
-        .options(joinedload(Room.floor))
-        .offset(offset)
-        .limit(limit)
+        .options(joinedload(Room.floor)),
+        SORT_KEY, offset, limit, after,
     )
     rooms = await session.scalars(stmt)
     return rooms.all()
\ No newline at end of file
@@ -2,7 +2,7 @@
 CRUD operations for User model with comprehensive error handling.
 """
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from sqlalchemy.exc import DatabaseError, IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,14 +10,23 @@ from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy import select
 from pydantic import EmailStr
 
+from src.auth.hasher import password_hasher
+from src.auth.principals import invalidate_principal
 from src.auth.utils import hash_password
+from src.core.config import settings
 from src.models import User
+from src.services.access_decision import access_engine
 from src.schemas.user import (
     UserCreate,
     UserUpdate,
     UserUpdatePatrical,
 )
 import src.crud.exceptions as exceptions
+from .access_log import SORT_KEY as ACCESS_LOG_SORT_KEY
+from .pagination import Cursor, load_top_n, paginate
+from .projection import load_fields
+
+SORT_KEY = (User.id,)
 
 async def create_user(
         user_in: UserCreate, 
@@ -39,7 +48,7 @@ async def create_user(
     """
     try:
         user = User(**user_in.model_dump(exclude={"password"}))
-        user.password_hash = hash_password(user_in.password)
+        user.password_hash = await password_hasher.run(hash_password, user_in.password)
         session.add(user)
         await session.commit()
         await session.refresh(user)
@@ -78,13 +87,15 @@ async def update_user(
         UpdateException: If update operation fails
     """
     try:
+        previous_email = user.email
         for name, value in user_in.model_dump(exclude_none=partial).items():
             if name == "password":
                 name = "password_hash"
-                value = hash_password(value)
+                value = await password_hasher.run(hash_password, value)
             setattr(user, name, value)
         await session.commit()
         await session.refresh(user)
+        invalidate_principal(previous_email, user.email)
         return user
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="User", original_exc=e)
@@ -97,6 +108,41 @@ async def update_user(
         ) from e
 
 
+async def update_password_hash(
+        session: AsyncSession,
+        user: User,
+        password_hash: str,
+) -> User:
+    """
+    Replace the stored password hash, e.g. after rehashing with a new work factor.
+    
+    Args:
+        session: Async database session
+        user: User object to update
+        password_hash: New password hash
+        
+    Returns:
+        User: Updated User object
+        
+    Raises:
+        UpdateException: If update operation fails
+    """
+    user_id = user.id
+    try:
+        user.password_hash = password_hash
+        await session.commit()
+        return user
+    except OperationalError as e:
+        raise exceptions.OperationalException(model_name="User", original_exc=e)
+    except DatabaseError as e:
+        await session.rollback()
+        raise exceptions.UpdateException(
+            model_name="User",
+            entity_id=user_id,
+            original_exc=e
+        ) from e
+
+
 async def delete_user(
         session: AsyncSession, 
         user: User
@@ -114,6 +160,8 @@ async def delete_user(
     try:
         await session.delete(user)
         await session.commit()
+        access_engine.remove_user(user.id)
+        invalidate_principal(user.email)
     except OperationalError as e:
         raise exceptions.OperationalException(model_name="User", original_exc=e)
     except DatabaseError as e:
@@ -146,23 +194,25 @@ async def get_users(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        fields: Collection[str] | None = None,
 ) -> Sequence[User]:
     """
     Get paginated list of users.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of users to return
+        after: Sort key of the last row of the previous page
+        fields: Attributes to load, all when None
         
     Returns:
         Sequence[User]: List of User objects
     """
-    stmt = (
-        select(User)
-        .offset(offset)
-        .limit(limit)
-        .order_by(User.id)
+    stmt = paginate(
+        load_fields(select(User), User, fields, SORT_KEY),
+        SORT_KEY, offset, limit, after,
     )
     users = await session.scalars(stmt)
     return users.all()
@@ -189,19 +239,23 @@ async def get_user_with_roles(
 async def get_user_with_accesslogs(
         session: AsyncSession,
         user_id: int,
+        access_logs_limit: int = settings.pagination.nested_page_size,
 ) -> User | None:
     """
-    Get user with their access logs loaded.
+    Get user with their latest access logs loaded.
     
     Args:
         session: Async database session
         user_id: ID of user to retrieve
+        access_logs_limit: Maximum number of access logs to load
         
     Returns:
         User | None: User object with access logs if found, None otherwise
     """
-    stmt = select(User).where(User.id == user_id).options(selectinload(User.access_logs))
-    return await session.scalar(stmt)
+    user = await session.get(User, user_id)
+    if user is not None:
+        await load_top_n(session, [user], User.access_logs, ACCESS_LOG_SORT_KEY, access_logs_limit)
+    return user
 
 
 async def get_user_with_current_presence(
@@ -226,24 +280,24 @@ async def get_users_with_roles(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[User]:
     """
     Get paginated list of users with their roles loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of users to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[User]: List of User objects with roles
     """
-    stmt = (
+    stmt = paginate(
         select(User)
-        .options(selectinload(User.roles))
-        .offset(offset)
-        .limit(limit)
-        .order_by(User.id)
+        .options(selectinload(User.roles)),
+        SORT_KEY, offset, limit, after,
     )
     users = await session.scalars(stmt)
     return users.all()
@@ -253,51 +307,53 @@ async def get_users_with_access_logs(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
+        access_logs_limit: int = settings.pagination.nested_page_size,
 ) -> Sequence[User]:
     """
-    Get paginated list of users with their access logs loaded.
+    Get paginated list of users with their latest access logs loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of users to return
+        after: Sort key of the last row of the previous page
+        access_logs_limit: Maximum number of access logs to load per user
         
     Returns:
         Sequence[User]: List of User objects with access logs
     """
-    stmt = (
-        select(User)
-        .options(selectinload(User.access_logs))
-        .offset(offset)
-        .limit(limit)
-        .order_by(User.id)
+    stmt = paginate(
+        select(User),
+        SORT_KEY, offset, limit, after,
     )
-    users = await session.scalars(stmt)
-    return users.all()
+    users = (await session.scalars(stmt)).all()
+    await load_top_n(session, users, User.access_logs, ACCESS_LOG_SORT_KEY, access_logs_limit)
+    return users
 
 
 async def get_users_with_current_presence(
         session: AsyncSession,
         offset: int = 0,
         limit: int = 100,
+        after: Cursor | None = None,
 ) -> Sequence[User]:
     """
     Get paginated list of users with their current presence loaded.
     
     Args:
         session: Async database session
-        offset: Pagination offset
+        offset: Pagination offset, ignored when `after` is given
         limit: Maximum number of users to return
+        after: Sort key of the last row of the previous page
         
     Returns:
         Sequence[User]: List of User objects with current presence
     """
-    stmt = (
+    stmt = paginate(
         select(User)
-        .options(joinedload(User.current_presence))
-        .offset(offset)
-        .limit(limit)
-        .order_by(User.id)
+        .options(joinedload(User.current_presence)),
+        SORT_KEY, offset, limit, after,
     )
     users = await session.scalars(stmt)
     return users.all()
@@ -318,4 +374,5 @@ async def get_user_by_email(
         User | None: User object if found, None otherwise
     """
     stmt = select(User).where(User.email == email)
-    return await session.scalar(stmt)
\ No newline at end of file
+    return await session.scalar(stmt)
+
@@ -21,4 +21,7 @@ AsyncSessionFactory = async_sessionmaker(
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionFactory() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return AsyncSessionFactory
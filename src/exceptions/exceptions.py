@@ -29,3 +29,29 @@ class NotFoundException(AppException):
             log_error=False,
         )
 
+
+class ServiceUnavailableException(AppException):
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            log_error=False,
+        )
+
+
+class InvalidCursorException(AppException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+            log_error=False,
+        )
+
+
+class InvalidFieldsException(AppException):
+    def __init__(self, fields: list[str]):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(fields)}" if fields else "No fields selected",
+            log_error=False,
+        )
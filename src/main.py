@@ -1,3 +1,5 @@
+import asyncio
+import signal
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -7,15 +9,36 @@ from fastapi.responses import PlainTextResponse
 from src.core.config import settings
 from src.api import api_router
 from src.database.core import engine
+from src.services.access_log_buffer import access_log_buffer
+from src.services.events import event_hub
 from src.auth.controller import router as auth_router
+from src.auth.hasher import password_hasher
+from src.auth.keys import key_manager
 from src.exceptions.handlers import register_exception_handlers
 from src.logger import setup_logger
 
 setup_logger("MainApp")
 
+def install_sighup_handler(callback) -> bool:
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, callback)
+        return True
+    except (AttributeError, NotImplementedError, RuntimeError):
+        # No SIGHUP on Windows, and no signal handlers outside the main thread.
+        return False
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    key_manager.load()
+    reload_keys_on_sighup = install_sighup_handler(key_manager.reload)
+    if settings.access_log.write_behind:
+        access_log_buffer.start()
     yield
+    if reload_keys_on_sighup:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+    event_hub.close()
+    await access_log_buffer.stop()
+    await password_hasher.shutdown()
     await engine.dispose()
 
 
@@ -9,6 +9,7 @@ __all__ = (
     "AccessLog",
     "CurrentPresence",
     "UserRoleAssociation",
+    "RevokedToken",
 )
 
 from .base import Base
@@ -20,4 +21,5 @@ from .access_rule import AccessRule
 from .user import User
 from .access_log import AccessLog
 from .current_presence import CurrentPresence
-from .user_role_association import UserRoleAssociation
\ No newline at end of file
+from .user_role_association import UserRoleAssociation
+from .revoked_token import RevokedToken
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey
+from sqlalchemy import Enum, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -13,10 +13,19 @@ if TYPE_CHECKING:
 
 
 class AccessLog(Base, IntIdPkMixin, TimestampMixin):
+    # In MySQL the table is partitioned by month on `timestamp`, which rules out
+    # foreign key constraints; the ForeignKeys below only describe the relations
+    # for the ORM and the test schema.
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     room_id: Mapped[int] = mapped_column(ForeignKey("rooms.id"))
     action: Mapped[Action] = mapped_column(Enum(Action, name="action_enum"))
     access_allowed: Mapped[bool] = mapped_column(default=True, server_default="1")
 
+    __table_args__ = (
+        Index("ix_access_logs_timestamp_id", "timestamp", "id"),
+        Index("ix_access_logs_user_id_timestamp", "user_id", "timestamp"),
+        Index("ix_access_logs_room_id_timestamp", "room_id", "timestamp"),
+    )
+
     room: Mapped["Room"] = relationship(back_populates="access_logs")
     user: Mapped["User"] = relationship(back_populates="access_logs")
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 
 from .base import Base
 from .mixins import IntIdPkMixin, TimestampMixin
@@ -13,9 +13,12 @@ if TYPE_CHECKING:
 
 class CurrentPresence(Base, IntIdPkMixin, TimestampMixin):
     __tablename__ = "current_presence" # type: ignore
+    __table_args__ = (
+        Index("ix_current_presence_timestamp_id", "timestamp", "id"),
+    )
 
     room_id: Mapped[int] = mapped_column(ForeignKey("rooms.id"))
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), unique=True)
 
     room: Mapped["Room"] = relationship(back_populates="current_presence")
     user: Mapped["User"] = relationship(back_populates="current_presence")
\ No newline at end of file
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .mixins import IntIdPkMixin, TimestampMixin
+
+
+class RevokedToken(Base, IntIdPkMixin, TimestampMixin):
+    # `timestamp` is the revocation time, workers pick up new revocations by it.
+    __table_args__ = (
+        Index("ix_revoked_tokens_timestamp", "timestamp"),
+    )
+
+    jti: Mapped[str] = mapped_column(String(32), unique=True)
+    expires_at: Mapped[datetime] = mapped_column(index=True)
@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Annotated
+
+from annotated_types import Ge, MaxLen, MinLen
+from pydantic import BaseModel
+
+from src.core.config import settings
+
+
+class AccessDecision(BaseModel):
+    user_id: int
+    room_id: int
+    timestamp: datetime
+    access_allowed: bool
+
+
+class AccessCheck(BaseModel):
+    user_id: Annotated[int, Ge(1)]
+    room_id: Annotated[int, Ge(1)]
+    timestamp: datetime
+
+class AccessCheckBatch(BaseModel):
+    checks: Annotated[list[AccessCheck], MinLen(1), MaxLen(settings.access_engine.max_batch_size)]
+
+class AccessDecisionBatch(BaseModel):
+    decisions: list[bool]
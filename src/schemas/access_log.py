@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
 from src.constants import Action
 from .general_schemas import User, Room
@@ -23,10 +24,44 @@ class AccessLogUpdatePartical(BaseModel):
     action: Action|None = None
     access_allowed: bool|None = None
 
+class AccessLogImport(AccessLogCreate):
+    timestamp: datetime|None = None
+
+class AccessLogImportChunk(BaseModel):
+    first_line: int
+    last_line: int
+    inserted: int
+
+class AccessLogImportRejected(BaseModel):
+    line: int
+    error: str
+
+class AccessLogImportResult(BaseModel):
+    inserted: int = 0
+    chunks: list[AccessLogImportChunk] = []
+    rejected: list[AccessLogImportRejected] = []
+
+class AccessLogQueued(AccessLogBase):
+    timestamp: datetime
+
+class AccessLogFilter(BaseModel):
+    user_id: int|None = None
+    room_id: int|None = None
+    action: Action|None = None
+    access_allowed: bool|None = None
+    since: datetime|None = None
+    until: datetime|None = None
+
 class AccessLogOut(AccessLogBase):
     id: int
     timestamp: datetime
 
+# AccessLogOut as a plain dict, serialized straight from database rows.
+AccessLogRow = TypedDict(  # type: ignore[misc]
+    "AccessLogRow",
+    {name: field.annotation for name, field in AccessLogOut.model_fields.items()},
+)
+
 class AccessLogWithUser(AccessLogOut):
     user: User
 
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.constants import Action, EventType
+
+
+class EventOut(BaseModel):
+    type: EventType
+    user_id: int
+    room_id: int
+    floor_id: int|None = None
+    building_id: int|None = None
+    timestamp: datetime
+    access_log_id: int|None = None
+    action: Action|None = None
+    access_allowed: bool|None = None
+    present: bool|None = None
+
+class EventFilter(BaseModel):
+    type: EventType|None = None
+    building_id: int|None = None
+    floor_id: int|None = None
+    room_id: int|None = None
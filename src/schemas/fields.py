@@ -0,0 +1,21 @@
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+
+@lru_cache(maxsize=None)
+def narrow(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """
+    Build a copy of `model` with only the given fields, keeping their types
+    and constraints. Each field set is built once.
+    """
+    return create_model(  # type: ignore[call-overload]
+        f"{model.__name__}Fields",
+        **{name: (info.annotation, info) for name, info in model.model_fields.items() if name in fields},
+    )
+
+
+@lru_cache(maxsize=None)
+def adapter(tp: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
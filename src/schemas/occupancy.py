@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class OccupancyOut(BaseModel):
+    rooms: dict[int, int]
+    floors: dict[int, int]
+    buildings: dict[int, int]
+
+class OccupancyCount(BaseModel):
+    id: int
+    count: int
@@ -0,0 +1,46 @@
+from typing import Any, Generic, Sequence, TypeVar
+
+from pydantic import BaseModel, ValidationInfo
+
+from src.core.config import settings
+from src.utils.cursor import encode_cursor
+
+T = TypeVar("T")
+
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def nested_limit(info: ValidationInfo, collection: str) -> int | None:
+    """
+    Limit an embedded collection was loaded with.
+
+    Routes pass it as the `<collection>_limit` key of the validation context,
+    e.g. `model_validate(user, from_attributes=True, context={"access_logs_limit": 10})`.
+
+    Returns:
+        int | None: The limit, None if the model was validated without one
+    """
+    return (info.context or {}).get(f"{collection}_limit")
+
+
+def nested_next_url(path: str, items: Sequence[Any], limit: int, *keys: str) -> str | None:
+    """
+    Link to the rest of a collection embedded with at most `limit` items.
+
+    Args:
+        path: Path of the paginated sub-resource below the API prefix
+        items: Embedded items, in the sub-resource's order
+        limit: Maximum number of items the collection was loaded with
+        keys: Attributes of the sub-resource's sort key
+
+    Returns:
+        str | None: URL of the page after `items`, None if the collection is complete
+    """
+    if len(items) < limit:
+        return None
+    cursor = encode_cursor(*(getattr(items[-1], key) for key in keys))
+    return f"{settings.api.prefix}{path}?cursor={cursor}"
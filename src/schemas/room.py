@@ -1,7 +1,7 @@
 from typing import Annotated
 
 from annotated_types import MaxLen, MinLen
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationInfo, model_validator
 
 from .general_schemas import (
     AccessLog,
@@ -9,6 +9,7 @@ from .general_schemas import (
     Floor,
     AccessRule,
 )
+from .pagination import nested_limit, nested_next_url
 
 class RoomBase(BaseModel):
     floor_id: int
@@ -32,6 +33,15 @@ class RoomWithFloor(RoomOut):
 
 class RoomWithAccessLogs(RoomOut):
     access_logs: list[AccessLog]
+    access_logs_next: str | None = None
+
+    @model_validator(mode="after")
+    def link_access_logs(self, info: ValidationInfo) -> "RoomWithAccessLogs":
+        if (limit := nested_limit(info, "access_logs")) is not None:
+            self.access_logs_next = nested_next_url(
+                f"/rooms/{self.id}/access-logs", self.access_logs, limit, "timestamp", "id",
+            )
+        return self
 
 class RoomWithAccessRules(RoomOut):
     access_rules: list[AccessRule]
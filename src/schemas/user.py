@@ -1,13 +1,14 @@
 from typing import Annotated
 
 from annotated_types import MaxLen, MinLen
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ValidationInfo, model_validator, EmailStr
 
 from .general_schemas import (
     Role,
     AccessLog,
     CurrentPresence,
 )
+from .pagination import nested_limit, nested_next_url
 
 
 str_max32_min3 = Annotated[str, MaxLen(32), MinLen(3)]
@@ -42,6 +43,15 @@ class UserWithRoles(UserOut):
 
 class UserWithAccessLogs(UserOut):
     access_logs: list[AccessLog]
+    access_logs_next: str | None = None
+
+    @model_validator(mode="after")
+    def link_access_logs(self, info: ValidationInfo) -> "UserWithAccessLogs":
+        if (limit := nested_limit(info, "access_logs")) is not None:
+            self.access_logs_next = nested_next_url(
+                f"/user/{self.id}/access-logs", self.access_logs, limit, "timestamp", "id",
+            )
+        return self
 
 class UserWithCurrentPresence(UserOut):
     current_presence: CurrentPresence
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""
+In-process access decision engine compiled from AccessRule and UserRoleAssociation rows.
+"""
+
+from datetime import datetime, time, tzinfo
+from typing import Iterable, Protocol, Sequence
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models import AccessRule, UserRoleAssociation
+from .reloadable import ReloadableIndex, patch
+
+RuleKey = tuple[int, int]
+TimeWindow = tuple[time, time]
+
+
+class AccessQuery(Protocol):
+    user_id: int
+    room_id: int
+    timestamp: datetime
+
+
+def is_within_window(moment: time, window: TimeWindow) -> bool:
+    """
+    Check whether a time of day falls into an access rule window.
+
+    Windows whose `time_from` is later than `time_to` wrap over midnight
+    (e.g. 22:00-06:00 for a night shift).
+
+    Args:
+        moment: Time of day to check
+        window: (time_from, time_to) pair, both bounds inclusive
+
+    Returns:
+        bool: True if moment is inside the window
+    """
+    time_from, time_to = window
+    if time_from <= time_to:
+        return time_from <= moment <= time_to
+    return moment >= time_from or moment <= time_to
+
+
+class AccessDecisionEngine(ReloadableIndex):
+    """
+    Answers "may user U enter room R at time T" from an in-memory index.
+
+    The index maps (room_id, role_id) to the rule's time window and user_id to
+    the user's role ids. It is loaded lazily on first use, reloaded every
+    `reload_interval` seconds so changes made by other workers are picked up,
+    and patched incrementally by the CRUD functions of this process after
+    they commit.
+
+    Rule windows are wall-clock times of the site, so aware moments are
+    converted to the site time zone before their time of day is compared;
+    naive moments are taken as site time.
+    """
+
+    def __init__(
+            self,
+            reload_interval: float = settings.access_engine.reload_interval_seconds,
+            site_timezone: tzinfo = ZoneInfo(settings.access_engine.timezone),
+    ):
+        super().__init__(reload_interval)
+        self.site_timezone = site_timezone
+        self._windows: dict[RuleKey, TimeWindow] = {}
+        self._rule_keys: dict[int, RuleKey] = {}
+        self._user_roles: dict[int, frozenset[int]] = {}
+
+    async def _read(self, session: AsyncSession) -> tuple[Sequence[Row], Sequence[Row]]:
+        rules = (await session.execute(
+            select(AccessRule.id, AccessRule.room_id, AccessRule.role_id, AccessRule.time_from, AccessRule.time_to)
+        )).all()
+        associations = (await session.execute(
+            select(UserRoleAssociation.user_id, UserRoleAssociation.role_id)
+        )).all()
+        return rules, associations
+
+    def _apply(self, snapshot: tuple[Sequence[Row], Sequence[Row]]) -> None:
+        rules, associations = snapshot
+        windows: dict[RuleKey, TimeWindow] = {}
+        rule_keys: dict[int, RuleKey] = {}
+        for rule_id, room_id, role_id, time_from, time_to in rules:
+            windows[(room_id, role_id)] = (time_from, time_to)
+            rule_keys[rule_id] = (room_id, role_id)
+
+        user_roles: dict[int, set[int]] = {}
+        for user_id, role_id in associations:
+            user_roles.setdefault(user_id, set()).add(role_id)
+
+        self._windows = windows
+        self._rule_keys = rule_keys
+        self._user_roles = {user_id: frozenset(roles) for user_id, roles in user_roles.items()}
+
+    def is_allowed(self, user_id: int, room_id: int, at: datetime | time) -> bool:
+        """
+        Decide whether a user may enter a room at the given moment.
+
+        Args:
+            user_id: ID of the user
+            room_id: ID of the room
+            at: Moment of the swipe (only the time of day in the site time zone is taken into account)
+
+        Returns:
+            bool: True if any of the user's roles has a matching access rule
+        """
+        if isinstance(at, datetime):
+            moment = (at if at.tzinfo is None else at.astimezone(self.site_timezone)).time()
+        else:
+            moment = at
+        for role_id in self._user_roles.get(user_id, ()):
+            window = self._windows.get((room_id, role_id))
+            if window is not None and is_within_window(moment, window):
+                return True
+        return False
+
+    def check_many(self, queries: Iterable[AccessQuery]) -> list[bool]:
+        """
+        Decide a batch of swipes in one pass over the index.
+
+        Args:
+            queries: Objects with user_id, room_id and timestamp attributes
+
+        Returns:
+            list[bool]: Decisions in the same order as the queries
+        """
+        return [self.is_allowed(query.user_id, query.room_id, query.timestamp) for query in queries]
+
+    def add_rule(self, access_rule: AccessRule) -> None:
+        """Insert or replace a compiled access rule."""
+        self._set_rule(
+            access_rule.id, (access_rule.room_id, access_rule.role_id),
+            (access_rule.time_from, access_rule.time_to),
+        )
+
+    @patch
+    def remove_rule(self, access_rule_id: int) -> None:
+        """Remove a compiled access rule."""
+        self._drop_rule(access_rule_id)
+
+    @patch
+    def remove_role(self, role_id: int) -> None:
+        """Remove every rule and user assignment that refers to a role."""
+        for rule_id, (_, rule_role_id) in list(self._rule_keys.items()):
+            if rule_role_id == role_id:
+                self._drop_rule(rule_id)
+        for user_id, roles in list(self._user_roles.items()):
+            if role_id in roles:
+                self._user_roles[user_id] = roles - {role_id}
+
+    @patch
+    def set_user_roles(self, user_id: int, role_ids: Iterable[int]) -> None:
+        """Replace the set of roles assigned to a user."""
+        self._user_roles[user_id] = frozenset(role_ids)
+
+    @patch
+    def remove_user(self, user_id: int) -> None:
+        """Forget every role assignment of a user."""
+        self._user_roles.pop(user_id, None)
+
+    @patch
+    def _set_rule(self, access_rule_id: int, key: RuleKey, window: TimeWindow) -> None:
+        self._drop_rule(access_rule_id)
+        self._windows[key] = window
+        self._rule_keys[access_rule_id] = key
+
+    def _drop_rule(self, access_rule_id: int) -> None:
+        key = self._rule_keys.pop(access_rule_id, None)
+        if key is not None:
+            self._windows.pop(key, None)
+
+
+access_engine = AccessDecisionEngine()
@@ -0,0 +1,166 @@
+"""
+Write-behind buffer that batches access log inserts.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.crud import access_log as crud
+from src.database.core import AsyncSessionFactory
+from src.exceptions.exceptions import ServiceUnavailableException
+from src.schemas.access_log import AccessLogCreate, AccessLogQueued
+from .events import event_hub
+
+logger = logging.getLogger("MainApp")
+
+_STOP = None
+
+
+class AccessLogBuffer:
+    """
+    Collects access log entries in memory and flushes them in batches.
+
+    A background task writes a batch with a single multi-row INSERT as soon as
+    `batch_size` entries are collected or `flush_interval` seconds passed since
+    the first entry of the batch arrived. At most `max_pending` entries are kept
+    in memory; when the buffer is full, producers wait up to `enqueue_timeout`
+    seconds and are then rejected with 503.
+
+    Entries were already acknowledged, so a batch that fails to be written is
+    retried with exponential backoff between `retry_initial` and `retry_max`
+    seconds. Meanwhile new entries pile up in the queue until it is full and
+    producers are rejected, which bounds the memory held during an outage.
+    Entries with invalid references are dropped; a batch still failing when
+    the buffer is stopped is dropped after one more attempt.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession] = AsyncSessionFactory,
+            batch_size: int = settings.access_log.batch_size,
+            flush_interval: float = settings.access_log.flush_interval_ms / 1000,
+            max_pending: int = settings.access_log.max_pending,
+            enqueue_timeout: float = settings.access_log.enqueue_timeout_ms / 1000,
+            retry_initial: float = settings.access_log.flush_retry_initial_ms / 1000,
+            retry_max: float = settings.access_log.flush_retry_max_ms / 1000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.enqueue_timeout = enqueue_timeout
+        self.retry_initial = retry_initial
+        self.retry_max = retry_max
+        self._queue: asyncio.Queue[dict[str, Any] | None] | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(self._queue))
+
+    async def stop(self) -> None:
+        """Flush everything that is still buffered and stop the flush task."""
+        if self._task is None or self._queue is None:
+            return
+        self._stopping.set()
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def enqueue(self, access_log_in: AccessLogCreate) -> AccessLogQueued:
+        """
+        Put an access log entry into the buffer.
+
+        The timestamp is taken at enqueue time, so it reflects the moment of the
+        event rather than the moment of the flush.
+
+        Args:
+            access_log_in: AccessLogCreate schema with log data
+
+        Returns:
+            AccessLogQueued: Accepted entry
+
+        Raises:
+            ServiceUnavailableException: If the buffer stays full for enqueue_timeout
+        """
+        if self._queue is None:
+            raise ServiceUnavailableException("Access log buffer is not running")
+        row = access_log_in.model_dump()
+        row["timestamp"] = datetime.now(timezone.utc)
+        try:
+            await asyncio.wait_for(self._queue.put(row), timeout=self.enqueue_timeout)
+        except TimeoutError:
+            raise ServiceUnavailableException("Access log buffer is full, retry later")
+        return AccessLogQueued(**row)
+
+    async def _run(self, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                batch.append(row)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[dict[str, Any]]) -> None:
+        delay = self.retry_initial
+        while True:
+            try:
+                async with self.session_factory() as session:
+                    await event_hub.locate(session, {row["room_id"] for row in batch})
+                    rejected = await crud.create_access_logs_skip_invalid(session, batch)
+                break
+            except Exception as e:
+                if self._stopping.is_set():
+                    logger.error("Dropped %d buffered access logs on shutdown", len(batch), exc_info=e)
+                    return
+                logger.error(
+                    "Failed to flush %d buffered access logs, retrying in %.1fs", len(batch), delay, exc_info=e,
+                )
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except TimeoutError:
+                pass
+            delay = min(delay * 2, self.retry_max)
+
+        if rejected:
+            logger.warning("Dropped %d buffered access logs with invalid references", len(rejected))
+        rejected_positions = set(rejected)
+        for position, row in enumerate(batch):
+            if position not in rejected_positions:
+                event_hub.publish_access_log(**row)
+
+access_log_buffer = AccessLogBuffer()
@@ -0,0 +1,71 @@
+"""
+Streaming CSV and NDJSON export of access logs.
+"""
+
+import csv
+import io
+import json
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.constants import ExportFormat
+from src.crud import access_log as crud
+from src.schemas.access_log import AccessLogFilter
+
+COLUMNS = ("id", "user_id", "room_id", "action", "access_allowed", "timestamp")
+
+MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+
+def _values(row: Row) -> tuple:
+    access_log_id, user_id, room_id, action, access_allowed, timestamp = row
+    return access_log_id, user_id, room_id, str(action), access_allowed, timestamp.isoformat()
+
+
+def encode_csv(rows: Sequence[Row]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(_values(row) for row in rows)
+    return buffer.getvalue().encode()
+
+
+def encode_ndjson(rows: Sequence[Row]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(COLUMNS, _values(row))), separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode()
+
+
+async def export_access_logs(
+        session_factory: async_sessionmaker[AsyncSession],
+        filters: AccessLogFilter,
+        export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """
+    Yield encoded access logs batch by batch.
+
+    The generator owns its session, because it keeps reading after the
+    request handler (and its request-scoped session) has returned.
+
+    Args:
+        session_factory: Factory for the session used while streaming
+        filters: Conditions the logs must match
+        export_format: Output encoding
+
+    Yields:
+        bytes: Encoded chunk of rows
+    """
+    if export_format == ExportFormat.csv:
+        yield (",".join(COLUMNS) + "\r\n").encode()
+        encode = encode_csv
+    else:
+        encode = encode_ndjson
+
+    async with session_factory() as session:
+        async for rows in crud.stream_access_logs(session, filters):
+            yield encode(rows)
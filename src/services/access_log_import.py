@@ -0,0 +1,124 @@
+"""
+Streaming NDJSON import of access log entries.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.crud import access_log as crud
+from src.schemas.access_log import (
+    AccessLogImport,
+    AccessLogImportChunk,
+    AccessLogImportRejected,
+    AccessLogImportResult,
+)
+
+
+async def iter_lines(stream: AsyncIterable[bytes], max_line_length: int) -> AsyncIterator[bytes | None]:
+    """
+    Split a byte stream into lines without waiting for the whole body.
+
+    At most `max_line_length` bytes of an unfinished line are buffered; the
+    rest of a longer line is discarded as it arrives.
+
+    Args:
+        stream: Body chunks as they arrive
+        max_line_length: Maximum length of a line in bytes
+
+    Yields:
+        bytes | None: Lines without the trailing newline, None for a line that was too long
+    """
+    tail = b""
+    too_long = False
+    async for chunk in stream:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield None if too_long or len(line) > max_line_length else line
+            too_long = False
+        if len(tail) > max_line_length:
+            tail = b""
+            too_long = True
+    if too_long:
+        yield None
+    elif tail:
+        yield tail
+
+
+def _describe(error: ValidationError) -> str:
+    first = error.errors(include_url=False)[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+
+async def import_access_logs(
+        session: AsyncSession,
+        stream: AsyncIterable[bytes],
+        chunk_size: int = settings.access_log.bulk_chunk_size,
+        max_line_length: int = settings.access_log.import_max_line_bytes,
+) -> AccessLogImportResult:
+    """
+    Validate NDJSON access log records and insert them chunk by chunk.
+
+    Each chunk is written with one multi-row INSERT as soon as it is full, so
+    inserting overlaps with receiving the rest of the body. Invalid lines,
+    lines longer than `max_line_length` bytes and lines referencing missing
+    users or rooms are reported, not inserted.
+
+    Args:
+        session: Async database session
+        stream: Request body chunks
+        chunk_size: Number of records inserted per statement
+        max_line_length: Maximum length of a line in bytes
+
+    Returns:
+        AccessLogImportResult: Per-chunk counts and rejected line numbers
+    """
+    result = AccessLogImportResult()
+    rows: list[dict[str, Any]] = []
+    line_numbers: list[int] = []
+
+    async def flush() -> None:
+        rejected = await crud.create_access_logs_skip_invalid(session, rows)
+        for position in rejected:
+            result.rejected.append(AccessLogImportRejected(
+                line=line_numbers[position], error="Invalid user or room reference",
+            ))
+        inserted = len(rows) - len(rejected)
+        result.chunks.append(AccessLogImportChunk(
+            first_line=line_numbers[0], last_line=line_numbers[-1], inserted=inserted,
+        ))
+        result.inserted += inserted
+        rows.clear()
+        line_numbers.clear()
+
+    line_number = 0
+    async for line in iter_lines(stream, max_line_length):
+        line_number += 1
+        if line is None:
+            result.rejected.append(AccessLogImportRejected(
+                line=line_number, error=f"Line is longer than {max_line_length} bytes",
+            ))
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = AccessLogImport.model_validate_json(line)
+        except ValidationError as e:
+            result.rejected.append(AccessLogImportRejected(line=line_number, error=_describe(e)))
+            continue
+        row = record.model_dump()
+        row["timestamp"] = record.timestamp or datetime.now(timezone.utc)
+        rows.append(row)
+        line_numbers.append(line_number)
+        if len(rows) >= chunk_size:
+            await flush()
+
+    if rows:
+        await flush()
+    result.rejected.sort(key=lambda rejected: rejected.line)
+    return result
@@ -0,0 +1,162 @@
+"""
+Monthly partition rotation and retention for the access_logs table.
+
+Run periodically (e.g. daily from cron) with:
+
+    python -m src.services.access_log_partitions
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.config import settings
+from src.database.core import engine
+
+logger = logging.getLogger("MainApp")
+
+TABLE_NAME = "access_logs"
+CATCH_ALL_PARTITION = "pmax"
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def partition_month(name: str) -> date | None:
+    try:
+        return datetime.strptime(name, "p%Y%m").date()
+    except ValueError:
+        return None
+
+
+def partition_definition(month: date) -> str:
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1).isoformat()}')"
+
+
+def plan_partitions(
+        existing: list[str],
+        today: date,
+        premake_months: int,
+        retention_months: int,
+) -> tuple[list[date], list[str]]:
+    """
+    Work out which monthly partitions to create and which are past retention.
+
+    Args:
+        existing: Names of the current partitions
+        today: Current date
+        premake_months: Number of future months that must already have a partition
+        retention_months: Number of months, including the current one, to keep
+
+    Returns:
+        tuple[list[date], list[str]]: Months to create and partitions to expire
+    """
+    current = today.replace(day=1)
+    months = {month for name in existing if (month := partition_month(name)) is not None}
+    last = max(months, default=add_months(current, -1))
+    to_create = []
+    month = add_months(last, 1)
+    while month <= add_months(current, premake_months):
+        to_create.append(month)
+        month = add_months(month, 1)
+    oldest_kept = add_months(current, 1 - retention_months)
+    expired = [partition_name(month) for month in sorted(months) if month < oldest_kept]
+    return to_create, expired
+
+
+async def get_partitions(connection: AsyncConnection) -> list[str]:
+    result = await connection.execute(
+        text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ),
+        {"table": TABLE_NAME},
+    )
+    return list(result.scalars())
+
+
+async def create_partitions(connection: AsyncConnection, months: list[date]) -> None:
+    """Split the catch-all partition so that every month gets its own partition."""
+    if not months:
+        return
+    definitions = ", ".join(partition_definition(month) for month in months)
+    await connection.execute(text(
+        f"ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {CATCH_ALL_PARTITION} INTO "
+        f"({definitions}, PARTITION {CATCH_ALL_PARTITION} VALUES LESS THAN (MAXVALUE))"
+    ))
+
+
+async def expire_partition(connection: AsyncConnection, name: str, archive: bool) -> None:
+    """
+    Drop a partition, optionally moving its rows into a standalone archive table first.
+
+    Both operations only touch metadata, so they take seconds regardless of
+    how many rows the partition holds.
+    """
+    if archive:
+        archive_table = f"{TABLE_NAME}_archive_{name}"
+        await connection.execute(text(f"CREATE TABLE {archive_table} LIKE {TABLE_NAME}"))
+        await connection.execute(text(f"ALTER TABLE {archive_table} REMOVE PARTITIONING"))
+        await connection.execute(text(
+            f"ALTER TABLE {TABLE_NAME} EXCHANGE PARTITION {name} WITH TABLE {archive_table}"
+        ))
+    await connection.execute(text(f"ALTER TABLE {TABLE_NAME} DROP PARTITION {name}"))
+
+
+async def rotate_partitions(
+        connection: AsyncConnection,
+        today: date,
+        premake_months: int = settings.access_log.partition_premake_months,
+        retention_months: int = settings.access_log.retention_months,
+        archive: bool = settings.access_log.archive_expired_partitions,
+) -> None:
+    """
+    Pre-create future monthly partitions and expire the ones past retention.
+
+    Args:
+        connection: Async database connection
+        today: Current date
+        premake_months: Number of future months that must already have a partition
+        retention_months: Number of months, including the current one, to keep
+        archive: Whether expired partitions are moved to archive tables instead of dropped
+    """
+    existing = await get_partitions(connection)
+    if CATCH_ALL_PARTITION not in existing:
+        raise RuntimeError(f"Table {TABLE_NAME} is not partitioned, run the migrations first")
+
+    to_create, expired = plan_partitions(existing, today, premake_months, retention_months)
+    await create_partitions(connection, to_create)
+    for name in expired:
+        await expire_partition(connection, name, archive)
+
+    if to_create or expired:
+        logger.info(
+            "Rotated %s partitions: created %s, %s %s",
+            TABLE_NAME,
+            [partition_name(month) for month in to_create],
+            "archived" if archive else "dropped",
+            expired,
+        )
+
+
+async def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    try:
+        async with engine.connect() as connection:
+            await rotate_partitions(connection, datetime.now(timezone.utc).date())
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
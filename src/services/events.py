@@ -0,0 +1,219 @@
+"""
+In-process pub/sub hub that fans out access log and presence events to stream subscribers.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants import Action, EventType
+from src.core.config import settings
+from src.schemas.events import EventFilter, EventOut
+from .occupancy import occupancy
+
+logger = logging.getLogger("MainApp")
+
+BucketKey = tuple[str, int] | None
+
+
+class Subscription:
+    """
+    Bounded queue of events for one stream client.
+
+    Iterating over a subscription yields events until the hub closes it,
+    either on shutdown or because the client fell behind.
+    """
+
+    def __init__(self, filters: EventFilter, queue_size: int):
+        self.filters = filters
+        self.closed = False
+        self._queue: asyncio.Queue[EventOut | None] = asyncio.Queue(maxsize=queue_size)
+
+    def matches(self, event: EventOut) -> bool:
+        filters = self.filters
+        return (
+            (filters.type is None or filters.type == event.type)
+            and (filters.room_id is None or filters.room_id == event.room_id)
+            and (filters.floor_id is None or filters.floor_id == event.floor_id)
+            and (filters.building_id is None or filters.building_id == event.building_id)
+        )
+
+    async def get(self, timeout: float | None = None) -> EventOut | None:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait, None to wait forever
+
+        Returns:
+            EventOut | None: Next event, None if the subscription was closed
+
+        Raises:
+            TimeoutError: If no event arrived within timeout
+        """
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        if self.closed:
+            return None
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> EventOut:
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def _offer(self, event: EventOut) -> bool:
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _close(self) -> None:
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class EventHub:
+    """
+    Delivers every published event to the subscribers whose filter matches it.
+
+    Subscribers are bucketed by the most specific location they filter on, so
+    a publish only looks at the subscribers of the event's room, floor and
+    building plus the unfiltered ones. Publishing never waits: a subscriber
+    whose queue is full is closed and dropped, its client is expected to
+    reconnect.
+    """
+
+    def __init__(self, queue_size: int = settings.events.queue_size):
+        self.queue_size = queue_size
+        self.dropped = 0
+        self._buckets: defaultdict[BucketKey, set[Subscription]] = defaultdict(set)
+
+    @property
+    def subscribers(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    @contextmanager
+    def subscribe(self, filters: EventFilter) -> Iterator[Subscription]:
+        """Register a subscription for the duration of the with block."""
+        subscription = Subscription(filters, self.queue_size)
+        key = self._bucket_key(filters)
+        self._buckets[key].add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._remove(key, subscription)
+
+    async def locate(self, session: AsyncSession, room_ids: Iterable[int]) -> None:
+        """
+        Make sure the occupancy index knows where the given rooms are before
+        their events are published.
+
+        Events of a room missing from the index (e.g. created by another
+        worker after the last load) would reach neither floor nor building
+        subscribers, so the index is reloaded once for them. Does nothing
+        while there are no subscribers.
+
+        Args:
+            session: Async database session
+            room_ids: IDs of the rooms about to get events
+        """
+        if self._buckets and any(occupancy.location(room_id) is None for room_id in room_ids):
+            occupancy.invalidate()
+            await occupancy.ensure_loaded(session)
+
+    def publish(self, event: EventOut) -> None:
+        keys: list[BucketKey] = [None, ("room", event.room_id)]
+        if event.floor_id is not None:
+            keys.append(("floor", event.floor_id))
+        if event.building_id is not None:
+            keys.append(("building", event.building_id))
+        for key in keys:
+            for subscription in list(self._buckets.get(key, ())):
+                if subscription.matches(event) and not subscription._offer(event):
+                    self._drop(key, subscription)
+
+    def publish_access_log(
+            self,
+            user_id: int,
+            room_id: int,
+            action: Action,
+            access_allowed: bool,
+            timestamp: datetime,
+            access_log_id: int | None = None,
+    ) -> None:
+        if not self._buckets:
+            return
+        self.publish(EventOut(
+            type=EventType.access_log,
+            user_id=user_id,
+            room_id=room_id,
+            timestamp=timestamp,
+            access_log_id=access_log_id,
+            action=action,
+            access_allowed=access_allowed,
+            **self._location(room_id),
+        ))
+
+    def publish_presence(self, user_id: int, room_id: int, present: bool, timestamp: datetime) -> None:
+        if not self._buckets:
+            return
+        self.publish(EventOut(
+            type=EventType.presence,
+            user_id=user_id,
+            room_id=room_id,
+            timestamp=timestamp,
+            present=present,
+            **self._location(room_id),
+        ))
+
+    def close(self) -> None:
+        """Close all subscriptions, ending their streams."""
+        for bucket in self._buckets.values():
+            for subscription in bucket:
+                subscription._close()
+        self._buckets.clear()
+
+    @staticmethod
+    def _bucket_key(filters: EventFilter) -> BucketKey:
+        if filters.room_id is not None:
+            return "room", filters.room_id
+        if filters.floor_id is not None:
+            return "floor", filters.floor_id
+        if filters.building_id is not None:
+            return "building", filters.building_id
+        return None
+
+    @staticmethod
+    def _location(room_id: int) -> dict[str, int | None]:
+        floor_id, building_id = occupancy.location(room_id) or (None, None)
+        return {"floor_id": floor_id, "building_id": building_id}
+
+    def _remove(self, key: BucketKey, subscription: Subscription) -> None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return
+        bucket.discard(subscription)
+        if not bucket:
+            del self._buckets[key]
+
+    def _drop(self, key: BucketKey, subscription: Subscription) -> None:
+        self._remove(key, subscription)
+        subscription._close()
+        self.dropped += 1
+        logger.warning("Dropped slow event stream subscriber")
+
+
+event_hub = EventHub()
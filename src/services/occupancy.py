@@ -0,0 +1,120 @@
+"""
+Live room, floor and building occupancy counters held in memory.
+"""
+
+from collections import Counter
+from typing import Sequence
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models import CurrentPresence, Floor, Room
+from .reloadable import ReloadableIndex, patch
+
+Location = tuple[int, int]
+
+
+class OccupancyTracker(ReloadableIndex):
+    """
+    Keeps the number of present users per room, floor and building.
+
+    Seeded from current_presence on first use and updated by every presence
+    change made through the CRUD layer. A presence change for a room the
+    tracker does not know yet (e.g. a room created after seeding) triggers a
+    full reload on next read.
+    """
+
+    def __init__(self, reload_interval: float = settings.occupancy.reload_interval_seconds):
+        super().__init__(reload_interval)
+        self._locations: dict[int, Location] = {}
+        self._user_rooms: dict[int, int] = {}
+        self._rooms: Counter[int] = Counter()
+        self._floors: Counter[int] = Counter()
+        self._buildings: Counter[int] = Counter()
+
+    async def _read(self, session: AsyncSession) -> tuple[Sequence[Row], Sequence[Row]]:
+        locations = (await session.execute(
+            select(Room.id, Room.floor_id, Floor.building_id).join(Room.floor)
+        )).all()
+        presence = (await session.execute(
+            select(CurrentPresence.user_id, CurrentPresence.room_id)
+        )).all()
+        return locations, presence
+
+    def _apply(self, snapshot: tuple[Sequence[Row], Sequence[Row]]) -> None:
+        locations, presence = snapshot
+        self._locations = {room_id: (floor_id, building_id) for room_id, floor_id, building_id in locations}
+        self._user_rooms = {}
+        self._rooms = Counter()
+        self._floors = Counter()
+        self._buildings = Counter()
+        for user_id, room_id in presence:
+            self._place(user_id, room_id)
+
+    @patch
+    def move(self, user_id: int, room_id: int | None) -> None:
+        """
+        Register that a user is now in a room, or in no room at all.
+
+        Args:
+            user_id: ID of the user
+            room_id: ID of the room the user is in, None if the user left
+        """
+        self._unplace(user_id)
+        if room_id is not None:
+            self._place(user_id, room_id)
+
+    @patch
+    def add_room(self, room_id: int, floor_id: int, building_id: int) -> None:
+        """Register the location of a room created after seeding."""
+        self._locations[room_id] = (floor_id, building_id)
+
+    def leave(self, user_id: int, room_id: int) -> None:
+        """Register that a user left a room, if the user is counted in that room."""
+        if self._user_rooms.get(user_id) == room_id:
+            self.move(user_id, None)
+
+    def location(self, room_id: int) -> Location | None:
+        """Get the (floor_id, building_id) of a room, None if the room is not known yet."""
+        return self._locations.get(room_id)
+
+    def room(self, room_id: int) -> int:
+        return self._rooms[room_id]
+
+    def floor(self, floor_id: int) -> int:
+        return self._floors[floor_id]
+
+    def building(self, building_id: int) -> int:
+        return self._buildings[building_id]
+
+    def snapshot(self) -> dict[str, dict[int, int]]:
+        """Get all non-zero counters."""
+        return {
+            "rooms": {room_id: count for room_id, count in self._rooms.items() if count},
+            "floors": {floor_id: count for floor_id, count in self._floors.items() if count},
+            "buildings": {building_id: count for building_id, count in self._buildings.items() if count},
+        }
+
+    def _place(self, user_id: int, room_id: int) -> None:
+        location = self._locations.get(room_id)
+        if location is None:
+            self.invalidate()
+            return
+        floor_id, building_id = location
+        self._user_rooms[user_id] = room_id
+        self._rooms[room_id] += 1
+        self._floors[floor_id] += 1
+        self._buildings[building_id] += 1
+
+    def _unplace(self, user_id: int) -> None:
+        room_id = self._user_rooms.pop(user_id, None)
+        if room_id is None:
+            return
+        floor_id, building_id = self._locations[room_id]
+        self._rooms[room_id] -= 1
+        self._floors[floor_id] -= 1
+        self._buildings[building_id] -= 1
+
+
+occupancy = OccupancyTracker()
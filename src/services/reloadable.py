@@ -0,0 +1,108 @@
+"""
+Base class for in-process indexes built from database rows.
+"""
+
+import abc
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Concatenate, ParamSpec, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+P = ParamSpec("P")
+IndexT = TypeVar("IndexT", bound="ReloadableIndex")
+
+
+def patch(method: Callable[Concatenate[IndexT, P], None]) -> Callable[Concatenate[IndexT, P], None]:
+    """
+    Mark a method that patches the index incrementally.
+
+    The patch is applied at once and, while a reload is reading its snapshot,
+    also recorded so that it is applied again on top of that snapshot. Patches
+    must set state rather than change it relative to the current state (e.g.
+    "user U is in room R", not "one more user in room R"), so that replaying
+    one the snapshot already contains is harmless.
+    """
+    @functools.wraps(method)
+    def wrapper(self: IndexT, *args: P.args, **kwargs: P.kwargs) -> None:
+        method(self, *args, **kwargs)
+        if self._pending is not None:
+            self._pending.append(functools.partial(method, self, *args, **kwargs))
+
+    return wrapper
+
+
+class ReloadableIndex(abc.ABC):
+    """
+    In-memory index that is loaded lazily and rebuilt periodically.
+
+    Subclasses read a snapshot in `_read` and install it in `_apply`. Methods
+    that patch the index incrementally must be decorated with `patch`, so that
+    a patch made while a snapshot is being read is replayed on top of it
+    instead of being lost. Reloading every `reload_interval` seconds picks up
+    changes made by other workers.
+    """
+
+    def __init__(self, reload_interval: float):
+        self.reload_interval = reload_interval
+        self._loaded_at: float | None = None
+        self._pending: list[Callable[[], None]] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def invalidate(self) -> None:
+        """Force a full reload on next use."""
+        self._loaded_at = None
+
+    def _is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.reload_interval
+        )
+
+    @abc.abstractmethod
+    async def _read(self, session: AsyncSession) -> Any:
+        """Read everything the index is built from."""
+
+    @abc.abstractmethod
+    def _apply(self, snapshot: Any) -> None:
+        """Replace the whole index with one built from a snapshot returned by `_read`."""
+
+    async def load(self, session: AsyncSession) -> None:
+        """
+        Rebuild the whole index from the database.
+
+        Patches made while the snapshot is read are replayed after it is
+        installed, so a reload reads the database exactly once however busy
+        the index is.
+
+        Args:
+            session: Async database session
+        """
+        self._pending = []
+        try:
+            snapshot = await self._read(session)
+        finally:
+            pending, self._pending = self._pending, None
+        self._apply(snapshot)
+        self._loaded_at = time.monotonic()
+        for replay in pending:
+            replay()
+
+    async def ensure_loaded(self, session: AsyncSession) -> None:
+        """
+        Load the index if it was never loaded, was invalidated or is older than
+        the reload interval.
+
+        Args:
+            session: Async database session used only when a reload is needed
+        """
+        if not self._is_stale():
+            return
+        async with self._lock:
+            if self._is_stale():
+                await self.load(session)
@@ -0,0 +1,20 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = json.dumps(values, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Malformed cursor")
+    return values
@@ -8,7 +8,7 @@ from sqlalchemy.pool import StaticPool
 from faker import Faker
 
 from src.schemas.user import UserCreate
-from src.models import Base
+from src.models import Base, Building, Floor, Room
 from src.crud.user import create_user
 from src.main import main_app
 from src.database.core import get_db
@@ -70,6 +70,14 @@ async def test_user(db_session: AsyncSession):
         await db_session.refresh(user)
         return user
 
+@pytest.fixture()
+async def rooms(db_session: AsyncSession):
+    floor = Floor(floor_number=1, building=Building(name="Main", description="", address="Street 1"))
+    rooms = [Room(name=f"Room {i}", floor=floor) for i in range(3)]
+    db_session.add_all(rooms)
+    await db_session.commit()
+    return rooms
+
 @pytest.fixture(autouse=True)
 def override_dependencies(db_session):
     # Підміняємо залежність для всіх тестів
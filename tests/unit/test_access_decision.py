@@ -0,0 +1,106 @@
+from datetime import datetime, time, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from src.models import AccessRule, Building, Floor, Role, Room, User, UserRoleAssociation
+from src.schemas.access import AccessCheck
+from src.services.access_decision import AccessDecisionEngine, is_within_window
+
+
+@pytest.mark.parametrize("moment, window, expected", [
+    (time(9, 0), (time(8, 0), time(18, 0)), True),
+    (time(8, 0), (time(8, 0), time(18, 0)), True),
+    (time(18, 0, 1), (time(8, 0), time(18, 0)), False),
+    (time(23, 0), (time(22, 0), time(6, 0)), True),
+    (time(5, 59), (time(22, 0), time(6, 0)), True),
+    (time(12, 0), (time(22, 0), time(6, 0)), False),
+])
+def test_is_within_window(moment, window, expected):
+    assert is_within_window(moment, window) is expected
+
+
+def test_engine_incremental_updates():
+    engine = AccessDecisionEngine()
+    engine.set_user_roles(1, [10])
+    engine.add_rule(AccessRule(id=100, room_id=5, role_id=10, time_from=time(8), time_to=time(18)))
+
+    assert engine.is_allowed(1, 5, datetime(2025, 7, 15, 9, 30))
+    assert not engine.is_allowed(1, 5, time(19))
+    assert not engine.is_allowed(1, 6, time(9))
+    assert not engine.is_allowed(2, 5, time(9))
+
+    engine.add_rule(AccessRule(id=100, room_id=6, role_id=10, time_from=time(8), time_to=time(18)))
+    assert not engine.is_allowed(1, 5, time(9))
+    assert engine.is_allowed(1, 6, time(9))
+
+    engine.remove_role(10)
+    assert not engine.is_allowed(1, 6, time(9))
+
+
+def test_engine_compares_in_site_timezone():
+    engine = AccessDecisionEngine(site_timezone=ZoneInfo("Europe/Kyiv"))
+    engine.set_user_roles(1, [10])
+    engine.add_rule(AccessRule(id=1, room_id=5, role_id=10, time_from=time(8), time_to=time(18)))
+
+    assert engine.is_allowed(1, 5, datetime(2025, 7, 15, 6, 30, tzinfo=timezone.utc))
+    assert not engine.is_allowed(1, 5, datetime(2025, 7, 15, 16, 30, tzinfo=timezone.utc))
+    assert engine.is_allowed(1, 5, datetime(2025, 7, 15, 16, 30))
+
+
+@pytest.mark.asyncio
+async def test_engine_load(db_session):
+    building = Building(name="Main", description="", address="Street 1")
+    floor = Floor(floor_number=1, building=building)
+    room = Room(name="Lab", floor=floor)
+    role = Role(name="Staff", description="")
+    user = User(first="Ann", last="Lee", email="ann@example.com", password_hash="x")
+    db_session.add_all([building, floor, room, role, user])
+    await db_session.flush()
+    db_session.add_all([
+        AccessRule(room_id=room.id, role_id=role.id, time_from=time(7), time_to=time(19)),
+        UserRoleAssociation(user_id=user.id, role_id=role.id),
+    ])
+    await db_session.commit()
+
+    engine = AccessDecisionEngine()
+    await engine.ensure_loaded(db_session)
+
+    assert engine.is_loaded
+    assert engine.is_allowed(user.id, room.id, time(12))
+    assert not engine.is_allowed(user.id, room.id, time(20))
+
+    engine.remove_user(user.id)
+    assert not engine.is_allowed(user.id, room.id, time(12))
+
+
+@pytest.mark.asyncio
+async def test_engine_replays_patches_made_during_reload():
+    class SlowEngine(AccessDecisionEngine):
+        reads = 0
+
+        async def _read(self, session):
+            self.reads += 1
+            self.set_user_roles(1, [10])
+            return [(100, 5, 10, time(8), time(18))], []
+
+    engine = SlowEngine()
+    await engine.load(None)
+
+    assert engine.reads == 1
+    assert engine.is_allowed(1, 5, time(9))
+    engine.set_user_roles(2, [10])
+    assert engine._pending is None
+
+
+def test_engine_check_many():
+    engine = AccessDecisionEngine()
+    engine.set_user_roles(1, [10])
+    engine.add_rule(AccessRule(id=1, room_id=5, role_id=10, time_from=time(8), time_to=time(18)))
+
+    checks = [
+        AccessCheck(user_id=1, room_id=5, timestamp=datetime(2025, 7, 15, 9)),
+        AccessCheck(user_id=1, room_id=5, timestamp=datetime(2025, 7, 15, 20)),
+        AccessCheck(user_id=2, room_id=5, timestamp=datetime(2025, 7, 15, 9)),
+    ]
+    assert engine.check_many(checks) == [True, False, False]
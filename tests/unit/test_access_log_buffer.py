@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from src.constants import Action
+from src.exceptions.exceptions import ServiceUnavailableException
+from src.models import AccessLog
+from src.schemas.access_log import AccessLogCreate
+from src.services.access_log_buffer import AccessLogBuffer
+from tests.conftest import AsyncTestingSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_on_stop(db_session, test_user, rooms):
+    buffer = AccessLogBuffer(session_factory=AsyncTestingSessionLocal, batch_size=2, flush_interval=60)
+    buffer.start()
+
+    for action in (Action.enter, Action.exit, Action.enter):
+        queued = await buffer.enqueue(AccessLogCreate(
+            user_id=test_user.id, room_id=rooms[0].id, action=action, access_allowed=True,
+        ))
+        assert queued.timestamp is not None
+
+    await buffer.stop()
+
+    count = await db_session.scalar(select(func.count()).select_from(AccessLog))
+    assert count == 3
+    assert not buffer.running
+
+
+@pytest.mark.asyncio
+async def test_buffer_retries_failed_flush(db_session, test_user, rooms):
+    attempts = 0
+
+    def flaky_session_factory():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise OperationalError("INSERT", {}, Exception("MySQL server has gone away"))
+        return AsyncTestingSessionLocal()
+
+    buffer = AccessLogBuffer(
+        session_factory=flaky_session_factory, batch_size=1, flush_interval=60, retry_initial=0.01,
+    )
+    buffer.start()
+    await buffer.enqueue(AccessLogCreate(user_id=test_user.id, room_id=rooms[0].id, action=Action.enter, access_allowed=True))
+    while attempts < 2:
+        await asyncio.sleep(0.01)
+    await buffer.stop()
+
+    count = await db_session.scalar(select(func.count()).select_from(AccessLog))
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_buffer_rejects_when_not_running():
+    buffer = AccessLogBuffer(session_factory=AsyncTestingSessionLocal)
+    with pytest.raises(ServiceUnavailableException):
+        await buffer.enqueue(AccessLogCreate(user_id=1, room_id=1, action=Action.enter, access_allowed=True))
+
+
+@pytest.mark.asyncio
+async def test_buffer_backpressure():
+    buffer = AccessLogBuffer(session_factory=AsyncTestingSessionLocal, max_pending=1, enqueue_timeout=0.01)
+    buffer._queue = asyncio.Queue(maxsize=1)
+    access_log_in = AccessLogCreate(user_id=1, room_id=1, action=Action.enter, access_allowed=True)
+
+    await buffer.enqueue(access_log_in)
+    with pytest.raises(ServiceUnavailableException):
+        await buffer.enqueue(access_log_in)
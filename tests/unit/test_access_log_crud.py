@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from src.constants import Action
+from src.models import AccessLog, CurrentPresence
+from src.api.access_log import ACCESS_LOG_ROWS
+from src.schemas.access_log import (
+    AccessLogCreate,
+    AccessLogFilter,
+    AccessLogOut,
+    AccessLogUpdate,
+    AccessLogUpdatePartical,
+)
+import src.crud.access_log as crud
+import src.crud.exceptions as exceptions
+
+
+@pytest.fixture()
+async def access_logs(db_session, test_user):
+    start = datetime(2025, 7, 15, 8, 0)
+    logs = [
+        AccessLog(user_id=test_user.id, room_id=1, action=Action.enter, timestamp=start + timedelta(minutes=i // 2))
+        for i in range(7)
+    ]
+    db_session.add_all(logs)
+    await db_session.commit()
+    return logs
+
+
+@pytest.mark.asyncio
+async def test_get_access_logs_keyset_pages(db_session, access_logs):
+    seen = []
+    after = None
+    while True:
+        page = await crud.get_access_logs(db_session, limit=3, after=after)
+        seen.extend(log.id for log in page)
+        if len(page) < 3:
+            break
+        after = (page[-1].timestamp, page[-1].id)
+
+    expected = sorted(access_logs, key=lambda log: (log.timestamp, log.id), reverse=True)
+    assert seen == [log.id for log in expected]
+
+
+@pytest.mark.asyncio
+async def test_get_access_logs_offset_matches_keyset(db_session, access_logs):
+    by_offset = await crud.get_access_logs(db_session, offset=3, limit=3)
+    first_page = await crud.get_access_logs(db_session, limit=3)
+    by_keyset = await crud.get_access_logs(db_session, limit=3, after=(first_page[-1].timestamp, first_page[-1].id))
+    assert [log.id for log in by_offset] == [log.id for log in by_keyset]
+
+
+@pytest.mark.asyncio
+async def test_search_access_logs(db_session, access_logs):
+    access_logs[0].room_id = 2
+    access_logs[1].action = Action.exit
+    await db_session.commit()
+
+    found = await crud.search_access_logs(db_session, AccessLogFilter(
+        room_id=1,
+        action=Action.enter,
+        since=datetime(2025, 7, 15, 8, 1),
+        until=datetime(2025, 7, 15, 8, 3),
+    ))
+    assert sorted(log.id for log in found) == [log.id for log in access_logs[2:6]]
+
+
+@pytest.mark.asyncio
+async def test_get_access_log_rows_match_access_logs(db_session, access_logs):
+    rows = await crud.get_access_log_rows(db_session, limit=4, after=(access_logs[-1].timestamp, access_logs[-1].id))
+    logs = await crud.get_access_logs(db_session, limit=4, after=(access_logs[-1].timestamp, access_logs[-1].id))
+
+    orm = TypeAdapter(list[AccessLogOut])
+    assert ACCESS_LOG_ROWS.dump_json([row._asdict() for row in rows]) == orm.dump_json(
+        orm.validate_python(logs, from_attributes=True)
+    )
+    assert [row._fields for row in await crud.get_access_log_rows(db_session, limit=1, fields={"action"})] == [
+        ("action", "id", "timestamp")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_access_logs(db_session, access_logs):
+    batches = [rows async for rows in crud.stream_access_logs(db_session, AccessLogFilter(), batch_size=3)]
+
+    assert [len(rows) for rows in batches] == [3, 3, 1]
+    streamed = [row.id for rows in batches for row in rows]
+    assert streamed == [log.id for log in sorted(access_logs, key=lambda log: (log.timestamp, log.id))]
+
+
+@pytest.mark.asyncio
+async def test_record_swipe_updates_current_presence(db_session, test_user, rooms):
+    async def swipe(room_id: int, action: Action, access_allowed: bool = True):
+        await crud.record_swipe(db_session, AccessLogCreate(
+            user_id=test_user.id, room_id=rooms[room_id - 1].id, action=action, access_allowed=access_allowed,
+        ))
+        return (await db_session.scalars(select(CurrentPresence).execution_options(populate_existing=True))).all()
+
+    presence = await swipe(1, Action.enter)
+    assert [(p.user_id, p.room_id) for p in presence] == [(test_user.id, rooms[0].id)]
+
+    presence = await swipe(2, Action.enter)
+    assert [(p.user_id, p.room_id) for p in presence] == [(test_user.id, rooms[1].id)]
+
+    presence = await swipe(3, Action.enter, access_allowed=False)
+    assert [(p.user_id, p.room_id) for p in presence] == [(test_user.id, rooms[1].id)]
+
+    presence = await swipe(1, Action.exit)
+    assert len(presence) == 1
+
+    presence = await swipe(2, Action.exit)
+    assert presence == []
+
+    logs = await crud.get_access_logs(db_session)
+    assert len(logs) == 5
+
+
+@pytest.mark.asyncio
+async def test_invalid_references_are_rejected_without_foreign_keys(db_session, test_user, rooms):
+    valid = {"user_id": test_user.id, "room_id": rooms[0].id, "action": Action.enter, "timestamp": datetime(2025, 7, 15)}
+    batch = [valid, {**valid, "room_id": 999}, valid, {**valid, "user_id": 999}]
+
+    assert await crud.create_access_logs_skip_invalid(db_session, batch) == [1, 3]
+    with pytest.raises(exceptions.AccessLogInvalidReferancesException):
+        await crud.create_access_logs(db_session, batch)
+    with pytest.raises(exceptions.AccessLogInvalidReferancesException):
+        await crud.record_swipe(db_session, AccessLogCreate(
+            user_id=test_user.id, room_id=999, action=Action.enter, access_allowed=True,
+        ))
+
+    stored = (await db_session.execute(select(AccessLog.user_id, AccessLog.room_id))).all()
+    assert stored == [(test_user.id, rooms[0].id)] * 2
+
+
+@pytest.mark.asyncio
+async def test_update_with_invalid_reference_is_rejected(db_session, test_user, rooms):
+    access_log = await crud.create_access_log(db_session, AccessLogCreate(
+        user_id=test_user.id, room_id=rooms[0].id, action=Action.enter, access_allowed=True,
+    ))
+
+    with pytest.raises(exceptions.AccessLogInvalidReferancesException):
+        await crud.update_access_log(db_session, access_log, AccessLogUpdatePartical(room_id=999), partial=True)
+    with pytest.raises(exceptions.AccessLogInvalidReferancesException):
+        await crud.update_access_log(db_session, access_log, AccessLogUpdate(
+            user_id=999, room_id=rooms[1].id, action=Action.exit, access_allowed=True,
+        ))
+    updated = await crud.update_access_log(
+        db_session, access_log, AccessLogUpdatePartical(room_id=rooms[1].id), partial=True,
+    )
+
+    assert (updated.user_id, updated.room_id) == (test_user.id, rooms[1].id)
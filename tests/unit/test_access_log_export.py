@@ -0,0 +1,47 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from src.constants import Action, ExportFormat
+from src.models import AccessLog
+from src.schemas.access_log import AccessLogFilter
+from src.services.access_log_export import export_access_logs
+from tests.conftest import AsyncTestingSessionLocal
+
+
+@pytest.fixture()
+async def access_log(db_session, test_user):
+    access_log = AccessLog(user_id=test_user.id, room_id=3, action=Action.exit, timestamp=datetime(2025, 7, 15, 8))
+    db_session.add(access_log)
+    await db_session.commit()
+    return access_log
+
+
+async def collect(export_format: ExportFormat) -> str:
+    chunks = [chunk async for chunk in export_access_logs(AsyncTestingSessionLocal, AccessLogFilter(), export_format)]
+    return b"".join(chunks).decode()
+
+
+@pytest.mark.asyncio
+async def test_export_csv(access_log):
+    rows = list(csv.reader(io.StringIO(await collect(ExportFormat.csv))))
+    assert rows == [
+        ["id", "user_id", "room_id", "action", "access_allowed", "timestamp"],
+        [str(access_log.id), str(access_log.user_id), "3", "Exit", "True", "2025-07-15T08:00:00"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(access_log):
+    lines = (await collect(ExportFormat.ndjson)).splitlines()
+    assert [json.loads(line) for line in lines] == [{
+        "id": access_log.id,
+        "user_id": access_log.user_id,
+        "room_id": 3,
+        "action": "Exit",
+        "access_allowed": True,
+        "timestamp": "2025-07-15T08:00:00",
+    }]
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from src.models import AccessLog
+from src.services.access_log_import import import_access_logs, iter_lines
+
+
+async def body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_across_chunks():
+    lines = [line async for line in iter_lines(body(b'{"a"', b': 1}\n{"b": 2}\n', b'{"c": 3}'), 100)]
+    assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_discards_long_lines():
+    chunks = [b"12345", b"678\nok\n", b"x" * 20, b"x" * 20, b"\nend\n", b"y" * 9]
+    lines = [line async for line in iter_lines(body(*chunks), 8)]
+    assert lines == [b"12345678", b"ok", None, b"end", None]
+
+
+@pytest.mark.asyncio
+async def test_import_access_logs(db_session, test_user, rooms):
+    record = {"user_id": test_user.id, "room_id": rooms[0].id, "action": "Enter", "access_allowed": True}
+    payload = b"\n".join([
+        json.dumps(record).encode(),
+        b"not json",
+        json.dumps({**record, "timestamp": "2025-07-15T08:00:00"}).encode(),
+        b"",
+        json.dumps({**record, "action": "Leave"}).encode(),
+        json.dumps(record).encode(),
+        json.dumps({**record, "room_id": 999}).encode(),
+        json.dumps({**record, "user_id": 999}).encode(),
+        json.dumps(record).encode(),
+    ])
+
+    result = await import_access_logs(db_session, body(payload[:40], payload[40:]), chunk_size=2)
+
+    assert result.inserted == 4
+    assert [(chunk.first_line, chunk.last_line, chunk.inserted) for chunk in result.chunks] == [
+        (1, 3, 2), (6, 7, 1), (8, 9, 1),
+    ]
+    assert [rejected.line for rejected in result.rejected] == [2, 5, 7, 8]
+
+    count = await db_session.scalar(select(func.count()).select_from(AccessLog))
+    assert count == 4
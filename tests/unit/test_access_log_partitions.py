@@ -0,0 +1,32 @@
+from datetime import date
+
+import pytest
+
+from src.services.access_log_partitions import add_months, partition_definition, plan_partitions
+
+
+@pytest.mark.parametrize("month, months, expected", [
+    (date(2026, 10, 1), 3, date(2027, 1, 1)),
+    (date(2026, 1, 1), -1, date(2025, 12, 1)),
+    (date(2026, 12, 1), -12, date(2025, 12, 1)),
+])
+def test_add_months(month, months, expected):
+    assert add_months(month, months) == expected
+
+
+def test_partition_definition():
+    assert partition_definition(date(2026, 12, 1)) == "PARTITION p202612 VALUES LESS THAN ('2027-01-01')"
+
+
+def test_plan_partitions():
+    existing = ["p202509", "p202510", "p202511", "p202610", "p202611", "pmax"]
+
+    to_create, expired = plan_partitions(existing, date(2026, 10, 17), premake_months=3, retention_months=12)
+
+    assert to_create == [date(2026, 12, 1), date(2027, 1, 1)]
+    assert expired == ["p202509", "p202510"]
+
+
+def test_plan_partitions_up_to_date():
+    existing = ["p202610", "p202611", "p202612", "p202701", "pmax"]
+    assert plan_partitions(existing, date(2026, 10, 1), premake_months=3, retention_months=12) == ([], [])
@@ -0,0 +1,283 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from ipaddress import ip_network
+from pathlib import Path
+from unittest.mock import patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import DatabaseError, OperationalError
+
+from src.auth import keygen, utils
+from src.auth.principals import principals
+from src.auth.rate_limit import LoginRateLimiter, MemoryBucketStore, client_ip
+from src.auth.revocation import RevocationList
+from src.auth.service import authenticate_user, get_current_user, revoke
+from src.auth.exceptions import InvalidCredentialsError, TooManyLoginAttemptsError
+from src.auth.hasher import PasswordHasher
+from src.auth.keys import KeyManager
+from src.auth.utils import TokenType, check_token_with_type, create_token, decode_jwt
+from src.core.config import settings
+from src.crud.revoked_token import revoke_token
+from src.crud.user import update_user
+from src.exceptions.exceptions import ServiceUnavailableException
+from src.models import User
+from src.schemas.user import UserUpdatePatrical
+from src.utils.cache import TTLCache
+
+
+@pytest.fixture(autouse=True)
+def clear_verified_tokens():
+    utils.verified_tokens.clear()
+    yield
+    utils.verified_tokens.clear()
+
+
+def test_token_has_expiry():
+    token = create_token(TokenType.ACCESS, {"sub": "ann@example.com"}, expire_minutes=5)
+    payload = decode_jwt(token)
+    assert payload["exp"] - payload["iat"] == 300
+
+
+def test_verified_token_is_cached():
+    token = create_token(TokenType.ACCESS, {"sub": "ann@example.com"})
+    with patch.object(utils, "decode_jwt", wraps=decode_jwt) as decode:
+        for _ in range(3):
+            assert check_token_with_type(token, TokenType.ACCESS).email == "ann@example.com"
+    assert decode.call_count == 1
+
+    with pytest.raises(HTTPException) as exc_info:
+        check_token_with_type(token, TokenType.REFRESH)
+    assert exc_info.value.status_code == 401
+
+
+def test_expired_token_is_rejected():
+    token = create_token(TokenType.ACCESS, {"sub": "ann@example.com"}, expire_timedelta=timedelta(seconds=-1))
+    with pytest.raises(InvalidCredentialsError):
+        check_token_with_type(token, TokenType.ACCESS)
+    assert len(utils.verified_tokens) == 0
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_invalidated_on_update(db_session, test_user):
+    principals.clear()
+    token = create_token(TokenType.ACCESS, {"sub": test_user.email})
+    assert (await get_current_user(token, db_session)).is_active
+
+    with patch("src.auth.service.get_user_by_email") as get_user_by_email:
+        assert (await get_current_user(token, db_session)).id == test_user.id
+    get_user_by_email.assert_not_called()
+
+    await update_user(db_session, UserUpdatePatrical(is_active=False), test_user, partial=True)
+    assert not (await get_current_user(token, db_session)).is_active
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_rejects_when_saturated():
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        running = [asyncio.ensure_future(hasher.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert hasher.stats()["queued"] == 1
+
+        with pytest.raises(ServiceUnavailableException):
+            await hasher.run(release.wait)
+        assert hasher.rejected == 1
+
+        release.set()
+        assert await asyncio.gather(*running) == [True, True]
+        assert hasher.in_flight == 0
+    finally:
+        release.set()
+        await hasher.shutdown()
+
+
+def write_key_pair(directory: Path, name: str, algorithm: str = "RS256") -> tuple[Path, Path]:
+    private_path, public_path = directory / f"{name}.pem", directory / f"{name}.pub.pem"
+    keygen.write_key_pair(keygen.generate_private_key(algorithm), private_path, public_path)
+    return private_path, public_path
+
+
+def test_key_manager_rotation(tmp_path):
+    old_private, old_public = write_key_pair(tmp_path, "old")
+    new_private, new_public = write_key_pair(tmp_path, "new")
+    manager = KeyManager(old_private, old_public, [], "RS256", reload_interval=60)
+    old_token = manager.sign({"sub": "ann@example.com"})
+    old_kid = manager.kid
+    assert jwt.get_unverified_header(old_token)["kid"] == old_kid
+
+    manager.private_path, manager.public_path, manager.extra_public_paths = new_private, new_public, [old_public]
+    assert manager.reload()
+    new_token = manager.sign({"sub": "ann@example.com"})
+
+    assert manager.kid != old_kid
+    assert manager.verify(old_token)["sub"] == manager.verify(new_token)["sub"] == "ann@example.com"
+    assert {key["kid"] for key in manager.jwks()["keys"]} == {old_kid, manager.kid}
+
+    manager.extra_public_paths = []
+    manager.public_path = old_public
+    assert not manager.reload()
+    manager.public_path = new_public
+    assert manager.reload()
+    with pytest.raises(jwt.InvalidTokenError):
+        manager.verify(old_token)
+
+
+@pytest.mark.parametrize("algorithm", ["ES256", "EdDSA"])
+def test_key_manager_switches_algorithm(tmp_path, algorithm):
+    rsa_private, rsa_public = write_key_pair(tmp_path, "rsa")
+    new_private, new_public = write_key_pair(tmp_path, "new", algorithm)
+    rsa_token = KeyManager(rsa_private, rsa_public, [], "RS256", reload_interval=60).sign({"sub": "ann@example.com"})
+
+    manager = KeyManager(new_private, new_public, [rsa_public], algorithm, reload_interval=60)
+    token = manager.sign({"sub": "ann@example.com"})
+
+    assert jwt.get_unverified_header(token)["alg"] == algorithm
+    assert manager.verify(token)["sub"] == manager.verify(rsa_token)["sub"] == "ann@example.com"
+    assert [key["alg"] for key in manager.jwks()["keys"]] == [algorithm, "RS256"]
+
+    with pytest.raises(ValueError):
+        KeyManager(new_private, new_public, [], "RS256", reload_interval=60).load()
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_is_rejected(db_session, test_user):
+    token = create_token(TokenType.ACCESS, {"sub": test_user.email})
+    token_data = check_token_with_type(token, TokenType.ACCESS)
+    other_worker = RevocationList(refresh_interval=0)
+    await other_worker.ensure_fresh(db_session)
+
+    with patch("src.auth.service.revocation_list", RevocationList()):
+        await get_current_user(token, db_session)
+        await revoke(db_session, token_data)
+        with pytest.raises(InvalidCredentialsError):
+            await get_current_user(token, db_session)
+
+    assert not other_worker.is_revoked(token_data.jti)
+    await other_worker.ensure_fresh(db_session)
+    assert other_worker.is_revoked(token_data.jti)
+
+
+@pytest.mark.asyncio
+async def test_revocation_refresh_skips_expired(db_session):
+    revocations = RevocationList(refresh_interval=0)
+    await revocations.ensure_fresh(db_session)
+    now = datetime.now(timezone.utc)
+    await revoke_token(db_session, "expired", now - timedelta(minutes=1))
+    await revoke_token(db_session, "live", now + timedelta(minutes=1))
+
+    await revocations.refresh(db_session)
+
+    assert revocations.is_revoked("live")
+    assert not revocations.is_revoked("expired")
+    assert len(revocations) == 1
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limiter():
+    limiter = LoginRateLimiter(
+        MemoryBucketStore(max_keys=100), username_burst=2, username_per_minute=1, ip_burst=3, ip_per_minute=1
+    )
+    await limiter.check("ann@example.com", "10.0.0.1")
+    await limiter.check("ANN@example.com", "10.0.0.2")
+    with pytest.raises(TooManyLoginAttemptsError) as exc_info:
+        await limiter.check("ann@example.com", "10.0.0.3")
+    assert 0 < int(exc_info.value.headers["Retry-After"]) <= 60
+
+    await limiter.check("bob@example.com", "10.0.0.1")
+    await limiter.check("carl@example.com", "10.0.0.1")
+    with pytest.raises(TooManyLoginAttemptsError):
+        await limiter.check("dave@example.com", "10.0.0.1")
+
+    assert limiter.stats() == {"allowed": 4, "rejected_by_ip": 1, "rejected_by_username": 1, "tracked_keys": 6}
+
+
+@pytest.mark.asyncio
+async def test_bucket_store_keeps_limited_keys():
+    store = MemoryBucketStore(max_keys=3)
+    for _ in range(3):
+        await store.take("victim", 2, 1 / 60)
+    for i in range(10):
+        await store.take(f"junk{i}", 2, 1 / 60)
+    assert len(store) == 3
+    assert await store.take("victim", 2, 1 / 60) > 0
+
+
+@pytest.mark.parametrize("peer, forwarded_for, expected", [
+    ("203.0.113.5", None, "203.0.113.5"),
+    ("203.0.113.5", "198.51.100.1", "203.0.113.5"),
+    ("10.0.0.2", "198.51.100.1", "198.51.100.1"),
+    ("10.0.0.2", "1.2.3.4, 198.51.100.1, 10.0.0.3", "198.51.100.1"),
+    ("10.0.0.2", "10.0.0.3", "10.0.0.3"),
+    (None, "198.51.100.1", None),
+])
+def test_client_ip_behind_trusted_proxies(peer, forwarded_for, expected):
+    assert client_ip(peer, forwarded_for, [ip_network("10.0.0.0/8")]) == expected
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_upgrades_cost_and_caches(db_session, test_user):
+    with patch.object(settings.password, "bcrypt_rounds", 4):
+        test_user.password_hash = utils.hash_password("secret")
+        await db_session.commit()
+        assert not utils.needs_rehash(test_user.password_hash)
+
+    with (
+        patch.object(settings.password, "bcrypt_rounds", 5),
+        patch.object(settings.password, "verify_cache_ttl_seconds", 60),
+        patch.object(utils, "verified_passwords", TTLCache(maxsize=10)) as verified_passwords,
+        patch("src.auth.service.verified_passwords", verified_passwords),
+    ):
+        assert not await authenticate_user(db_session, test_user.email, "wrong")
+        assert await authenticate_user(db_session, test_user.email, "secret")
+        assert test_user.password_hash.startswith("$2b$05$")
+
+        with patch.object(PasswordHasher, "run") as run:
+            assert await authenticate_user(db_session, test_user.email, "secret")
+            assert await authenticate_user(db_session, test_user.email, "secret")
+        run.assert_not_called()
+        assert verified_passwords.hits == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [OperationalError, DatabaseError])
+async def test_authenticate_user_survives_failed_rehash(db_session, test_user, error):
+    with patch.object(settings.password, "bcrypt_rounds", 4):
+        test_user.password_hash = utils.hash_password("secret")
+        await db_session.commit()
+    email, old_hash = test_user.email, test_user.password_hash
+
+    with (
+        patch.object(settings.password, "bcrypt_rounds", 5),
+        patch.object(db_session, "commit", side_effect=error("UPDATE", {}, Exception("lock wait timeout"))),
+    ):
+        user = await authenticate_user(db_session, email, "secret")
+
+    assert user.email == email
+    assert user.password_hash == old_hash
+    assert (await db_session.execute(select(User.id).where(User.email == email))).scalar_one() == user.id
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_postpones_rehash_when_hasher_is_saturated(db_session, test_user):
+    with patch.object(settings.password, "bcrypt_rounds", 4):
+        test_user.password_hash = utils.hash_password("secret")
+        await db_session.commit()
+    old_hash = test_user.password_hash
+
+    async def saturated(func, *args):
+        if func is utils.hash_password:
+            raise ServiceUnavailableException("Too many password checks in progress, retry later")
+        return func(*args)
+
+    with (
+        patch.object(settings.password, "bcrypt_rounds", 5),
+        patch.object(PasswordHasher, "run", side_effect=saturated),
+    ):
+        user = await authenticate_user(db_session, test_user.email, "secret")
+
+    assert user.password_hash == old_hash
@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.constants import Action, EventType
+from src.crud.access_log import create_access_log
+from src.crud.room import create_room
+from src.models import Room
+from src.schemas.access_log import AccessLogCreate
+from src.schemas.events import EventFilter, EventOut
+from src.schemas.room import RoomCreate
+from src.services.events import EventHub, event_hub
+from src.services.occupancy import occupancy
+
+NOW = datetime(2025, 7, 15, 9, tzinfo=timezone.utc)
+
+
+def presence(room_id: int, building_id: int | None = None) -> EventOut:
+    return EventOut(
+        type=EventType.presence, user_id=1, room_id=room_id, building_id=building_id, timestamp=NOW, present=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_hub_filters_events():
+    hub = EventHub(queue_size=10)
+    with (
+        hub.subscribe(EventFilter()) as everything,
+        hub.subscribe(EventFilter(building_id=1)) as building,
+        hub.subscribe(EventFilter(room_id=2, type=EventType.access_log)) as room_logs,
+    ):
+        assert hub.subscribers == 3
+        hub.publish(presence(room_id=2, building_id=1))
+        hub.publish(presence(room_id=3, building_id=2))
+        hub.publish_access_log(user_id=1, room_id=2, action=Action.enter, access_allowed=True, timestamp=NOW)
+
+        assert [(await everything.get(0)).room_id for _ in range(3)] == [2, 3, 2]
+        assert (await building.get(0)).room_id == 2
+        assert (await room_logs.get(0)).type == EventType.access_log
+        with pytest.raises(TimeoutError):
+            await room_logs.get(0)
+    assert hub.subscribers == 0
+
+
+@pytest.mark.asyncio
+async def test_hub_drops_slow_subscriber():
+    hub = EventHub(queue_size=2)
+    with hub.subscribe(EventFilter()) as slow, hub.subscribe(EventFilter(room_id=5)) as idle:
+        for _ in range(3):
+            hub.publish(presence(room_id=1))
+
+        assert slow.closed
+        assert hub.dropped == 1
+        assert hub.subscribers == 1
+        assert [event async for event in slow] == []
+
+        hub.close()
+        assert await idle.get() is None
+
+
+@pytest.mark.asyncio
+async def test_floor_subscriber_gets_events_of_new_rooms(db_session, rooms, test_user):
+    floor_id = rooms[0].floor_id
+    occupancy.invalidate()
+    await occupancy.ensure_loaded(db_session)
+    # A room inserted behind the tracker's back, as another worker would.
+    elsewhere = Room(name="Elsewhere", floor_id=floor_id)
+    db_session.add(elsewhere)
+    await db_session.commit()
+
+    with event_hub.subscribe(EventFilter(floor_id=floor_id)) as subscription:
+        created = await create_room(db_session, RoomCreate(name="Created", floor_id=floor_id))
+        for room in (created, elsewhere):
+            await create_access_log(db_session, AccessLogCreate(
+                user_id=test_user.id, room_id=room.id, action=Action.enter, access_allowed=True, timestamp=NOW,
+            ))
+            event = await subscription.get(0)
+            assert (event.room_id, event.floor_id) == (room.id, floor_id)
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, FastAPI, Response, status
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.api.fast_json import install_fast_json
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class ItemRow:
+    def __init__(self, id: int, name: str, secret: str):
+        self.id = id
+        self.name = name
+        self.secret = secret
+
+
+def make_client() -> tuple[TestClient, int]:
+    router = APIRouter()
+
+    @router.get("/items", response_model=list[Item])
+    async def get_items(response: Response, limit: int = 2):
+        response.headers["X-Next-Cursor"] = "next"
+        return [ItemRow(i, f"item {i}", "hidden") for i in range(limit)]
+
+    @router.post("/items", response_model=Item, status_code=status.HTTP_201_CREATED)
+    async def create_item(item: Item):
+        return item
+
+    @router.get("/raw", response_model=Item)
+    async def get_raw():
+        return PlainTextResponse("raw")
+
+    @router.get("/health", response_class=PlainTextResponse)
+    async def health():
+        return "OK"
+
+    installed = install_fast_json(router)
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app), installed
+
+
+def test_fast_json_matches_default_serialization():
+    client, installed = make_client()
+    assert installed == 3
+
+    response = client.get("/items", params={"limit": 3})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["x-next-cursor"] == "next"
+    assert response.json() == [{"id": i, "name": f"item {i}"} for i in range(3)]
+
+    response = client.post("/items", json={"id": 7, "name": "new"})
+    assert response.status_code == 201
+    assert response.json() == {"id": 7, "name": "new"}
+
+    assert client.post("/items", json={"id": "x"}).status_code == 422
+    assert client.get("/raw").text == "raw"
+    assert client.get("/health").text == "OK"
+
+
+def test_fast_json_keeps_openapi_parameters():
+    client, _ = make_client()
+    parameters = client.get("/openapi.json").json()["paths"]["/items"]["get"]["parameters"]
+    assert [parameter["name"] for parameter in parameters] == ["limit"]
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+from fastapi import Response
+from sqlalchemy import inspect
+
+from src.api.dependencies import SparseFields
+from src.exceptions.exceptions import InvalidFieldsException
+from src.schemas.fields import narrow
+from src.schemas.pagination import Page
+from src.schemas.user import UserOut
+import src.crud.user as crud
+
+
+@pytest.mark.asyncio
+async def test_get_users_loads_only_selected_fields(db_session, test_user):
+    db_session.expunge_all()
+
+    [user] = await crud.get_users(db_session, fields={"email"})
+
+    assert user.email == test_user.email
+    assert inspect(user).unloaded >= {"first", "last", "password_hash"}
+
+
+def test_narrow_keeps_field_types_and_caches():
+    model = narrow(UserOut, frozenset({"id", "email"}))
+    assert list(model.model_fields) == ["email", "id"]
+    assert model is narrow(UserOut, frozenset({"email", "id"}))
+    with pytest.raises(ValueError):
+        model(id=1, email="not an email")
+
+
+@pytest.mark.parametrize("fields", ["id,password_hash", " , "])
+def test_unknown_fields(fields):
+    with pytest.raises(InvalidFieldsException):
+        SparseFields(UserOut)(fields=fields)
+
+
+def test_render_selected_fields(test_user):
+    response = Response()
+    response.headers["X-Next-Cursor"] = "abc"
+    fieldset = SparseFields(UserOut)(fields="id, first")
+
+    rendered = fieldset.render(response, Page(items=[test_user], next_cursor="abc"))
+
+    assert json.loads(rendered.body) == {
+        "items": [{"first": test_user.first, "id": test_user.id}],
+        "next_cursor": "abc",
+    }
+    assert rendered.headers["x-next-cursor"] == "abc"
+    assert SparseFields(UserOut)().render(response, [test_user]) == [test_user]
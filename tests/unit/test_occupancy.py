@@ -0,0 +1,55 @@
+import pytest
+
+from src.models import Building, CurrentPresence, Floor, Room, User
+from src.services.occupancy import OccupancyTracker
+
+
+@pytest.fixture()
+async def layout(db_session):
+    building = Building(name="Main", description="", address="Street 1")
+    floors = [Floor(floor_number=number, building=building) for number in (1, 2)]
+    rooms = [Room(name="Lab", floor=floors[0]), Room(name="Hall", floor=floors[0]), Room(name="Office", floor=floors[1])]
+    users = [User(first="User", last=str(i), email=f"user{i}@example.com", password_hash="x") for i in range(3)]
+    db_session.add_all([building, *floors, *rooms, *users])
+    await db_session.flush()
+    db_session.add_all([
+        CurrentPresence(user_id=users[0].id, room_id=rooms[0].id),
+        CurrentPresence(user_id=users[1].id, room_id=rooms[2].id),
+    ])
+    await db_session.commit()
+    return building, floors, rooms, users
+
+
+@pytest.mark.asyncio
+async def test_occupancy_seed_and_moves(db_session, layout):
+    building, floors, rooms, users = layout
+    tracker = OccupancyTracker()
+    await tracker.ensure_loaded(db_session)
+
+    assert tracker.room(rooms[0].id) == 1
+    assert tracker.floor(floors[0].id) == 1
+    assert tracker.floor(floors[1].id) == 1
+    assert tracker.building(building.id) == 2
+
+    tracker.move(users[0].id, rooms[2].id)
+    tracker.move(users[2].id, rooms[1].id)
+    assert tracker.snapshot() == {
+        "rooms": {rooms[1].id: 1, rooms[2].id: 2},
+        "floors": {floors[0].id: 1, floors[1].id: 2},
+        "buildings": {building.id: 3},
+    }
+
+    tracker.leave(users[2].id, rooms[0].id)
+    assert tracker.building(building.id) == 3
+    tracker.leave(users[2].id, rooms[1].id)
+    assert tracker.building(building.id) == 2
+
+
+@pytest.mark.asyncio
+async def test_occupancy_unknown_room_forces_reload(db_session, layout):
+    _, _, _, users = layout
+    tracker = OccupancyTracker()
+    await tracker.ensure_loaded(db_session)
+
+    tracker.move(users[2].id, 999)
+    assert not tracker.is_loaded
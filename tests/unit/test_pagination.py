@@ -0,0 +1,125 @@
+import inspect
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy.dialects import mysql
+
+from src.api.dependencies import CursorPagination, KeysetPagination, PageSize
+from src.constants import Action
+from src.crud.access_log import SORT_KEY as ACCESS_LOG_SORT_KEY
+from src.crud.pagination import _top_n
+from src.core.config import settings
+from src.exceptions.exceptions import InvalidCursorException
+from src.models import AccessLog, Building, User
+from src.schemas.building import BuildingCreate
+from src.schemas.user import UserWithAccessLogs
+from src.utils.cursor import encode_cursor
+import src.crud.building as crud
+import src.crud.user as user_crud
+
+
+@pytest.fixture()
+async def buildings(db_session):
+    return [
+        await crud.create_building(db_session, BuildingCreate(
+            name=f"Building {i}", description="", address=f"Street {i}",
+        ))
+        for i in range(7)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_walk_every_row(db_session, buildings):
+    pagination = KeysetPagination(*crud.SORT_KEY)
+    seen = []
+    cursor = None
+    while True:
+        params = pagination(limit=3, cursor=cursor)
+        page = params.page(await crud.get_buildings(db_session, params.offset, params.limit, params.after))
+        seen.extend(building.id for building in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert seen == sorted(building.id for building in buildings)
+
+
+@pytest.mark.asyncio
+async def test_keyset_matches_offset(db_session, buildings):
+    first_page = await crud.get_buildings(db_session, limit=3)
+    by_offset = await crud.get_buildings(db_session, offset=3, limit=3)
+    by_keyset = await crud.get_buildings(db_session, offset=100, limit=3, after=(first_page[-1].id,))
+    assert [b.id for b in by_offset] == [b.id for b in by_keyset]
+
+
+def test_cursor_is_decoded_to_sort_key_types():
+    params = KeysetPagination(AccessLog.timestamp, AccessLog.id)(
+        cursor=encode_cursor("2026-10-17T10:00:00+00:00", 5),
+    )
+    timestamp, access_log_id = params.after
+    assert timestamp.hour == 10
+    assert access_log_id == 5
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor", encode_cursor("x"), encode_cursor(1, 2)])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorException):
+        KeysetPagination(Building.id)(cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_nested_access_logs_are_limited_per_parent(db_session, test_user):
+    other = User(first="Other", last="User", email="other@example.com", password_hash="hashed-x")
+    db_session.add(other)
+    await db_session.flush()
+    start = datetime(2025, 7, 15, 8, 0)
+    db_session.add_all([
+        AccessLog(user_id=user_id, room_id=1, action=Action.enter, timestamp=start + timedelta(minutes=i))
+        for user_id in (test_user.id, other.id)
+        for i in range(5)
+    ] + [AccessLog(user_id=other.id, room_id=1, action=Action.exit, timestamp=start)])
+    await db_session.commit()
+    db_session.expunge_all()
+
+    users = await user_crud.get_users_with_access_logs(db_session, access_logs_limit=3)
+
+    for user in users:
+        assert [log.timestamp for log in user.access_logs] == [start + timedelta(minutes=i) for i in (4, 3, 2)]
+        assert {log.user_id for log in user.access_logs} == {user.id}
+    assert not db_session.dirty
+
+
+def test_nested_next_url():
+    logs = [
+        {"id": i, "user_id": 1, "room_id": 1, "action": Action.enter, "access_allowed": True,
+         "timestamp": datetime(2025, 7, 15, 8, i)}
+        for i in (2, 1)
+    ]
+    values = {"id": 1, "first": "John", "last": "Doe", "email": "john@example.com", "access_logs": logs}
+    user = UserWithAccessLogs.model_validate(values, context={"access_logs_limit": 2})
+    assert user.access_logs_next == f"/api/user/1/access-logs?cursor={encode_cursor(logs[-1]['timestamp'], 1)}"
+    assert UserWithAccessLogs.model_validate(values, context={"access_logs_limit": 3}).access_logs_next is None
+    # FastAPI validates the returned model again, without the context.
+    assert UserWithAccessLogs.model_validate(user.model_dump()).access_logs_next == user.access_logs_next
+
+
+def test_top_n_reads_at_most_limit_rows_per_parent_on_mysql():
+    stmt = _top_n("mysql", User.access_logs, ACCESS_LOG_SORT_KEY, 3, True, {1, 2})
+    sql = str(stmt.compile(dialect=mysql.dialect()))
+    assert "JOIN LATERAL" in sql
+    assert "LIMIT" in sql
+    assert "row_number" not in sql
+
+
+def test_nested_access_log_routes_have_no_offset():
+    params = KeysetPagination(Building.id)(offset=5, limit=3)
+    assert params.offset == 5
+    assert CursorPagination(Building.id)(limit=3).offset == 0
+    assert "offset" not in inspect.signature(CursorPagination(Building.id)).parameters
+
+
+def test_page_size_is_capped():
+    page_size = TypeAdapter(PageSize)
+    assert page_size.validate_python(3) == 3
+    assert page_size.validate_python(settings.pagination.max_page_size + 1) == settings.pagination.max_page_size
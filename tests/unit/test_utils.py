@@ -1,6 +1,8 @@
 import pytest
 
+from src.utils.cache import TTLCache
 from src.utils.case_converter import camel_case_to_snake_case
+from src.utils.cursor import decode_cursor, encode_cursor
 
 
 @pytest.mark.parametrize("input_str, expected", [
@@ -20,4 +22,33 @@ from src.utils.case_converter import camel_case_to_snake_case
     ("camelCaseToSnakeCase", "camel_case_to_snake_case"),
 ])
 def test_camel_case_to_snake_case(input_str, expected):
-    assert camel_case_to_snake_case(input_str) == expected
\ No newline at end of file
+    assert camel_case_to_snake_case(input_str) == expected
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("2025-07-15T08:00:00", 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ["2025-07-15T08:00:00", 42]
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", "eyJhIjoxfQ"])
+def test_decode_malformed_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_ttl_cache_expiry_and_lru():
+    now = [100.0]
+    cache = TTLCache(maxsize=2, clock=lambda: now[0])
+    cache.set("a", 1, expires_at=110)
+    cache.set("b", 2, expires_at=200)
+    cache.set("expired", 3, expires_at=100)
+
+    assert cache.get("a") == 1
+    cache.set("c", 3, expires_at=200)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    now[0] = 110
+    assert cache.get("a") is None
+    assert cache.stats() == {"size": 1, "maxsize": 2, "hits": 2, "misses": 2}
+